@@ -1,39 +1,7 @@
 import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib import rc
-
-# Set font to display Korean characters properly
-rc("font", family="Malgun Gothic")  # For Windows, replace with "AppleGothic" for macOS or "NanumGothic" for Linux
-plt.rcParams['axes.unicode_minus'] = False  # Prevent minus sign issues
-
-# Load the CSV file
-quarterly_avg = pd.read_csv('region_quarterly_avg.csv', encoding="utf-8-sig")
-
-# Visualization function
-def plot_pollutant_data_by_city(data, pollutant, y_limit=None):
-    for city in data["지역"].unique():
-        city_data = data[data["지역"] == city]
-        if pollutant == "PM2.5(μg/m³)":
-            city_data = city_data[city_data["Year"] >= 2015]
-        plt.figure(figsize=(12, 6))
-        plt.plot(
-            city_data["Year"].astype(str) + "Q" + city_data["Quarter"].astype(str),
-            city_data[pollutant].interpolate(method='linear'),  # Interpolate missing values
-            marker="o",
-            label=city
-        )
-        plt.title(f"{pollutant} Quarterly Averages - {city}")
-        plt.xlabel("Year-Quarter")
-        plt.ylabel(pollutant)
-        # Set all quarter labels but only show Q1 as text
-        x_labels = city_data["Year"].astype(str) + "Q" + city_data["Quarter"].astype(str)
-        x_text_labels = [f"{year}Q1" if quarter == 1 else "" for year, quarter in zip(city_data["Year"], city_data["Quarter"])]
-        plt.xticks(x_labels, labels=x_text_labels, rotation=45)
-        if y_limit:
-            plt.ylim(0, y_limit)  # Use a fixed y_limit for consistent scale
-        plt.legend(loc="best")
-        plt.tight_layout()
-        plt.show()
+import _paths  # noqa: F401  (csv_cache, figure_batch, weather_index 경로)
+from figure_batch import show_or_render
+from weather_index import RegionTimeIndex
 
 # Set consistent y-axis limit for all pollutants
 y_limit = {
@@ -45,8 +13,37 @@ y_limit = {
     "일산화질소(ppm)": 1
 }
 
-# Visualize each pollutant for each city
-for pollutant in y_limit.keys():
-    plot_pollutant_data_by_city(quarterly_avg, pollutant, y_limit.get(pollutant))
 
-print("Pollutants visualized by city.")
+# Build one figure job per (pollutant, city)
+def pollutant_jobs_by_city(index, pollutant, y_limit=None):
+    jobs = []
+    for city, city_data in index.items():
+        if pollutant == "PM2.5(μg/m³)":
+            city_data = index.slice(city, start=2015)  # PM2.5 from 2015 onwards
+        jobs.append({
+            "name": f"air_quarterly/{pollutant.replace('/', '_')}_{city}",
+            "lines": [{
+                "x": list(city_data["Year"].astype(str) + "Q" + city_data["Quarter"].astype(str)),
+                "y": [float(v) for v in city_data[pollutant].interpolate(method='linear')],  # Interpolate missing values
+                "label": city,
+            }],
+            "title": f"{pollutant} Quarterly Averages - {city}", "xlabel": "Year-Quarter", "ylabel": pollutant,
+            "title_size": "large", "label_size": "medium", "grid": False,
+            "xticks": "q1",  # Set all quarter labels but only show Q1 as text
+            "ylim": (0, y_limit) if y_limit else None,  # Use a fixed y_limit for consistent scale
+            "legend": {"loc": "best"},
+        })
+    return jobs
+
+
+def figure_jobs(file_path='region_quarterly_avg.csv'):
+    # Load the CSV file
+    quarterly_avg = pd.read_csv(file_path, encoding="utf-8-sig")
+    quarterly_avg = RegionTimeIndex(quarterly_avg, "지역", "Year")  # Sorted by (city, year) with per-city row offsets
+    return [job for pollutant in y_limit for job in pollutant_jobs_by_city(quarterly_avg, pollutant, y_limit.get(pollutant))]
+
+
+if __name__ == "__main__":
+    # Visualize each pollutant for each city (--batch: save to ./figures/air_quarterly without windows)
+    show_or_render(figure_jobs(), './figures')
+    print("Pollutants visualized by city.")
@@ -1,38 +1,7 @@
 import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib import rc
-
-# Set font to display Korean characters properly
-rc("font", family="Malgun Gothic")  # For Windows, replace with "AppleGothic" for macOS or "NanumGothic" for Linux
-plt.rcParams['axes.unicode_minus'] = False  # Prevent minus sign issues
-
-# Load the CSV file
-annual_avg = pd.read_csv('region_yearly_avg.csv', encoding="utf-8-sig")
-
-# Visualization function
-def plot_annual_pollutant_data_by_city(data, pollutant, y_limit=None):
-    for city in data["지역"].unique():
-        city_data = data[data["지역"] == city]
-        city_data = city_data[city_data["Year"] < 2024]  # Exclude 2024 data
-        if pollutant == "PM2.5(μg/m³)":
-            city_data = city_data[city_data["Year"] >= 2015]
-        plt.figure(figsize=(12, 6))
-        plt.plot(
-            city_data["Year"].astype(str),
-            city_data[pollutant].interpolate(method='linear'),  # Interpolate missing values
-            marker="o",
-            label=city
-        )
-        plt.title(f"{pollutant} Annual Averages - {city}")
-        plt.xlabel("Year")
-        plt.ylabel(pollutant)
-        plt.xticks(city_data["Year"].astype(str), rotation=45)
-        if y_limit:
-            max_value = city_data[pollutant].max() * 1.2 if not city_data[pollutant].max() < y_limit else y_limit
-            plt.ylim(0, max(max_value, y_limit))  # Ensure y_limit accommodates data
-        plt.legend(loc="best")
-        plt.tight_layout()
-        plt.show()
+import _paths  # noqa: F401  (csv_cache, figure_batch, weather_index 경로)
+from figure_batch import show_or_render
+from weather_index import RegionTimeIndex
 
 # Set consistent y-axis limit for all pollutants
 y_limit = {
@@ -44,8 +13,40 @@ y_limit = {
     "일산화질소(ppm)": 1
 }
 
-# Visualize each pollutant for each city
-for pollutant in y_limit.keys():
-    plot_annual_pollutant_data_by_city(annual_avg, pollutant, y_limit.get(pollutant))
 
-print("Annual pollutants visualized by city.")
+# Build one figure job per (pollutant, city)
+def annual_pollutant_jobs_by_city(index, pollutant, y_limit=None):
+    jobs = []
+    for city in index.regions:
+        # Exclude 2024 data; PM2.5 from 2015 onwards
+        city_data = index.slice(city, start=2015 if pollutant == "PM2.5(μg/m³)" else None, end=2023)
+        ylim = None
+        if y_limit:
+            max_value = city_data[pollutant].max() * 1.2 if not city_data[pollutant].max() < y_limit else y_limit
+            ylim = (0, float(max(max_value, y_limit)))  # Ensure y_limit accommodates data
+        jobs.append({
+            "name": f"air_yearly/{pollutant.replace('/', '_')}_{city}",
+            "lines": [{
+                "x": list(city_data["Year"].astype(str)),
+                "y": [float(v) for v in city_data[pollutant].interpolate(method='linear')],  # Interpolate missing values
+                "label": city,
+            }],
+            "title": f"{pollutant} Annual Averages - {city}", "xlabel": "Year", "ylabel": pollutant,
+            "title_size": "large", "label_size": "medium", "grid": False,
+            "ylim": ylim,
+            "legend": {"loc": "best"},
+        })
+    return jobs
+
+
+def figure_jobs(file_path='region_yearly_avg.csv'):
+    # Load the CSV file
+    annual_avg = pd.read_csv(file_path, encoding="utf-8-sig")
+    annual_avg = RegionTimeIndex(annual_avg, "지역", "Year")  # Sorted by (city, year) with per-city row offsets
+    return [job for pollutant in y_limit for job in annual_pollutant_jobs_by_city(annual_avg, pollutant, y_limit.get(pollutant))]
+
+
+if __name__ == "__main__":
+    # Visualize each pollutant for each city (--batch: save to ./figures/air_yearly without windows)
+    show_or_render(figure_jobs(), './figures')
+    print("Annual pollutants visualized by city.")
@@ -0,0 +1,172 @@
+###############################################################################
+# 월별 도시별 대기오염도 -> 일별 값 (질량 보존 스플라인, 모든 도시 × 오염물질을 한 번에)
+###############################################################################
+# 모델 표(model/Processed_COVID_Data_Filled.csv)는 SO2/CO/O3/NO2/PM10/PM25가 일별인데,
+# air/ 원자료는 도시별 월평균이라 일별로 맞추는 작업을 코드 밖에서 했다.
+# 여기서는 월평균을 일별 값으로 나눈다.
+#   - 누적량 F(x) (첫 달 시작부터 x일까지의 합)를 달 경계에서 정확히 지나는 자연 3차 스플라인으로 잇고
+#   - d일 값 = F(d + 1) − F(d)  ->  한 달의 일별 값 평균은 그 달의 월평균과 정확히 같다 (질량 보존)
+#   - 스플라인 2차 도함수 M은 삼중대각 SPD 계  h[i−1]·M[i−1] + 2(h[i−1] + h[i])·M[i] + h[i]·M[i+1] = 6(m[i] − m[i−1])
+#     (h = 달의 일수, m = 월평균) 이라 행렬은 달력(달 길이 순서)에만 의존한다
+#     -> 달력마다 띠 행렬 Cholesky 분해와 일별 계수를 한 번만 만들어 캐시하고,
+#        모든 도시 × 오염물질 계열은 오른쪽 변의 열로 한 번에 푼다
+#   - d일 값 = m[i] + cA[d]·M[i] + cB[d]·M[i+1]   (cA, cB도 달력에만 의존)
+# 월평균이 급하게 바뀌는 곳이나 계열 끝에서는 스플라인 일별 값이 0 아래로 내려갈 수 있다.
+#   그런 달만 음수를 0으로 자르고 그 달의 값 전체에 (월평균 × 일수) / (자른 뒤 합계)를 곱해
+#   월평균을 그대로 지킨다 (질량 보존, 모든 값 ≥ 0). 음수가 없는 달은 스플라인 값 그대로.
+# 월평균이 빈 달은 앞뒤 달로 선형 보간(양 끝은 가까운 값)해서 풀고, 그 달의 일별 값은 다시 NaN으로 둔다.
+import numpy as np
+import pandas as pd
+from scipy.linalg import cholesky_banded, cho_solve_banded
+
+from air_ingest import build_air_table, POLLUTANTS
+
+
+# 대기 열 -> 모델 표(Processed_COVID_Data_Filled.csv) 열 이름
+MODEL_COLUMNS = {
+    POLLUTANTS['아황산가스']: 'SO2',
+    POLLUTANTS['일산화탄소']: 'CO',
+    POLLUTANTS['오존']: 'O3',
+    POLLUTANTS['이산화질소']: 'NO2',
+    POLLUTANTS['PM10']: 'PM10',
+    POLLUTANTS['PM2.5']: 'PM25',
+}
+
+_CALENDAR_CACHE = {}  # 달 길이 tuple -> (Cholesky 띠 분해, 일별 달 번호, cA, cB)
+
+
+def month_range(first, last):
+    """YYYYMM 첫 달 ~ 마지막 달 (빠진 달 없이)"""
+    periods = pd.period_range(pd.Period(year=first // 100, month=first % 100, freq='M'),
+                              pd.Period(year=last // 100, month=last % 100, freq='M'), freq='M')
+    return (periods.year * 100 + periods.month).to_numpy()
+
+
+def _calendar(lengths):
+    """
+    Cached factorization and day coefficients for one calendar (sequence of month lengths).
+
+    Returns:
+        tuple: (banded Cholesky factor or None, month index per day, cA, cB).
+    """
+    if lengths in _CALENDAR_CACHE:
+        return _CALENDAR_CACHE[lengths]
+
+    h = np.asarray(lengths, dtype=float)
+    factor = None
+    if len(h) > 1:
+        # 내부 매듭 1..K-1의 삼중대각 행렬 (위쪽 띠 형식: 0행 = 위 대각, 1행 = 대각)
+        band = np.zeros((2, len(h) - 1))
+        band[1] = 2.0 * (h[:-1] + h[1:])
+        band[0, 1:] = h[1:-1]
+        factor = cholesky_banded(band, lower=False)
+
+    month = np.repeat(np.arange(len(h)), lengths)
+    hd = h[month]
+    a = np.arange(len(month)) - np.repeat(np.concatenate([[0], np.cumsum(lengths)[:-1]]), lengths)
+    b = a + 1.0
+    c_a = ((hd - b) ** 3 - (hd - a) ** 3) / (6.0 * hd) + hd / 6.0
+    c_b = (b ** 3 - a ** 3) / (6.0 * hd) - hd / 6.0
+    _CALENDAR_CACHE[lengths] = (factor, month, c_a, c_b)
+    return _CALENDAR_CACHE[lengths]
+
+
+def _clip_redistribute(daily, monthly, lengths):
+    """음수가 있는 달만 0으로 자르고 그 달 값을 비례 축소해 월 합계를 맞춘다 (daily를 바로 고침)"""
+    starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    negative = np.add.reduceat(daily < 0, starts, axis=0) > 0  # [달, 계열]
+    if not negative.any():
+        return
+    clipped = np.maximum(daily, 0.0)
+    target = monthly * np.asarray(lengths, dtype=float)[:, None]
+    total = np.add.reduceat(clipped, starts, axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        scale = np.where(total > 0, target / total, 0.0)
+    month = np.repeat(np.arange(len(lengths)), lengths)
+    fix = negative[month]
+    daily[fix] = (clipped * scale[month])[fix]
+
+
+def disaggregate(monthly, months):
+    """
+    Monthly means -> daily values for many series in one batched solve.
+
+    Parameters:
+        monthly (array-like): [months, series] monthly means (NaN = missing month).
+        months (array-like): Consecutive YYYYMM values for the rows of monthly.
+
+    Returns:
+        tuple: (daily [days, series] ndarray, DatetimeIndex of the days).
+            Each month's daily values average exactly to its monthly mean and are never negative
+            (for non-negative means).
+    """
+    months = np.asarray(months, dtype=np.int64)
+    if not np.array_equal(months, month_range(months[0], months[-1])):
+        raise ValueError("months는 빠진 달 없이 연속이어야 합니다 (month_range 참고)")
+    monthly = np.asarray(monthly, dtype=float).reshape(len(months), -1)
+
+    missing = np.isnan(monthly)
+    filled = pd.DataFrame(monthly).interpolate(limit_direction='both').fillna(0.0).to_numpy()
+
+    days = pd.date_range(f'{months[0] // 100}-{months[0] % 100:02d}-01',
+                         f'{months[-1] // 100}-{months[-1] % 100:02d}-01', freq='MS')
+    lengths = tuple(int(n) for n in days.days_in_month)
+    factor, month, c_a, c_b = _calendar(lengths)
+
+    M = np.zeros((len(months) + 1, filled.shape[1]))  # 자연 스플라인: 양 끝 M = 0
+    if factor is not None:
+        M[1:-1] = cho_solve_banded((factor, False), 6.0 * np.diff(filled, axis=0))
+    daily = filled[month] + c_a[:, None] * M[month] + c_b[:, None] * M[month + 1]
+    _clip_redistribute(daily, filled, lengths)
+    daily[missing[month]] = np.nan
+
+    index = pd.date_range(days[0], periods=len(month), freq='D')
+    return daily, index
+
+
+def daily_table(air=None, pollutants=None, regions=None, model_columns=False):
+    """
+    Daily values for every region x pollutant of the monthly air table.
+
+    Parameters:
+        air (DataFrame | None): 관측시간 (YYYYMM), 지역, pollutant columns (None = air_ingest.build_air_table()).
+        pollutants (list | None): Pollutant columns (None = all of POLLUTANTS).
+        regions (list | None): Regions to keep (None = all).
+        model_columns (bool): Rename to the model table names (SO2, CO, O3, NO2, PM10, PM25).
+
+    Returns:
+        DataFrame: Date (YYYY-MM-DD), 지역, pollutant columns.
+    """
+    air = build_air_table() if air is None else air
+    pollutants = list(POLLUTANTS.values()) if pollutants is None else list(pollutants)
+    if regions is not None:
+        air = air[air['지역'].isin(regions)]
+
+    # [달, 지역 × 오염물질] 행렬 (빠진 달은 NaN 행)
+    wide = air.pivot_table(index='관측시간', columns='지역', values=pollutants, aggfunc='mean', dropna=False)
+    months = month_range(int(wide.index.min()), int(wide.index.max()))
+    wide = wide.reindex(months)
+
+    daily, days = disaggregate(wide.to_numpy(), months)
+    region_names = wide.columns.get_level_values('지역')
+    names = list(dict.fromkeys(region_names))
+
+    n_days = len(days)
+    result = pd.DataFrame({
+        'Date': np.tile(days.strftime('%Y-%m-%d'), len(names)),
+        '지역': np.repeat(names, n_days),
+    })
+    for pollutant in pollutants:
+        cols = [wide.columns.get_loc((pollutant, name)) for name in names]
+        result[pollutant] = daily[:, cols].T.ravel()
+    if model_columns:
+        result = result.rename(columns=MODEL_COLUMNS)
+    return result
+
+
+if __name__ == "__main__":
+    # aircalculate.py의 분석 도시 -> 일별 대기오염도 (모델 표 열 이름)
+    target_cities = ["서울", "부산", "대구", "인천", "광주", "대전", "울산", "수원", "강릉"]
+    daily = daily_table(regions=target_cities, model_columns=True)
+    daily.to_csv('./city_daily_air.csv', index=False, encoding='utf-8-sig')
+    print(f"'city_daily_air.csv' 저장 완료 ({len(daily)}행)")
@@ -0,0 +1,205 @@
+###############################################################################
+# 월별 도시별 대기오염도 원본(엑셀) -> 긴 형식 표 (관측시간, 지역, 오염물질...) + 캐시
+###############################################################################
+# aircalculate.py는 손으로 합친 1224air.csv를 읽었다.
+# 원본은 1224air/*.xlsx 6개와 *월별+도시별+대기오염도*.csv 6개(이름만 .csv이고 내용은 엑셀)로,
+# 모두 행 = 도시, 열 = 월('2012년 1월')인 넓은 표다.
+#   - 파일마다 프로세스 풀에서 따로 읽어 (도시 × 월) 행렬을 긴 형식으로 펼치고
+#   - 오염물질 열끼리 (관측시간, 지역)으로 외부 조인한다.
+#   - 같은 오염물질이 두 파일에 있으면 1224air/ 쪽 값을 먼저 쓰고 빈 칸만 다른 파일로 채운다.
+#   - 결과는 1224air.parquet에 저장하고, 원본 파일들의 SHA-256을 메타데이터로 남겨
+#     원본이 그대로면 다음부터는 엑셀을 열지 않고 바로 읽는다.
+# 지역 이름은 1224air.csv와 같게: 특별시/광역시는 '서울', '부산'처럼 줄이고, 나머지는 도시 이름 그대로
+# (이름이 겹치는 시군은 '광주(경기도)', '고성(강원도)'처럼 시도를 붙이고, 도 평균 행은 '경기도 평균'처럼 표기)
+# '37*', '0.004**'처럼 별표가 붙은 값은 자료 획득률이 낮은 달이다.
+#   기본값은 1224air.csv(pd.to_numeric(errors='coerce'))와 같이 결측으로 두고,
+#   keep_low_coverage=True면 값을 살리고 '<오염물질>|저획득' 열(bool)로 표시한다 (air_rollup에서 걸러낼 수 있음).
+import os
+import re
+import glob
+import json
+import hashlib
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import _paths  # noqa: F401  (csv_cache, figure_batch, weather_index 경로)
+from csv_cache import load_csv
+
+
+AIR_DIR = os.path.dirname(os.path.abspath(__file__))
+WORKBOOK_PATTERNS = [os.path.join('1224air', '*.xlsx'), '*월별+도시별+대기오염도*.csv']
+CACHE_FILE = '1224air.parquet'
+
+# 파일 이름에 들어 있는 오염물질 -> 열 이름 (1224air.csv와 같은 이름/순서)
+# 일산화탄소(CO)는 기존 1224air.csv에서 '일산화질소(ppm)' 열로 써 왔으므로 그 이름을 유지한다.
+POLLUTANTS = {
+    'PM2.5': 'PM2.5(μg/m³)',
+    'PM10': 'PM10(μg/m³)',
+    '아황산가스': '아황산가스(ppm)',
+    '오존': '오존(ppm)',
+    '이산화질소': '이산화질소(ppm)',
+    '일산화탄소': '일산화질소(ppm)',
+}
+METRO_SUFFIX = re.compile(r'(특별시|광역시|특별자치시)$')
+LOW_COVERAGE_SUFFIX = '|저획득'  # 자료 획득률이 낮은 달(별표 값) 표시 열: <오염물질>|저획득
+
+
+def file_hash(path, block_bytes=1 << 20):
+    """파일 내용의 SHA-256"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_bytes), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def pollutant_of(path):
+    """파일 이름 -> 오염물질 열 이름 (PM2.5를 PM10보다 먼저 확인)"""
+    name = os.path.basename(path)
+    for key, column in POLLUTANTS.items():
+        if key in name:
+            return column
+    raise ValueError(f"{name}: 파일 이름에서 오염물질을 알 수 없습니다")
+
+
+def _region_names(province, city):
+    """(시도, 도시) 열 -> 1224air.csv 지역 이름"""
+    province = province.astype(str).str.strip()
+    city = city.astype(str).str.strip()
+    metro = province == city
+    names = pd.Series(np.where(metro, province.str.replace(METRO_SUFFIX, '', regex=True), city), index=city.index)
+    names[city == '도평균'] = province + ' 평균'
+    # 특별시/광역시 이름과 겹치거나(광주) 여러 도에 있는(고성) 시군
+    clash = ~metro & (names.isin(names[metro]) | names.duplicated(keep=False))
+    names[clash] = city + '(' + province + ')'
+    return names.to_numpy()
+
+
+def read_workbook(path, keep_low_coverage=False):
+    """
+    Parse one wide month x city workbook into long rows.
+
+    Parameters:
+        path (str): .xlsx (or Excel content saved as .csv, or a real wide CSV with the same layout).
+        keep_low_coverage (bool): Keep starred (low data coverage) values and flag them in a
+                                  '<pollutant>|저획득' column; by default they are NaN.
+
+    Returns:
+        DataFrame: 관측시간 (YYYYMM int), 지역, <pollutant> (float)[, <pollutant>|저획득 (bool)].
+    """
+    with open(path, 'rb') as f:
+        is_excel = f.read(2) == b'PK'  # xlsx는 zip 파일
+    if is_excel:
+        raw = pd.read_excel(path, header=None, engine='openpyxl')
+    else:
+        raw = load_csv(path, use_cache=False, header=None)
+
+    # 0행: 'YYYY년 M월' 열 머리글, 1~3행: 월평균/단위/원자료, 마지막 행: 주석
+    months = raw.iloc[0, 3:].astype(str).str.extract(r'(\d{4})년\s*(\d{1,2})월')
+    month_cols = months.dropna().index
+    periods = (months.loc[month_cols, 0].astype(int) * 100 + months.loc[month_cols, 1].astype(int)).to_numpy()
+
+    body = raw.iloc[4:]
+    body = body[pd.to_numeric(body[0], errors='coerce').notna()]  # 번호가 있는 행만 (주석 행 제외)
+    regions = _region_names(body[1], body[2])
+    # '57*', '57**'는 자료 획득률이 낮은 달의 표시, '-'나 빈 칸은 결측
+    text = body[month_cols].astype(str).apply(lambda c: c.str.strip())
+    values = text.apply(lambda c: pd.to_numeric(c.str.rstrip('*'), errors='coerce')).to_numpy(dtype=float, copy=True)
+    starred = text.apply(lambda c: c.str.endswith('*')).to_numpy(dtype=bool) & ~np.isnan(values)
+    if not keep_low_coverage:
+        values[starred] = np.nan
+
+    column = pollutant_of(path)
+    frame = pd.DataFrame({
+        '관측시간': np.tile(periods, len(regions)),
+        '지역': np.repeat(regions, len(periods)),
+        column: values.ravel(),
+    })
+    if keep_low_coverage:
+        frame[column + LOW_COVERAGE_SUFFIX] = starred.ravel()
+    return frame
+
+
+def _join(frames):
+    """오염물질별 긴 표를 (관측시간, 지역)으로 외부 조인 (같은 오염물질은 앞 파일 값 우선)"""
+    merged = {}
+    for frame in frames:
+        column = frame.columns[2]
+        frame = frame.set_index(['관측시간', '지역'])
+        if column not in merged:
+            merged[column] = frame
+            continue
+        combined = merged[column].combine_first(frame)
+        if column + LOW_COVERAGE_SUFFIX in combined.columns:  # 표시는 값을 가져온 파일의 것
+            taken = merged[column][column].reindex(combined.index).isna()
+            flag = column + LOW_COVERAGE_SUFFIX
+            combined.loc[taken, flag] = frame[flag].reindex(combined.index)[taken]
+        merged[column] = combined
+    table = pd.concat([merged[c] for c in POLLUTANTS.values() if c in merged], axis=1, join='outer')
+    flags = [c for c in table.columns if c.endswith(LOW_COVERAGE_SUFFIX)]
+    table = table[[c for c in table.columns if c not in flags] + flags]  # 표시 열은 오염물질 열 뒤에
+    table[flags] = table[flags].fillna(False).astype(bool)
+    table = table.reset_index().sort_values(['지역', '관측시간'], kind='stable').reset_index(drop=True)
+    table['관측시간'] = table['관측시간'].astype(np.int32)
+    return table
+
+
+def workbook_paths(air_dir=AIR_DIR):
+    """원본 파일 목록 (1224air/ 먼저)"""
+    return [p for pattern in WORKBOOK_PATTERNS for p in sorted(glob.glob(os.path.join(air_dir, pattern)))]
+
+
+def build_air_table(air_dir=AIR_DIR, cache_file=CACHE_FILE, rebuild=False, workers=None,
+                    keep_low_coverage=False):
+    """
+    Long air table from all workbooks, cached in <air_dir>/1224air.parquet keyed by workbook hashes.
+
+    Parameters:
+        air_dir (str): Folder holding 1224air/ and the *.csv exports.
+        cache_file (str): Cache file name inside air_dir.
+        rebuild (bool): Ignore the cache.
+        workers (int | None): Process pool size (None = CPU count, 1 = no pool).
+        keep_low_coverage (bool): Keep starred (low data coverage) months and add '<pollutant>|저획득'
+                                  flag columns; by default they are NaN, as in 1224air.csv.
+
+    Returns:
+        DataFrame: 관측시간, 지역, PM2.5(μg/m³), PM10(μg/m³), 아황산가스(ppm), 오존(ppm), 이산화질소(ppm), 일산화질소(ppm)
+                   (+ the flag columns when keep_low_coverage).
+    """
+    paths = workbook_paths(air_dir)
+    if not paths:
+        raise FileNotFoundError(f"{air_dir}에 대기오염도 원본 파일이 없습니다")
+    signature = json.dumps({'workbooks': {os.path.relpath(p, air_dir): file_hash(p) for p in paths},
+                            'keep_low_coverage': bool(keep_low_coverage)}, sort_keys=True, ensure_ascii=False)
+    cache_path = os.path.join(air_dir, cache_file)
+    if not rebuild and os.path.exists(cache_path):
+        meta = pq.read_schema(cache_path).metadata or {}
+        if meta.get(b'air_ingest.workbooks', b'').decode('utf-8') == signature:
+            return pd.read_parquet(cache_path)
+
+    workers = workers or os.cpu_count() or 1
+    read = partial(read_workbook, keep_low_coverage=keep_low_coverage)
+    if workers == 1 or len(paths) == 1:
+        frames = [read(p) for p in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+            frames = list(pool.map(read, paths))  # 순서 유지 (1224air/ 값 우선)
+    table = _join(frames)
+
+    arrow = pa.Table.from_pandas(table, preserve_index=False)
+    meta = dict(arrow.schema.metadata or {})
+    meta[b'air_ingest.workbooks'] = signature.encode('utf-8')
+    pq.write_table(arrow.replace_schema_metadata(meta), cache_path + '.tmp')
+    os.replace(cache_path + '.tmp', cache_path)
+    print(f"[air_ingest] 원본 {len(paths)}개 -> {cache_file} ({len(table)}행)")
+    return table
+
+
+if __name__ == "__main__":
+    air = build_air_table()
+    print(air.head())
@@ -0,0 +1,136 @@
+###############################################################################
+# 대기오염 월 -> 분기 -> 연 집계 (합계/개수 부분 집계를 한 번 만들고 병합)
+###############################################################################
+# aircalculate.py는 원자료를 (지역, Year)와 (지역, Year, Quarter)로 두 번 묶고, 열마다 따로 반올림했다.
+# 여기서는
+#   - 원자료를 한 번만 훑어 (지역, 연, 분기, 월) 칸마다 오염물질별 (합계, 개수)를 만들고
+#   - 분기는 월 부분 집계를, 연은 분기 부분 집계를 더해서 만든다 (원자료를 다시 읽지 않음)
+#   - 평균 = 합계 / 개수 이므로 groupby().mean()과 같은 값 (결측은 개수에서 빠짐)
+#   - 오염물질별 반올림 자릿수와 측정 시작 연도(PM2.5는 2015년부터)는 ROLLUP_CONFIG 한 곳에서 정한다
+#   - build_air_table(keep_low_coverage=True)의 '<오염물질>|저획득' 열이 있으면 그 달 값은 기본적으로 빼고,
+#     'keep_low_coverage': True인 오염물질만 넣는다
+# 도시나 오염물질이 늘어도 부분 집계의 행/열만 늘고 훑는 횟수는 같다.
+# 새 달의 자료는 MonthlyPartials.from_rows(new).merge 로 기존 부분 집계에 더할 수 있다.
+import numpy as np
+import pandas as pd
+
+from air_ingest import LOW_COVERAGE_SUFFIX
+
+
+# 열 -> 반올림 자릿수, 시작 연도 (그 전 값은 집계에서 제외), keep_low_coverage (저획득 달 포함, 기본 False)
+ROLLUP_CONFIG = {
+    'PM2.5(μg/m³)': {'decimals': 1, 'start_year': 2015},
+    'PM10(μg/m³)': {'decimals': 1},
+    '아황산가스(ppm)': {'decimals': 4},
+    '오존(ppm)': {'decimals': 4},
+    '이산화질소(ppm)': {'decimals': 4},
+    '일산화질소(ppm)': {'decimals': 4},
+}
+
+# 집계 단계 -> 인덱스 수준 (월 -> 분기 -> 연)
+LEVELS = {
+    'month': ['지역', 'Year', 'Quarter', 'Month'],
+    'quarter': ['지역', 'Year', 'Quarter'],
+    'year': ['지역', 'Year'],
+}
+
+
+class MonthlyPartials:
+    """
+    Per-cell (sum, count) partials at monthly grain, merged upward into quarters and years.
+
+    partials = MonthlyPartials.from_rows(data)
+    yearly = partials.means('year')        # 지역, Year, pollutants (rounded per ROLLUP_CONFIG)
+    quarterly = partials.means('quarter')  # 지역, Year, Quarter, pollutants
+    """
+
+    def __init__(self, sums, counts, config=ROLLUP_CONFIG):
+        """
+        Parameters:
+            sums, counts (DataFrame): Monthly partials indexed by LEVELS['month'], one column per pollutant.
+            config (dict): Pollutant -> {'decimals': int, 'start_year': int (optional),
+                                         'keep_low_coverage': bool (optional)}.
+        """
+        self.config = config
+        self._levels = {'month': (sums, counts)}
+
+    @classmethod
+    def from_rows(cls, data, config=ROLLUP_CONFIG, region_col='지역', time_col='관측시간'):
+        """
+        Build monthly partials from raw rows in one grouping pass.
+
+        Parameters:
+            data (DataFrame): Rows with a region column, a YYYYMM time column and the pollutant columns
+                              (plus optional '<pollutant>|저획득' flag columns from build_air_table).
+            config (dict): See ROLLUP_CONFIG.
+
+        Returns:
+            MonthlyPartials
+        """
+        columns = list(config)
+        time = pd.to_numeric(data[time_col], errors='coerce').to_numpy()
+        keep = ~np.isnan(time)
+        time = time[keep].astype(np.int64)
+        year, month = time // 100, time % 100
+
+        values = data.loc[keep, columns].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float, copy=True)
+        for j, column in enumerate(columns):
+            start = config[column].get('start_year')
+            if start is not None:
+                values[year < start, j] = np.nan  # 측정 시작 전 값은 제외
+            flag = column + LOW_COVERAGE_SUFFIX
+            if flag in data.columns and not config[column].get('keep_low_coverage', False):
+                values[data.loc[keep, flag].to_numpy(dtype=bool), j] = np.nan  # 저획득 달은 제외
+        valid = ~np.isnan(values)
+
+        keys = pd.DataFrame({
+            '지역': data.loc[keep, region_col].to_numpy(),
+            'Year': year,
+            'Quarter': (month - 1) // 3 + 1,
+            'Month': month,
+        })
+        frame = pd.concat([
+            keys,
+            pd.DataFrame(np.where(valid, values, 0.0), columns=[f'{c}|sum' for c in columns]),
+            pd.DataFrame(valid.astype(np.int64), columns=[f'{c}|count' for c in columns]),
+        ], axis=1)
+        grouped = frame.groupby(LEVELS['month'], sort=True).sum()
+        sums = grouped[[f'{c}|sum' for c in columns]].set_axis(columns, axis=1)
+        counts = grouped[[f'{c}|count' for c in columns]].set_axis(columns, axis=1)
+        return cls(sums, counts, config)
+
+    def merge(self, other):
+        """다른 부분 집계(예: 새 달 자료)를 더한 새 MonthlyPartials"""
+        sums, counts = self.partials('month')
+        other_sums, other_counts = other.partials('month')
+        merged_sums = pd.concat([sums, other_sums]).groupby(level=LEVELS['month'], sort=True).sum()
+        merged_counts = pd.concat([counts, other_counts]).groupby(level=LEVELS['month'], sort=True).sum()
+        return MonthlyPartials(merged_sums, merged_counts, self.config)
+
+    def partials(self, level):
+        """
+        (sums, counts) at a level; quarters are merged from months and years from quarters (cached).
+
+        Parameters:
+            level (str): 'month', 'quarter' or 'year'.
+        """
+        if level not in self._levels:
+            lower = 'month' if level == 'quarter' else 'quarter'
+            sums, counts = self.partials(lower)
+            self._levels[level] = (sums.groupby(level=LEVELS[level], sort=True).sum(),
+                                   counts.groupby(level=LEVELS[level], sort=True).sum())
+        return self._levels[level]
+
+    def means(self, level):
+        """
+        Mean of each pollutant at a level, rounded per config.
+
+        Returns:
+            DataFrame: LEVELS[level] columns followed by the pollutant columns (NaN where no value).
+        """
+        sums, counts = self.partials(level)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = sums / counts.where(counts > 0)
+        # 더하는 순서(월 -> 분기 -> 연)에 따른 1e-15 수준 오차가 0.01375 같은 경계값의 반올림을 바꾸지 않도록
+        mean = mean.round(12).round({column: spec['decimals'] for column, spec in self.config.items()})
+        return mean.reset_index()
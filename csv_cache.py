@@ -0,0 +1,166 @@
+###############################################
+# 프로젝트 공용 CSV 로더 (인코딩 1회 감지 + 컬럼형 캐시)
+###############################################
+# - 바이트 샘플만 보고 인코딩을 한 번에 결정한다. (cp949 -> latin-1 -> cp1252 식으로
+#   실패할 때마다 파일 전체를 다시 읽던 try 체인을 대체)
+# - 한글 헤더를 정규화한다. (BOM 제거, 유니코드 NFC, 앞뒤/중복 공백 정리)
+# - 파싱 결과를 원본 옆에 Arrow(Feather) 파일로 저장하고, 원본이 그대로면
+#   다음부터는 CSV를 다시 파싱하지 않고 Arrow 파일에서 바로 읽는다.
+#     예) model/Processed_COVID_Data_Filled.csv -> model/Processed_COVID_Data_Filled.csv.feather
+#
+# 다른 폴더(model/, weather/, air/)의 스크립트에서는 그 폴더의 _paths.py로 저장소 루트를
+# sys.path에 추가한 뒤 사용한다.
+#   import _paths  # noqa: F401
+#   from csv_cache import load_csv
+import os
+import re
+import json
+import codecs
+import unicodedata
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow가 없으면 캐시 없이 CSV만 읽는다.
+    pa = None
+    feather = None
+
+
+CACHE_SUFFIX = '.feather'
+SAMPLE_BYTES = 1 << 16  # 인코딩 감지에 쓰는 앞부분 바이트 수 (64KB)
+
+# 감지 순서: BOM -> UTF-8 -> CP949(EUC-KR 상위 호환) -> latin-1(항상 성공)
+CANDIDATE_ENCODINGS = ['utf-8', 'cp949']
+
+
+def detect_encoding(path, sample_bytes=SAMPLE_BYTES):
+    """
+    파일 앞부분 바이트 샘플로 인코딩을 감지한다.
+    - UTF-8 BOM이 있으면 'utf-8-sig'
+    - 샘플이 UTF-8로 디코딩되면 'utf-8', CP949로 디코딩되면 'cp949'
+    - 둘 다 아니면 'latin-1' (모든 바이트가 유효하므로 실패하지 않음)
+    * 샘플 끝에서 멀티바이트 문자가 잘려도 오류가 나지 않도록 증분 디코더를 사용한다.
+    """
+    with open(path, 'rb') as f:
+        sample = f.read(sample_bytes)
+
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+
+    is_last = len(sample) < sample_bytes  # 파일 전체를 읽었으면 잘린 문자도 오류로 본다
+    for enc in CANDIDATE_ENCODINGS:
+        try:
+            codecs.getincrementaldecoder(enc)().decode(sample, final=is_last)
+            return enc
+        except UnicodeDecodeError:
+            continue
+    return 'latin-1'
+
+
+def normalize_header(name):
+    """
+    한글 컬럼명 정규화: BOM 제거, 유니코드 NFC(자모 분리 방지), 앞뒤 공백 제거, 연속 공백 1칸.
+    예) '﻿관측시각  (KST) ' -> '관측시각 (KST)'
+    """
+    if not isinstance(name, str):
+        return name
+    name = unicodedata.normalize('NFC', name.replace('\ufeff', ''))
+    return re.sub(r'\s+', ' ', name).strip()
+
+
+def _cache_path(path):
+    return path + CACHE_SUFFIX
+
+
+def _source_signature(path, read_kwargs):
+    """캐시 유효성 확인용: 원본 크기/수정시각 + read_csv 옵션"""
+    st = os.stat(path)
+    return json.dumps(
+        {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'kwargs': read_kwargs},
+        sort_keys=True, ensure_ascii=False, default=str
+    )
+
+
+def _read_cache(cache_path, signature):
+    """캐시 파일의 메타데이터가 현재 원본과 같으면 읽는다 (to_pandas()에서 한 번 복사). 아니면 None"""
+    if feather is None or not os.path.exists(cache_path):
+        return None
+    try:
+        table = feather.read_table(cache_path, memory_map=True)
+    except (OSError, pa.ArrowInvalid):
+        return None
+    meta = table.schema.metadata or {}
+    if meta.get(b'csv_cache.signature', b'').decode('utf-8') != signature:
+        return None
+    return table.to_pandas()
+
+
+def _write_cache(df, cache_path, signature, encoding):
+    """DataFrame을 비압축 Feather(Arrow IPC)로 저장 (비압축이면 읽을 때 압축 해제가 없다)"""
+    if feather is None:
+        return
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=not isinstance(df.index, pd.RangeIndex))
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        # 한 컬럼에 숫자/문자가 섞인 경우 등: 캐시는 건너뛰고 결과만 반환
+        print(f"[csv_cache] 캐시 저장 생략 ({os.path.basename(cache_path)}): {e}")
+        return
+    meta = dict(table.schema.metadata or {})
+    meta[b'csv_cache.signature'] = signature.encode('utf-8')
+    meta[b'csv_cache.encoding'] = encoding.encode('utf-8')
+    table = table.replace_schema_metadata(meta)
+
+    tmp_path = cache_path + '.tmp'
+    try:
+        feather.write_feather(table, tmp_path, compression='uncompressed')
+        os.replace(tmp_path, cache_path)
+    except OSError as e:  # 읽기 전용 폴더 등
+        print(f"[csv_cache] 캐시 저장 실패 ({cache_path}): {e}")
+
+
+def load_csv(path, encoding=None, use_cache=True, verbose=False, **read_kwargs):
+    """
+    CSV를 읽어 DataFrame으로 반환한다. (pd.read_csv 대체)
+    - path: CSV 경로
+    - encoding: 지정하지 않으면 detect_encoding으로 한 번만 감지한다.
+    - use_cache: True면 원본 옆의 '<파일명>.feather' 캐시를 사용/생성한다.
+      원본 크기·수정시각 또는 read_kwargs가 바뀌면 자동으로 다시 파싱한다.
+    - read_kwargs: parse_dates, index_col 등 pd.read_csv 옵션 그대로 전달
+    * 컬럼명은 normalize_header로 정규화된다. (index_col/parse_dates 이름도 정규화된 이름 기준)
+    """
+    cache_path = _cache_path(path)
+    signature = _source_signature(path, dict(read_kwargs, encoding=encoding)) if use_cache else None
+
+    if use_cache:
+        df = _read_cache(cache_path, signature)
+        if df is not None:
+            if verbose:
+                print(f"[csv_cache] {path} <- cache")
+            return df
+
+    if encoding is None:
+        encoding = detect_encoding(path)
+
+    # 헤더 정규화를 먼저 해야 parse_dates/index_col을 정규화된 이름으로 지정할 수 있으므로
+    # 이름 기반 옵션은 파싱 후에 적용한다.
+    parse_dates = read_kwargs.pop('parse_dates', None)
+    index_col = read_kwargs.pop('index_col', None)
+    df = pd.read_csv(path, encoding=encoding, **read_kwargs)
+    df.columns = [normalize_header(c) for c in df.columns]
+
+    if parse_dates and parse_dates is not True:
+        for col in parse_dates:
+            df[col] = pd.to_datetime(df[col])
+    if index_col is not None:
+        df = df.set_index(index_col)
+    if parse_dates is True:  # read_csv와 같이 True면 인덱스를 날짜로 변환
+        df.index = pd.to_datetime(df.index)
+
+    if verbose:
+        print(f"[csv_cache] {path} <- csv ({encoding})")
+
+    if use_cache:
+        _write_cache(df, cache_path, signature, encoding)
+    return df
@@ -0,0 +1,183 @@
+###############################################
+# 그래프 일괄 렌더링 (Agg 백엔드 + 프로세스 풀 + 데이터 해시 캐시)
+###############################################
+# weather/Graph_*.py, air/Graph_air_*.py는 지역 × 변수마다 그래프를 하나씩 그리고 plt.show()로
+# 창을 띄워서, 전체 그래프를 얻으려면 창 수십 개를 하나씩 닫아야 했다.
+# 여기서는 그래프 한 장을 '작업(job)' dict로 표현한다. (그릴 값 + 제목/축/범례 설정, 피클 가능)
+#   - 대화형 실행: 작업을 순서대로 그려 plt.show() (기존 동작)
+#   - --batch 실행: Agg 백엔드로 프로세스 풀에서 그려 PNG/SVG로 저장
+# 파일 이름에 작업 내용의 SHA-256 앞 12자리를 붙인다.  예) figures/humidity/서울_연도.3f9a0c1d2e4b.png
+#   같은 이름의 파일이 이미 있으면 (= 값과 설정이 그대로면) 다시 그리지 않고,
+#   내용이 바뀌면 새로 그린 뒤 이전 해시의 파일은 지운다.
+#
+# 사용 예)
+#   python Graph_humidity.py            -> 창으로 보기
+#   python Graph_humidity.py --batch    -> ./figures/humidity/*.png
+#   python render_figures.py            -> 저장소 전체 그래프 (weather + air)
+#
+# 작업 dict 키
+#   name     : 출력 파일 이름 (하위 폴더 '/' 허용)
+#   lines    : [{'x': [...], 'y': [...], 'label': ..., 'color': ...}, ...]  x는 문자열 라벨 (범주형 축)
+#   title, xlabel, ylabel
+#   xticks   : None(모두 표시) | 'q1'(각 해의 1분기만 표시, 나머지 눈금은 빈 라벨)
+#   ylim     : None | (하한, 상한)
+#   legend   : plt.legend 인자 dict (예: {'fontsize': 12, 'loc': 'upper center', 'bbox_to_anchor': (0.5, -0.1), 'ncol': 3})
+#   tight_rect, figsize, title_size, label_size
+import os
+import sys
+import glob
+import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+from matplotlib import font_manager
+
+
+WINDOWS_FONT = 'C:/Windows/Fonts/malgun.ttf'
+# Windows 폰트 파일이 없을 때(리눅스 서버 등) 차례로 시도하는 글꼴 이름
+FALLBACK_FONTS = ['Malgun Gothic', 'AppleGothic', 'NanumGothic', 'Noto Sans CJK KR']
+DEFAULT_FORMATS = ('png',)
+
+
+def set_korean_font():
+    """한글 글꼴 설정: malgun.ttf가 있으면 그 글꼴, 없으면 설치된 대체 글꼴 (없으면 기본 글꼴 유지)"""
+    import matplotlib.pyplot as plt
+
+    if os.path.exists(WINDOWS_FONT):
+        font_manager.fontManager.addfont(WINDOWS_FONT)
+        family = font_manager.FontProperties(fname=WINDOWS_FONT).get_name()
+    else:
+        installed = {f.name for f in font_manager.fontManager.ttflist}
+        family = next((name for name in FALLBACK_FONTS if name in installed), None)
+    if family:
+        plt.rc('font', family=family)
+    plt.rcParams['axes.unicode_minus'] = False  # 마이너스 기호 깨짐 방지
+
+
+def job_hash(job):
+    """작업 내용(값 + 설정)의 SHA-256 앞 12자리"""
+    text = json.dumps(job, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:12]
+
+
+def safe_name(name):
+    """파일 이름에 쓸 수 없는 문자 정리 ('/'는 하위 폴더 구분으로 유지)"""
+    return '/'.join(''.join('_' if c in '\\:*?"<>|[]' else c for c in part) for part in name.split('/'))
+
+
+def job_path(job, out_dir, fmt):
+    return os.path.join(out_dir, f"{safe_name(job['name'])}.{job_hash(job)}.{fmt}")
+
+
+def draw_job(job):
+    """작업 하나를 새 Figure에 그린다. (Figure 반환)"""
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure(figsize=job.get('figsize', (12, 6)))
+    n = 0
+    for line in job['lines']:
+        x = [str(v) for v in line['x']]
+        plt.plot(x, line['y'], marker=line.get('marker', 'o'), label=line.get('label'), color=line.get('color'))
+        n = max(n, len(x))
+
+    ticks = [str(v) for v in job['lines'][0]['x']] if job['lines'] else []
+    if job.get('xticks') == 'q1':
+        # 각 해의 1분기만 표시 ('2012-1분기', '2012Q1' 형식 모두)
+        plt.xticks(range(len(ticks)), [t if t.endswith(('1분기', 'Q1')) else '' for t in ticks], rotation=45)
+    elif ticks:
+        plt.xticks(range(len(ticks)), ticks, rotation=45)
+
+    plt.title(job.get('title', ''), fontsize=job.get('title_size', 16))
+    plt.xlabel(job.get('xlabel', ''), fontsize=job.get('label_size', 12))
+    plt.ylabel(job.get('ylabel', ''), fontsize=job.get('label_size', 12))
+    if job.get('ylim'):
+        plt.ylim(*job['ylim'])
+    if job.get('grid', True):
+        plt.grid(True, linestyle='--', alpha=0.5)
+    plt.legend(**job.get('legend', {'fontsize': 12}))
+    if job.get('tight_rect'):
+        plt.tight_layout(rect=job['tight_rect'])
+    else:
+        plt.tight_layout()
+    return fig
+
+
+def _init_worker():
+    matplotlib.use('Agg')
+    set_korean_font()
+
+
+def _render(args):
+    """작업 하나를 그려 형식별 파일로 저장하고, 같은 이름의 이전 해시 파일은 지운다."""
+    import matplotlib.pyplot as plt
+
+    job, paths = args
+    fig = draw_job(job)
+    for path in paths:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + '.tmp'
+        fig.savefig(tmp, format=os.path.splitext(path)[1][1:], dpi=job.get('dpi', 100))
+        os.replace(tmp, path)
+        stem, digest, fmt = path.rsplit('.', 2)
+        for old in glob.glob(glob.escape(stem) + '.*.' + fmt):
+            if old != path:
+                os.remove(old)
+    plt.close(fig)
+    return paths
+
+
+def render_jobs(jobs, out_dir, formats=DEFAULT_FORMATS, workers=None, verbose=True):
+    """
+    작업들을 Agg 백엔드로 그려 파일로 저장한다. (바뀐 그래프만)
+    - jobs: 작업 dict 목록 (이름은 서로 달라야 함)
+    - out_dir: 출력 폴더
+    - formats: 저장 형식 ('png', 'svg')
+    - workers: 프로세스 수 (None = CPU 수, 1 = 현재 프로세스에서 순서대로)
+    반환: {'rendered': 새로 그린 작업 수, 'skipped': 그대로라 건너뛴 작업 수}
+    """
+    names = [job['name'] for job in jobs]
+    if len(set(names)) != len(names):
+        raise ValueError("작업 이름이 중복됩니다: " + ', '.join(sorted({n for n in names if names.count(n) > 1})))
+
+    todo = []
+    for job in jobs:
+        paths = [job_path(job, out_dir, fmt) for fmt in formats]
+        if not all(os.path.exists(p) for p in paths):
+            todo.append((job, paths))
+
+    workers = workers or os.cpu_count() or 1
+    if todo and (workers == 1 or len(todo) == 1):
+        _init_worker()
+        for item in todo:
+            _render(item)
+    elif todo:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            # 작업 하나가 가벼우므로 여러 개씩 묶어서 보낸다
+            list(pool.map(_render, todo, chunksize=max(1, len(todo) // (workers * 4))))
+
+    if verbose:
+        print(f"[figure_batch] {out_dir}: {len(todo)}개 렌더링, {len(jobs) - len(todo)}개 변경 없음")
+    return {'rendered': len(todo), 'skipped': len(jobs) - len(todo)}
+
+
+def show_jobs(jobs):
+    """대화형: 작업을 하나씩 그려 창으로 띄운다. (기존 스크립트의 plt.show() 동작)"""
+    import matplotlib.pyplot as plt
+
+    set_korean_font()
+    for job in jobs:
+        draw_job(job)
+        plt.show()
+
+
+def show_or_render(jobs, out_dir, formats=DEFAULT_FORMATS):
+    """
+    스크립트 공용 진입점: 명령행에 --batch가 있으면 render_jobs, 없으면 show_jobs.
+    --svg를 함께 주면 PNG와 SVG를 모두 저장한다.
+    """
+    if '--batch' in sys.argv:
+        matplotlib.use('Agg')
+        formats = tuple(formats) + (('svg',) if '--svg' in sys.argv and 'svg' not in formats else ())
+        return render_jobs(jobs, out_dir, formats=formats)
+    show_jobs(jobs)
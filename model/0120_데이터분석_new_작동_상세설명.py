@@ -10,7 +10,12 @@ import optuna                 # Optuna: 하이퍼파라미터 자동 탐색 라
 import keras_tuner as kt      # KerasTuner: Keras 기반 모델 하이퍼파라미터 탐색 라이브러리
 import pmdarima as pm         # pmdarima: ARIMA 모델 구현 라이브러리
 
+import os
 from math import sqrt
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+import multiprocessing as mp
+from multiprocessing import shared_memory
 from sklearn.metrics import mean_squared_error, mean_absolute_error
 
 # 텐서플로 GRU, LSTM 등 RNN 기반 모델
@@ -24,6 +29,16 @@ from xgboost import XGBRegressor
 # Prophet (시계열 예측용)
 from prophet import Prophet
 
+# RNN/TCN 공용 슬라이딩 윈도우 생성
+from sequence_window import make_windows
+
+# 캐시되는 피처 엔지니어링 파이프라인
+from feature_pipeline import build_features, lag_roll_spec
+
+# 인코딩 감지 + 컬럼형 캐시 CSV 로더 (저장소 루트의 csv_cache.py)
+import _paths  # noqa: F401  (csv_cache, figure_batch, weather_index 경로)
+from csv_cache import load_csv
+
 # 한글 폰트 설정 (Windows 기준)
 import matplotlib.font_manager as fm
 font_name = fm.FontProperties(fname='C:/Windows/Fonts/malgun.ttf').get_name()
@@ -41,7 +56,7 @@ def load_and_preprocess_data(filepath: str) -> pd.DataFrame:
     4) 동일 열에 대해 평균±3표준편차를 벗어나는 이상치(outlier)를 clip하여 제거한다.
     5) 최종 전처리된 DataFrame을 반환한다.
     """
-    df = pd.read_csv(filepath)
+    df = load_csv(filepath)
     print("== Raw Data Preview ==")
     print(df.head())
 
@@ -81,34 +96,22 @@ def load_and_preprocess_data(filepath: str) -> pd.DataFrame:
 ###############################################
 # 2. 피처 엔지니어링 (lag, roll)
 ###############################################
-def create_feature_engineering(df, lag_features=None, roll_features=None):
+def create_feature_engineering(df, lag_features=None, roll_features=None, source_path=None):
     """
     - lag_features: { '컬럼명': [1,2,3...] } 형태로, 해당 컬럼을 몇 시점(lag) 이전 값을 추가할지 지정.
       예) {'호흡기_new':[1,2]} -> 호흡기_new_lag1, 호흡기_new_lag2 라는 열 생성
     - roll_features: { '컬럼명': [window1, window2,...] } 형태로, rolling window(이동평균) 적용.
       예) {'호흡기_new':[3]} -> 호흡기_new_roll3 라는 열 생성(3일 이동평균)
+    - source_path: 원본 CSV 경로. 지정하면 feature_pipeline이 블록별 결과를 feature_cache/에
+      캐시하므로, 입력 파일과 설정이 그대로인 블록은 다시 계산하지 않는다.
     1) df를 복사한 뒤, lag, roll 특징을 만든다.
     2) 최종적으로 생긴 NaN 행은 dropna()로 제거한다.
     """
-    df_ext = df.copy()
-
-    # (1) Lag features 생성
-    if lag_features:
-        for col, lags in lag_features.items():
-            if col not in df_ext.columns:
-                continue
-            for lag in lags:
-                df_ext[f"{col}_lag{lag}"] = df_ext[col].shift(lag)
-
-    # (2) Rolling features 생성
-    if roll_features:
-        for col, windows in roll_features.items():
-            if col not in df_ext.columns:
-                continue
-            for w in windows:
-                df_ext[f"{col}_roll{w}"] = df_ext[col].rolling(w).mean()
-
-    # (3) 이 과정에서 생긴 NaN 제거
+    # (1) Lag / Rolling features 생성 (feature_pipeline 블록 단위 캐시)
+    spec = lag_roll_spec(lag_features, roll_features)
+    df_ext = build_features(df, spec, source_path=source_path, verbose=False)
+
+    # (2) 이 과정에서 생긴 NaN 제거
     df_ext.dropna(inplace=True)
     return df_ext
 
@@ -162,6 +165,296 @@ def walk_forward_validation_arbitrary(
     return df_result
 
 
+###############################################
+# 3-1. Incremental Walk-Forward (모델 갱신 + 주기적 재학습)
+###############################################
+def walk_forward_validation_incremental(
+    df: pd.DataFrame,
+    train_size: int,
+    train_func,
+    predict_func,
+    update_func,
+    x_cols: list,
+    y_col: str,
+    refit_every: int = 30,
+    drift_threshold: float = None,
+    drift_window: int = 7
+) -> pd.DataFrame:
+    """
+    walk_forward_validation_arbitrary와 동일한 fold 구조(i번째 루프에서 0~i-1 학습, i 예측)를 유지하되,
+    매 시점마다 처음부터 재학습(Optuna 탐색 포함)하지 않고 기존 모델에 새 관측값만 반영한다.
+    - train_func: X_train, y_train -> 모델 (전체 재학습, Optuna 탐색 포함)
+    - predict_func: 훈련된 모델, X_test(1개 시점) -> 예측값 yhat
+    - update_func: (모델, X_new, y_new, X_train, y_train) -> 갱신된 모델
+        * X_new, y_new: 직전 루프 이후 새로 관측된 1개 시점(i-1)
+        * X_train, y_train: 0~i-1까지 누적된 학습 데이터 (warm-start 방식에서 사용)
+    - refit_every: k 스텝마다 train_func로 전체 재학습 (None이면 주기적 재학습 없음)
+    - drift_threshold: 최근 drift_window 스텝의 MAE가 재학습 직후 drift_window 스텝의 MAE보다
+      drift_threshold배 이상 커지면 전체 재학습 (None이면 drift 감지 비활성화)
+    * 전체 재학습이 일어난 시점(index)은 df_result.attrs['refit_index']에 기록한다.
+    """
+    n = len(df)
+    df_result = pd.DataFrame(index=df.index, columns=['actual','pred'])
+    df_result['actual'] = df[y_col].values
+
+    X_data = df[x_cols].values
+    y_data = df[y_col].values
+
+    model = None
+    steps_since_refit = 0
+    abs_errors = []       # 마지막 전체 재학습 이후의 절대오차 기록
+    baseline_mae = None   # 재학습 직후 drift_window 스텝의 MAE (drift 판단 기준)
+    refit_index = []
+
+    for i in range(train_size, n):
+        X_train = X_data[:i]
+        y_train = y_data[:i]
+
+        # (1) 전체 재학습 여부 판단: 최초 시점 / k 스텝 경과 / 오차 drift
+        need_refit = model is None
+        if refit_every is not None and steps_since_refit >= refit_every:
+            need_refit = True
+        if (drift_threshold is not None and baseline_mae is not None
+                and len(abs_errors) >= 2 * drift_window):
+            recent_mae = np.mean(abs_errors[-drift_window:])
+            if recent_mae > drift_threshold * baseline_mae:
+                need_refit = True
+
+        # (2) 모델 훈련 또는 갱신
+        if need_refit:
+            model = train_func(X_train, y_train)
+            steps_since_refit = 0
+            abs_errors = []
+            baseline_mae = None
+            refit_index.append(df.index[i])
+        else:
+            model = update_func(model, X_data[i-1:i], y_data[i-1:i], X_train, y_train)
+
+        # (3) 예측
+        X_test = X_data[i:i+1]  # i번째 행(1개)
+        if np.isnan(X_test).any():
+            X_test = np.nan_to_num(X_test, nan=0.0)
+
+        yhat = predict_func(model, X_test)
+        df_result.iloc[i, df_result.columns.get_loc('pred')] = yhat
+
+        # (4) drift 판단용 오차 누적
+        steps_since_refit += 1
+        abs_errors.append(abs(y_data[i] - yhat))
+        if baseline_mae is None and len(abs_errors) >= drift_window:
+            baseline_mae = np.mean(abs_errors[:drift_window])
+
+    df_result.attrs['refit_index'] = refit_index
+    return df_result
+
+
+###############################################
+# 3-2. 병렬 Walk-Forward (프로세스 풀 + 공유 메모리)
+###############################################
+# 작업자 프로세스 전역 상태 (_wf_worker_init에서 한 번만 채워진다)
+_WF_SHARED = {}
+_WF_SHM = []
+_WF_CONFIG = {}
+
+
+def _to_shared_memory(arr):
+    """
+    넘파이 배열을 공유 메모리 블록에 복사하고, 작업자가 붙을(attach) 때 필요한 정보를 반환한다.
+    - 반환값: (SharedMemory 객체, (블록 이름, shape, dtype 문자열))
+    """
+    arr = np.ascontiguousarray(arr)
+    shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+    view = np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)
+    view[:] = arr
+    return shm, (shm.name, arr.shape, arr.dtype.str)
+
+
+def _wf_worker_init(shared_specs, mode, train_func, predict_func, window_size):
+    """
+    작업자 프로세스 초기화 함수.
+    - 공유 메모리 블록에 붙어서 읽기 전용 넘파이 뷰를 만든다 (피처 행렬은 복사되지 않음)
+    - train_func, predict_func는 작업자당 한 번만 전달받는다.
+    """
+    for key, (name, shape, dtype) in shared_specs.items():
+        shm = shared_memory.SharedMemory(name=name)
+        arr = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        arr.setflags(write=False)
+        _WF_SHM.append(shm)
+        _WF_SHARED[key] = arr
+
+    _WF_CONFIG.update(
+        mode=mode,
+        train_func=train_func,
+        predict_func=predict_func,
+        window_size=window_size
+    )
+
+
+def _wf_worker_step(i):
+    """
+    i번째 walk-forward 스텝 하나를 수행한다. (0~i-1 학습, i 예측)
+    - 각 스텝은 i 이전 데이터에만 의존하고 이전 스텝의 모델이 필요 없으므로 독립적으로 실행 가능.
+    - 반환값: (i, actual, pred)
+    """
+    mode = _WF_CONFIG['mode']
+    train_func = _WF_CONFIG['train_func']
+    predict_func = _WF_CONFIG['predict_func']
+    window_size = _WF_CONFIG['window_size']
+    y_all = _WF_SHARED['y']
+
+    if mode == 'arbitrary':
+        X_all = _WF_SHARED['X']
+        model = train_func(X_all[:i], y_all[:i])
+        X_test = X_all[i:i+1]
+        if np.isnan(X_test).any():
+            X_test = np.nan_to_num(X_test, nan=0.0)
+        yhat = predict_func(model, X_test)
+
+    elif mode == 'rnn':
+        X_all = _WF_SHARED['X']
+        model = train_func(X_all[:i], y_all[:i])
+        if i < window_size:
+            yhat = np.nan
+        else:
+            X_seq = X_all[i-window_size:i].reshape(1, window_size, X_all.shape[1])
+            yhat = predict_func(model, X_seq)
+
+    elif mode == 'prophet':
+        date_idx = pd.DatetimeIndex(_WF_SHARED['dates'])
+        exog_all = _WF_SHARED.get('exog')
+        exog_train = exog_all[:i] if exog_all is not None else None
+        model = train_func(date_idx[:i], y_all[:i], exog_train)
+        exog_i = exog_all[i:i+1] if exog_all is not None else None
+        yhat = predict_func(model, date_idx[i], exog_i)
+
+    else:
+        raise ValueError(f"지원하지 않는 mode: {mode}")
+
+    return i, float(y_all[i]), float(yhat)
+
+
+def iter_walk_forward_parallel(
+    df: pd.DataFrame,
+    train_size: int,
+    train_func,
+    predict_func,
+    y_col: str,
+    x_cols: list = None,
+    mode: str = 'arbitrary',
+    window_size: int = 4,
+    max_workers: int = None,
+    max_pending: int = None,
+    max_tasks_per_child: int = None
+):
+    """
+    walk-forward의 각 스텝(i)을 프로세스 풀에 분배하고, 끝나는 순서대로 (index, actual, pred)를 yield한다.
+    - mode: 'arbitrary'(ARIMA/XGB 등 2D), 'rnn'(LSTM/GRU, window_size 사용), 'prophet'
+      * prophet 모드에서는 x_cols를 외생변수(exog_cols)로 사용하고, train_func는
+        (dates_train, y_train, exog_train) -> 모델, predict_func는 (모델, next_date, exog_i) -> yhat
+    - train_func, predict_func는 pickle 가능해야 한다 (lambda 대신 모듈 함수 또는 functools.partial 사용)
+    - 피처 행렬/타겟/날짜는 공유 메모리에 한 번만 올리고, 작업자는 복사 없이 읽기 전용 뷰로 접근한다.
+    - max_pending: 동시에 제출해 두는 스텝 수 상한 (기본 max_workers*2) -> 결과 대기열 메모리 제한
+    - max_tasks_per_child: 작업자 하나가 처리할 스텝 수 상한. TensorFlow/Prophet처럼 메모리가
+      누적되는 모델은 값을 지정해 작업자를 주기적으로 재시작한다.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_pending is None:
+        max_pending = max_workers * 2
+
+    # (1) 공유 메모리에 데이터 적재
+    arrays = {'y': df[y_col].values.astype(float)}
+    if mode == 'prophet':
+        arrays['dates'] = df.index.values.astype('datetime64[ns]')
+        if x_cols:
+            arrays['exog'] = df[x_cols].values.astype(float)
+    else:
+        arrays['X'] = df[x_cols].values.astype(float)
+
+    shm_list = []
+    shared_specs = {}
+    for key, arr in arrays.items():
+        shm, spec = _to_shared_memory(arr)
+        shm_list.append(shm)
+        shared_specs[key] = spec
+
+    # (2) 프로세스 풀 생성 (spawn: TensorFlow 등과 fork 충돌 방지, Windows와 동일한 동작)
+    pool_kwargs = dict(
+        max_workers=max_workers,
+        mp_context=mp.get_context('spawn'),
+        initializer=_wf_worker_init,
+        initargs=(shared_specs, mode, train_func, predict_func, window_size)
+    )
+    if max_tasks_per_child is not None:
+        pool_kwargs['max_tasks_per_child'] = max_tasks_per_child
+
+    try:
+        with ProcessPoolExecutor(**pool_kwargs) as executor:
+            steps = iter(range(train_size, len(df)))
+            pending = set()
+
+            # (3) 대기열이 max_pending을 넘지 않도록 제출하며, 끝난 스텝부터 결과 전달
+            for i in steps:
+                pending.add(executor.submit(_wf_worker_step, i))
+                if len(pending) >= max_pending:
+                    break
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    i, actual, yhat = fut.result()
+                    yield df.index[i], actual, yhat
+                for i in steps:
+                    pending.add(executor.submit(_wf_worker_step, i))
+                    if len(pending) >= max_pending:
+                        break
+    finally:
+        for shm in shm_list:
+            shm.close()
+            shm.unlink()
+
+
+def walk_forward_validation_parallel(
+    df: pd.DataFrame,
+    train_size: int,
+    train_func,
+    predict_func,
+    y_col: str,
+    x_cols: list = None,
+    mode: str = 'arbitrary',
+    window_size: int = 4,
+    max_workers: int = None,
+    max_pending: int = None,
+    max_tasks_per_child: int = None,
+    on_result=None
+) -> pd.DataFrame:
+    """
+    iter_walk_forward_parallel의 결과를 모아 기존 walk-forward 함수와 같은 df_result(actual, pred)를 만든다.
+    - on_result: (index, actual, pred)를 받는 콜백. 지정하지 않으면 진행 상황을 출력한다.
+      (긴 실행에서도 끝난 스텝의 부분 결과를 바로 확인 가능)
+    """
+    df_result = pd.DataFrame(index=df.index, columns=['actual','pred'])
+    df_result['actual'] = df[y_col].values
+
+    n_steps = max(len(df) - train_size, 0)
+    for n_done, (idx, actual, yhat) in enumerate(iter_walk_forward_parallel(
+        df, train_size, train_func, predict_func, y_col,
+        x_cols=x_cols,
+        mode=mode,
+        window_size=window_size,
+        max_workers=max_workers,
+        max_pending=max_pending,
+        max_tasks_per_child=max_tasks_per_child
+    ), start=1):
+        df_result.loc[idx, 'pred'] = yhat
+        if on_result is not None:
+            on_result(idx, actual, yhat)
+        else:
+            print(f"[Parallel WF] {n_done}/{n_steps} index={idx}, actual={actual:.3f}, pred={yhat:.3f}")
+
+    return df_result
+
+
 ###############################################
 # 4. RNN(LSTM, GRU)용 Dataset 생성 및 Walk-Forward
 ###############################################
@@ -172,14 +465,9 @@ def make_lstm_dataset(X_data, y_data, window_size=4):
     예) window_size=4일 때
         i=0~3 입력 -> i=4 예측
         i=1~4 입력 -> i=5 예측 ...
+    - sequence_window.make_windows를 사용하므로 복사 없이 원본을 공유하는 읽기 전용 뷰를 반환한다.
     """
-    X_seq, y_seq = [], []
-    for i in range(len(X_data) - window_size):
-        # 연속된 window_size만큼 X
-        X_seq.append(X_data[i:i+window_size, :])
-        # 그 다음 시점의 y를 타겟
-        y_seq.append(y_data[i+window_size])
-    return np.array(X_seq), np.array(y_seq)
+    return make_windows(X_data, y_data, window_size)
 
 
 def walk_forward_validation_lstm(
@@ -329,6 +617,19 @@ def predict_arima_optuna(model, X_test):
     return fcst[0]
 
 
+def update_arima_append(model, X_new, y_new, X_train=None, y_train=None):
+    """
+    ARIMA 상태공간(state-space) 모형에 새 관측값(1개 시점)을 이어 붙인다.
+    - (p, d, q)와 추정된 계수는 그대로 두고, 칼만 필터 상태만 새 시점까지 진행 (refit 없음)
+    - statsmodels의 extend()는 새 구간만 필터링하므로 스텝당 비용이 학습 길이와 무관하다.
+    - pmdarima 모델의 내부 결과 객체(arima_res_)를 교체하므로 predict_arima_optuna를 그대로 사용할 수 있다.
+    """
+    res = model.arima_res_
+    exog_new = X_new if res.model.k_exog > 0 else None
+    model.arima_res_ = res.extend(np.asarray(y_new, dtype=float), exog=exog_new)
+    return model
+
+
 def objective_xgb(trial, X_train, y_train):
     """
     XGBRegressor의 주요 파라미터를 Optuna로 탐색하기 위한 objective 함수.
@@ -381,20 +682,36 @@ def predict_xgb_optuna(model, X_test):
     return model.predict(X_test)[0]
 
 
+def update_xgb_warm_start(model, X_new, y_new, X_train, y_train, n_rounds=10):
+    """
+    기존 XGB 모델의 booster에 n_rounds개의 트리를 추가로 학습(warm-start)한다.
+    - 하이퍼파라미터(Optuna 결과)는 그대로 유지
+    - 새 트리는 0~i-1 전체 데이터의 잔차에 맞춰지므로 새 관측값(X_new, y_new)이 반영된다.
+    - 트리 수는 재학습(refit) 시점마다 초기화되므로 refit_every로 모델 크기를 제한한다.
+    """
+    params = model.get_params()
+    params['n_estimators'] = n_rounds
+    model_new = XGBRegressor(**params)
+    model_new.fit(X_train, y_train, xgb_model=model.get_booster())
+    return model_new
+
+
 ###############################################
 # 6. Prophet 전용 Optuna 튜닝 + Walk-Forward
 ###############################################
-def train_prophet_optuna(
-    df: pd.DataFrame,
+def tune_prophet_optuna(
+    dates_train,
+    y_train,
+    exog_train=None,
     exogenous_cols: list = None,
     param_space: dict = None,
     n_trials: int = 3
-) -> callable:
+):
     """
-    Prophet의 주요 파라미터(seasonality_mode, yearly_seasonality, changepoint_prior_scale 등)를
-    Optuna로 탐색하기 위한 함수를 만들어 반환한다.
-    - walk-forward에서 각 시점(i)마다, tune_func(dates_train, y_train, exog_train)을 호출해
-      Prophet 모델을 최적 파라미터로 훈련할 수 있다.
+    walk-forward 내에서 호출되는 함수.
+    dates_train, y_train, exog_train을 사용해 Prophet 파라미터를 Optuna로 튜닝 후,
+    최적 모델을 훈련해 반환.
+    - 모듈 최상위 함수이므로 functools.partial로 묶어 프로세스 풀 작업자에게 전달할 수 있다.
     """
     from sklearn.metrics import mean_squared_error
 
@@ -406,83 +723,93 @@ def train_prophet_optuna(
             'changepoint_prior_scale': [0.01, 0.1, 0.5, 1.0]
         }
 
-    df_temp = df.copy()
-
-    def tune_func(dates_train, y_train, exog_train=None):
-        """
-        walk-forward 내에서 호출되는 함수.
-        dates_train, y_train, exog_train을 사용해 Prophet 파라미터를 Optuna로 튜닝 후,
-        최적 모델을 훈련해 반환.
-        """
-        def local_objective(trial):
-            seasonality_mode_ = trial.suggest_categorical(
-                'seasonality_mode',
-                param_space['seasonality_mode']
-            )
-            yearly_seasonality_ = trial.suggest_categorical(
-                'yearly_seasonality',
-                param_space['yearly_seasonality']
+    def local_objective(trial):
+        seasonality_mode_ = trial.suggest_categorical(
+            'seasonality_mode',
+            param_space['seasonality_mode']
+        )
+        yearly_seasonality_ = trial.suggest_categorical(
+            'yearly_seasonality',
+            param_space['yearly_seasonality']
+        )
+        # changepoint_prior_scale이 float 범위인지, categorical인지에 따라 분기
+        if len(param_space['changepoint_prior_scale']) > 2:
+            changepoint_prior_ = trial.suggest_float(
+                'changepoint_prior_scale',
+                min(param_space['changepoint_prior_scale']),
+                max(param_space['changepoint_prior_scale']),
+                step=0.01
             )
-            # changepoint_prior_scale이 float 범위인지, categorical인지에 따라 분기
-            if len(param_space['changepoint_prior_scale']) > 2:
-                changepoint_prior_ = trial.suggest_float(
-                    'changepoint_prior_scale',
-                    min(param_space['changepoint_prior_scale']),
-                    max(param_space['changepoint_prior_scale']),
-                    step=0.01
-                )
-            else:
-                changepoint_prior_ = trial.suggest_categorical(
-                    'changepoint_prior_scale',
-                    param_space['changepoint_prior_scale']
-                )
-
-            model_ = Prophet(
-                seasonality_mode=seasonality_mode_,
-                yearly_seasonality=yearly_seasonality_,
-                changepoint_prior_scale=changepoint_prior_
+        else:
+            changepoint_prior_ = trial.suggest_categorical(
+                'changepoint_prior_scale',
+                param_space['changepoint_prior_scale']
             )
 
-            # Prophet 훈련용 DataFrame 준비 (ds, y)
-            df_p = pd.DataFrame({'ds': dates_train, 'y': y_train})
-            # exogenous_cols가 있으면, 해당 열을 add_regressor()로 추가
-            if exogenous_cols and exog_train is not None:
-                for idx, c in enumerate(exogenous_cols):
-                    df_p[c] = exog_train[:, idx]
-                    model_.add_regressor(c)
-
-            model_.fit(df_p)
-
-            # 훈련 데이터에 대해 예측 후 RMSE 계산
-            forecast_ = model_.predict(df_p[['ds'] + (exogenous_cols if exogenous_cols else [])])
-            rmse_ = sqrt(mean_squared_error(df_p['y'], forecast_['yhat']))
-            return rmse_
-
-        # (2) Optuna Study 생성 & 탐색
-        study = optuna.create_study(direction='minimize')
-        study.optimize(local_objective, n_trials=n_trials)
-        best_ = study.best_trial
-        print(f"[Prophet Optuna] best params={best_.params}, best RMSE={best_.value}")
-
-        # (3) 최적 파라미터로 모델 생성
-        best_model = Prophet(
-            seasonality_mode=best_.params['seasonality_mode'],
-            yearly_seasonality=best_.params['yearly_seasonality'],
-            changepoint_prior_scale=best_.params['changepoint_prior_scale']
+        model_ = Prophet(
+            seasonality_mode=seasonality_mode_,
+            yearly_seasonality=yearly_seasonality_,
+            changepoint_prior_scale=changepoint_prior_
         )
 
-        # (4) 최적 파라미터 모델에 exogenous 등록 + fit
+        # Prophet 훈련용 DataFrame 준비 (ds, y)
         df_p = pd.DataFrame({'ds': dates_train, 'y': y_train})
+        # exogenous_cols가 있으면, 해당 열을 add_regressor()로 추가
         if exogenous_cols and exog_train is not None:
             for idx, c in enumerate(exogenous_cols):
                 df_p[c] = exog_train[:, idx]
-                best_model.add_regressor(c)
+                model_.add_regressor(c)
+
+        model_.fit(df_p)
+
+        # 훈련 데이터에 대해 예측 후 RMSE 계산
+        forecast_ = model_.predict(df_p[['ds'] + (exogenous_cols if exogenous_cols else [])])
+        rmse_ = sqrt(mean_squared_error(df_p['y'], forecast_['yhat']))
+        return rmse_
+
+    # (2) Optuna Study 생성 & 탐색
+    study = optuna.create_study(direction='minimize')
+    study.optimize(local_objective, n_trials=n_trials)
+    best_ = study.best_trial
+    print(f"[Prophet Optuna] best params={best_.params}, best RMSE={best_.value}")
 
-        best_model.fit(df_p)
-        return best_model
+    # (3) 최적 파라미터로 모델 생성
+    best_model = Prophet(
+        seasonality_mode=best_.params['seasonality_mode'],
+        yearly_seasonality=best_.params['yearly_seasonality'],
+        changepoint_prior_scale=best_.params['changepoint_prior_scale']
+    )
 
-    # tune_func 자체를 반환
-    return tune_func
+    # (4) 최적 파라미터 모델에 exogenous 등록 + fit
+    df_p = pd.DataFrame({'ds': dates_train, 'y': y_train})
+    if exogenous_cols and exog_train is not None:
+        for idx, c in enumerate(exogenous_cols):
+            df_p[c] = exog_train[:, idx]
+            best_model.add_regressor(c)
+
+    best_model.fit(df_p)
+    return best_model
+
+
+def train_prophet_optuna(
+    df: pd.DataFrame,
+    exogenous_cols: list = None,
+    param_space: dict = None,
+    n_trials: int = 3
+) -> callable:
+    """
+    Prophet의 주요 파라미터(seasonality_mode, yearly_seasonality, changepoint_prior_scale 등)를
+    Optuna로 탐색하기 위한 함수를 만들어 반환한다.
+    - walk-forward에서 각 시점(i)마다, tune_func(dates_train, y_train, exog_train)을 호출해
+      Prophet 모델을 최적 파라미터로 훈련할 수 있다.
+    - 반환값은 tune_prophet_optuna에 설정을 묶은 partial이므로 pickle 가능하다(병렬 walk-forward용).
+    """
+    return partial(
+        tune_prophet_optuna,
+        exogenous_cols=exogenous_cols,
+        param_space=param_space,
+        n_trials=n_trials
+    )
 
 
 def predict_prophet_optuna(model, next_date, exogenous=None):
@@ -612,7 +939,7 @@ def train_lstm_ktuner(
         max_trials=max_trials,
         overwrite=True,
         directory='C:/temp/ktuner_lstm_output',
-        project_name='lstm_tune_wf'
+        project_name=f'lstm_tune_wf_{os.getpid()}'  # 병렬 작업자끼리 결과 폴더 충돌 방지
     )
 
     # (5) EarlyStopping 콜백
@@ -728,7 +1055,7 @@ def train_gru_ktuner(
         max_trials=max_trials,
         overwrite=True,
         directory='C:/temp/ktuner_gru_output',
-        project_name='gru_tune_wf'
+        project_name=f'gru_tune_wf_{os.getpid()}'  # 병렬 작업자끼리 결과 폴더 충돌 방지
     )
 
     # EarlyStopping
@@ -801,7 +1128,12 @@ def run_all_models(
     use_feature_engineering=True,
     lag_features=None,
     roll_features=None,
-    window_size=4
+    window_size=4,
+    incremental=True,
+    refit_every=30,
+    drift_threshold=None,
+    parallel=False,
+    max_workers=None
 ):
     """
     1) CSV 로드 & 전처리
@@ -810,13 +1142,17 @@ def run_all_models(
     4) 각 타겟 컬럼에 대해 ARIMA, XGB, Prophet, LSTM, GRU 모델을 walk-forward로 훈련 & 예측
     5) RMSE, MAE 계산 & 시각화
     6) 결과 요약 출력
+    - incremental: True면 ARIMA/XGB를 walk_forward_validation_incremental로 실행
+      (refit_every 스텝마다 또는 drift_threshold 초과 시에만 Optuna 재학습, 그 사이에는 모델 갱신)
+    - parallel: True면 모든 모델의 walk-forward 스텝을 walk_forward_validation_parallel로
+      max_workers개 프로세스에 분산 (ARIMA/XGB는 incremental 대신 매 스텝 전체 재학습)
     """
     # (1) 데이터 로드 + 전처리
     df = load_and_preprocess_data(filepath)
 
     # (2) 피처 엔지니어링
     if use_feature_engineering:
-        df = create_feature_engineering(df, lag_features, roll_features)
+        df = create_feature_engineering(df, lag_features, roll_features, source_path=filepath)
         print("\n[Check NaN after Feature Engineering]\n", df.isnull().sum())
 
     # (2-1) 추가적으로 다시 한 번 dropna
@@ -835,6 +1171,26 @@ def run_all_models(
         n_trials=3
     )
 
+    # 모델별 훈련 함수 (병렬 실행 시 작업자에게 전달되므로 lambda 대신 partial 사용)
+    arima_train_func = partial(train_arima_optuna, n_trials=3)
+    xgb_train_func = partial(train_xgb_optuna, n_trials=3)
+    lstm_train_func = partial(
+        train_lstm_ktuner,
+        window_size=window_size,
+        max_trials=2,
+        batch_size_candidates=[4,8,16],
+        epochs_candidates=[5,10],
+        patience=2
+    )
+    gru_train_func = partial(
+        train_gru_ktuner,
+        window_size=window_size,
+        max_trials=2,
+        batch_size_candidates=[4,8,16],
+        epochs_candidates=[5,10],
+        patience=2
+    )
+
     # (4) 타겟별 모델 실행
     for tgt in target_list:
         if tgt not in df.columns:
@@ -845,14 +1201,38 @@ def run_all_models(
         sub_df = df[x_cols + [tgt]].copy()  # 모델별로 사용할 서브셋
 
         # ---- ARIMA ----
-        df_arima = walk_forward_validation_arbitrary(
-            sub_df,
-            train_size=10,
-            train_func=lambda Xtr, ytr: train_arima_optuna(Xtr, ytr, n_trials=3),
-            predict_func=predict_arima_optuna,
-            x_cols=x_cols,
-            y_col=tgt
-        )
+        if parallel:
+            df_arima = walk_forward_validation_parallel(
+                sub_df,
+                train_size=10,
+                train_func=arima_train_func,
+                predict_func=predict_arima_optuna,
+                y_col=tgt,
+                x_cols=x_cols,
+                mode='arbitrary',
+                max_workers=max_workers
+            )
+        elif incremental:
+            df_arima = walk_forward_validation_incremental(
+                sub_df,
+                train_size=10,
+                train_func=arima_train_func,
+                predict_func=predict_arima_optuna,
+                update_func=update_arima_append,
+                x_cols=x_cols,
+                y_col=tgt,
+                refit_every=refit_every,
+                drift_threshold=drift_threshold
+            )
+        else:
+            df_arima = walk_forward_validation_arbitrary(
+                sub_df,
+                train_size=10,
+                train_func=arima_train_func,
+                predict_func=predict_arima_optuna,
+                x_cols=x_cols,
+                y_col=tgt
+            )
         mask_arima = df_arima['pred'].notnull()
         rmse_arima = sqrt(mean_squared_error(df_arima.loc[mask_arima, 'actual'],
                                              df_arima.loc[mask_arima, 'pred']))
@@ -861,14 +1241,38 @@ def run_all_models(
         plot_pred_vs_actual(df_arima, "ARIMA(Optuna)", tgt)
 
         # ---- XGB ----
-        df_xgb = walk_forward_validation_arbitrary(
-            sub_df,
-            train_size=10,
-            train_func=lambda Xtr, ytr: train_xgb_optuna(Xtr, ytr, n_trials=3),
-            predict_func=predict_xgb_optuna,
-            x_cols=x_cols,
-            y_col=tgt
-        )
+        if parallel:
+            df_xgb = walk_forward_validation_parallel(
+                sub_df,
+                train_size=10,
+                train_func=xgb_train_func,
+                predict_func=predict_xgb_optuna,
+                y_col=tgt,
+                x_cols=x_cols,
+                mode='arbitrary',
+                max_workers=max_workers
+            )
+        elif incremental:
+            df_xgb = walk_forward_validation_incremental(
+                sub_df,
+                train_size=10,
+                train_func=xgb_train_func,
+                predict_func=predict_xgb_optuna,
+                update_func=update_xgb_warm_start,
+                x_cols=x_cols,
+                y_col=tgt,
+                refit_every=refit_every,
+                drift_threshold=drift_threshold
+            )
+        else:
+            df_xgb = walk_forward_validation_arbitrary(
+                sub_df,
+                train_size=10,
+                train_func=xgb_train_func,
+                predict_func=predict_xgb_optuna,
+                x_cols=x_cols,
+                y_col=tgt
+            )
         mask_xgb = df_xgb['pred'].notnull()
         rmse_xgb = sqrt(mean_squared_error(df_xgb.loc[mask_xgb, 'actual'],
                                            df_xgb.loc[mask_xgb, 'pred']))
@@ -877,13 +1281,26 @@ def run_all_models(
         plot_pred_vs_actual(df_xgb, "XGB(Optuna)", tgt)
 
         # ---- Prophet ----
-        df_prophet = walk_forward_validation_prophet_optuna(
-            df=sub_df,
-            train_size=10,
-            y_col=tgt,
-            prophet_tune_func=prophet_tune_func,
-            exog_cols=None
-        )
+        if parallel:
+            df_prophet = walk_forward_validation_parallel(
+                sub_df,
+                train_size=10,
+                train_func=prophet_tune_func,
+                predict_func=predict_prophet_optuna,
+                y_col=tgt,
+                x_cols=None,
+                mode='prophet',
+                max_workers=max_workers,
+                max_tasks_per_child=20
+            )
+        else:
+            df_prophet = walk_forward_validation_prophet_optuna(
+                df=sub_df,
+                train_size=10,
+                y_col=tgt,
+                prophet_tune_func=prophet_tune_func,
+                exog_cols=None
+            )
         mask_ppt = df_prophet['pred'].notnull()
         rmse_ppt = sqrt(mean_squared_error(df_prophet.loc[mask_ppt, 'actual'],
                                            df_prophet.loc[mask_ppt, 'pred']))
@@ -892,22 +1309,29 @@ def run_all_models(
         plot_pred_vs_actual(df_prophet, "Prophet(Optuna)", tgt)
 
         # ---- LSTM ----
-        df_lstm = walk_forward_validation_lstm(
-            df=sub_df,
-            train_size=10,
-            x_cols=x_cols,
-            y_col=tgt,
-            train_func=lambda Xtr, ytr: train_lstm_ktuner(
-                Xtr, ytr,
+        if parallel:
+            df_lstm = walk_forward_validation_parallel(
+                sub_df,
+                train_size=10,
+                train_func=lstm_train_func,
+                predict_func=predict_lstm_ktuner,
+                y_col=tgt,
+                x_cols=x_cols,
+                mode='rnn',
                 window_size=window_size,
-                max_trials=2,
-                batch_size_candidates=[4,8,16],
-                epochs_candidates=[5,10],
-                patience=2
-            ),
-            predict_func=predict_lstm_ktuner,
-            window_size=window_size
-        )
+                max_workers=max_workers,
+                max_tasks_per_child=20
+            )
+        else:
+            df_lstm = walk_forward_validation_lstm(
+                df=sub_df,
+                train_size=10,
+                x_cols=x_cols,
+                y_col=tgt,
+                train_func=lstm_train_func,
+                predict_func=predict_lstm_ktuner,
+                window_size=window_size
+            )
         mask_lstm = df_lstm['pred'].notnull()
         rmse_lstm = sqrt(mean_squared_error(df_lstm.loc[mask_lstm, 'actual'],
                                             df_lstm.loc[mask_lstm, 'pred']))
@@ -916,22 +1340,29 @@ def run_all_models(
         plot_pred_vs_actual(df_lstm, "LSTM(KerasTuner)", tgt)
 
         # ---- GRU ----
-        df_gru = walk_forward_validation_gru(
-            df=sub_df,
-            train_size=10,
-            x_cols=x_cols,
-            y_col=tgt,
-            train_func=lambda Xtr, ytr: train_gru_ktuner(
-                Xtr, ytr,
+        if parallel:
+            df_gru = walk_forward_validation_parallel(
+                sub_df,
+                train_size=10,
+                train_func=gru_train_func,
+                predict_func=predict_gru_ktuner,
+                y_col=tgt,
+                x_cols=x_cols,
+                mode='rnn',
                 window_size=window_size,
-                max_trials=2,
-                batch_size_candidates=[4,8,16],
-                epochs_candidates=[5,10],
-                patience=2
-            ),
-            predict_func=predict_gru_ktuner,
-            window_size=window_size
-        )
+                max_workers=max_workers,
+                max_tasks_per_child=20
+            )
+        else:
+            df_gru = walk_forward_validation_gru(
+                df=sub_df,
+                train_size=10,
+                x_cols=x_cols,
+                y_col=tgt,
+                train_func=gru_train_func,
+                predict_func=predict_gru_ktuner,
+                window_size=window_size
+            )
         mask_gru = df_gru['pred'].notnull()
         rmse_gru = sqrt(mean_squared_error(df_gru.loc[mask_gru, 'actual'],
                                            df_gru.loc[mask_gru, 'pred']))
@@ -5,7 +5,7 @@ import seaborn as sns
 from sklearn.preprocessing import StandardScaler, MinMaxScaler
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
-from sklearn.model_selection import TimeSeriesSplit, GridSearchCV
+from sklearn.model_selection import GridSearchCV
 import statsmodels.api as sm
 import tensorflow as tf
 from tensorflow import keras
@@ -21,57 +21,32 @@ from prophet.diagnostics import cross_validation, performance_metrics
 from sklearn.impute import SimpleImputer
 from xgboost import XGBRegressor
 from statsmodels.stats.outliers_influence import variance_inflation_factor
+from sequence_window import make_windows
+from feature_pipeline import build_features, CASES_FEATURE_SPEC
+
+import os
+import _paths  # noqa: F401  (csv_cache, figure_batch, weather_index 경로)
+from csv_cache import load_csv
+
+# Optuna 병렬 튜닝 러너 (trial을 여러 프로세스에서 동시에 실행, 중단 시 같은 스토리지로 이어서 실행, 데이터가 바뀌면 새 study)
+from optuna_runner import run_study, RandomForestObjective, RNNObjective, TCNObjective
+TUNING_STORAGE = './optuna_0207.log'   # Journal 파일 (또는 'sqlite:///optuna_0207.db')
+N_TUNING_WORKERS = os.cpu_count()      # worker 프로세스 수
+TUNING_PRUNER = 'median'               # 'median' / 'hyperband' / None
 
 # 데이터 로드 (df는 이미 로드되어 있다고 가정)
 
 df_path = './Processed_COVID_Data_Filled.csv'
-try:
-    df = pd.read_csv(df_path, encoding='cp949')
-except UnicodeDecodeError:
-    try:
-        df = pd.read_csv(df_path, encoding='latin-1')
-    except UnicodeDecodeError:
-        try:
-            df = pd.read_csv(df_path, encoding='cp1252')
-        except UnicodeDecodeError:
-            print("[ERROR] Could not decode file with common encodings.")
-            raise
+# 인코딩은 바이트 샘플로 한 번만 감지, 두 번째 실행부터는 ./Processed_COVID_Data_Filled.csv.feather 캐시 사용
+df = load_csv(df_path)
 
 df['Date'] = pd.to_datetime(df['Date'], format='%Y-%m-%d', errors='coerce')
 df = df.sort_values('Date').dropna(subset=['Date']).reset_index(drop=True)
 # 'Cases_lag1', 'Cases_lag5', 'Cases_lag7', 'Cases_lag14', 'Cases_ma5', 'Cases_std5','Cases_ma7', 'Cases_std7', 'Cases_ma14', 'Cases_std14', 'Cases_diff', 'Cases_lag1_log', 'Cases_lag7_log', 'Cases_lag1_diff', 'Cases_diff2'
-# 1,5,7,14일전 확진자수 생성(현재행의 바로 1,5,7,14 일 전 행 값으로 채워짐
-# 이동 평균(Moving Average)과 이동 표준편차 생성 (7일/14일 단위)
-for ws in [1,5,7,14]:
-
-    df[f'Cases_lag{ws}'] = df['Cases'].shift(ws)
-    # 최근 7일/14일 간의 평균 확진자 수 (데이터의 추세 파악용)
-    if ws==5 or ws == 7 or ws == 14:
-      # 최근 7일/14일 간의 평균 확진자 수 (데이터의 추세 파악용)
-      df[f'Cases_ma{ws}'] = df['Cases'].rolling(ws).mean()
-      # 최근 7일/14일 간의 확진자 수 표준편차 (데이터의 변동성 측정)
-      df[f'Cases_std{ws}'] = df['Cases'].rolling(ws).std()
-
-
-
-# 로그 변환: 확진자 수에 자연로그 적용 (큰 숫자의 스케일을 줄여 패턴 분석 용이)
-# np.log1p는 log(1+x)로, 0 값이 있어도 계산 가능
-df['Cases_log'] = np.log1p(df['Cases'])
-
-# 1일 차분: 전일 대비 확진자 수 변화량 (어제 vs 오늘 증감 계산)
-df['Cases_diff'] = df['Cases'].diff(1)
-
-# 1일 전 확진자 수에 로그 변환 적용 (과거 데이터 스케일 조정)
-df['Cases_lag1_log'] = np.log1p(df['Cases_lag1'])
-
-# 7일 전 확진자 수에 로그 변환 적용 (과거 데이터 스케일 조정)
-df['Cases_lag7_log'] = np.log1p(df['Cases_lag7'])
-
-# 1일 전 확진자 수의 1일 차분 (이틀 전 vs 어제 증감 계산)
-df['Cases_lag1_diff'] = df['Cases_lag1'].diff(1)
-
-# 2차 차분: 1일 차분 데이터의 추가 차분 (변화량의 변화량, 추세 변화율 분석)
-df['Cases_diff2'] = df['Cases_diff'].diff(1)
+# 1,5,7,14일전 확진자수, 5/7/14일 이동 평균/표준편차, 로그 변환, 1일/2차 차분 생성
+# (feature_pipeline.CASES_FEATURE_SPEC 참고. 블록별로 ./feature_cache/에 캐시되어
+#  입력 파일과 spec이 그대로면 다시 계산하지 않고 불러온다)
+df = build_features(df, CASES_FEATURE_SPEC, source_path=df_path)
 
 
 '''
@@ -239,36 +214,10 @@ def train_random_forest(train_df, val_df, features, target='Cases'):
     X_val_rf = val_df[features]
     y_val_rf = val_df[target]
 
-    def objective(trial):
-        n_estimators = trial.suggest_categorical("n_estimators", [50, 100, 150])
-        max_depth = trial.suggest_categorical("max_depth", [3, 5, 7, 9])
-        min_samples_leaf = trial.suggest_categorical("min_samples_leaf", [1, 3, 5])
-
-        model = RandomForestRegressor(
-            n_estimators=n_estimators,
-            max_depth=max_depth,
-            min_samples_leaf=min_samples_leaf,
-            random_state=42,
-            n_jobs=-1
-        )
-
-        tscv = TimeSeriesSplit(n_splits=3)
-        mae_list = []
-        for train_index, val_index in tscv.split(X_train_rf):
-            X_train_cv = X_train_rf.iloc[train_index]
-            y_train_cv = y_train_rf.iloc[train_index]
-            X_val_cv = X_train_rf.iloc[val_index]
-            y_val_cv = y_train_rf.iloc[val_index]
-
-            model.fit(X_train_cv, y_train_cv)
-            preds = model.predict(X_val_cv)
-            mae = mean_absolute_error(y_val_cv, preds)
-            mae_list.append(mae)
-
-        return np.mean(mae_list)
-
-    study = optuna.create_study(direction='minimize')
-    study.optimize(objective, n_trials=50)
+    # 병렬 worker + fold 단위 pruning (optuna_runner.RandomForestObjective: 탐색 공간 동일)
+    study = run_study(RandomForestObjective(X_train_rf.values, y_train_rf.values),
+                      study_name='0207_random_forest', n_trials=50, storage=TUNING_STORAGE,
+                      n_workers=N_TUNING_WORKERS, pruner=TUNING_PRUNER)
 
     print("\n[RandomForest] Best trial:")
     print("  MAE:", study.best_trial.value)
@@ -380,12 +329,8 @@ plt.show()
 # 8. LSTM (with Optuna for Hyperparameter Tuning)
 ########################################
 def create_sequences(X, y, window_size):
-    """시퀀스 데이터 생성 함수"""
-    X_seq, y_seq = [], []
-    for i in range(len(X) - window_size):
-        X_seq.append(X[i:i+window_size])
-        y_seq.append(y[i+window_size])
-    return np.array(X_seq), np.array(y_seq)
+    """시퀀스 데이터 생성 함수 (복사 없는 읽기 전용 뷰, sequence_window.make_windows 사용)"""
+    return make_windows(X, y, window_size)
 
 def train_lstm(train_df, test_df, features, target='Cases', window_size=7):
     """LSTM 모델 학습 및 평가 (Optuna 최적화)"""
@@ -401,38 +346,10 @@ def train_lstm(train_df, test_df, features, target='Cases', window_size=7):
     # Create sequences
     X_seq, y_seq = create_sequences(X_scaled, y_scaled, window_size)
 
-    # Optuna Objective Function
-    def objective(trial):
-        n_layers = trial.suggest_int('n_layers', 1, 2)
-        n_units = trial.suggest_int('n_units', 32, 128)
-        dropout_rate = trial.suggest_float('dropout_rate', 0.1, 0.4)
-        lr = trial.suggest_float('lr', 1e-4, 1e-2, log=True)
-
-        model = keras.Sequential()
-        for i in range(n_layers):
-            model.add(LSTM(n_units, return_sequences=(i < n_layers-1)))
-            model.add(Dropout(dropout_rate))
-        model.add(Dense(1))
-
-        optimizer = tf.keras.optimizers.Adam(learning_rate=lr)
-        model.compile(optimizer=optimizer, loss='mse')
-
-        tscv = TimeSeriesSplit(n_splits=3)
-        val_losses = []
-
-        for train_idx, val_idx in tscv.split(X_seq):
-            X_tr, X_val = X_seq[train_idx], X_seq[val_idx]
-            y_tr, y_val = y_seq[train_idx], y_seq[val_idx]
-
-            early_stopping = tf.keras.callbacks.EarlyStopping(monitor='val_loss', patience=5, restore_best_weights=True)
-            history = model.fit(X_tr, y_tr, validation_data=(X_val, y_val), epochs=30, batch_size=32, verbose=0, callbacks=[early_stopping])
-            val_loss = history.history['val_loss'][-1]
-            val_losses.append(val_loss)
-
-        return np.mean(val_losses)
-
-    study = optuna.create_study(direction='minimize')
-    study.optimize(objective, n_trials=20) # 20 trials
+    # Optuna 병렬 튜닝 (optuna_runner.RNNObjective, fold마다 val_loss 보고 -> pruning)
+    study = run_study(RNNObjective(X_seq, y_seq, cell='lstm'),
+                      study_name='0207_lstm', n_trials=20, storage=TUNING_STORAGE,
+                      n_workers=N_TUNING_WORKERS, pruner=TUNING_PRUNER) # 20 trials
 
     print("\n[LSTM] Best trial:")
     print("  Value:", study.best_trial.value)
@@ -497,38 +414,10 @@ def train_gru(train_df, test_df, features, target='Cases', window_size=7):
     # Create sequences
     X_seq, y_seq = create_sequences(X_scaled, y_scaled, window_size)
 
-    # Optuna Objective Function
-    def objective(trial):
-        n_layers = trial.suggest_int('n_layers', 1, 2)
-        n_units = trial.suggest_int('n_units', 32, 128)
-        dropout_rate = trial.suggest_float('dropout_rate', 0.1, 0.4)
-        lr = trial.suggest_float('lr', 1e-4, 1e-2, log=True)
-
-        model = keras.Sequential()
-        for i in range(n_layers):
-            model.add(GRU(n_units, return_sequences=(i < n_layers-1))) # GRU
-            model.add(Dropout(dropout_rate))
-        model.add(Dense(1))
-
-        optimizer = tf.keras.optimizers.Adam(learning_rate=lr)
-        model.compile(optimizer=optimizer, loss='mse')
-
-        tscv = TimeSeriesSplit(n_splits=3)
-        val_losses = []
-
-        for train_idx, val_idx in tscv.split(X_seq):
-            X_tr, X_val = X_seq[train_idx], X_seq[val_idx]
-            y_tr, y_val = y_seq[train_idx], y_seq[val_idx]
-
-            early_stopping = tf.keras.callbacks.EarlyStopping(monitor='val_loss', patience=5, restore_best_weights=True)
-            history = model.fit(X_tr, y_tr, validation_data=(X_val, y_val), epochs=30, batch_size=32, verbose=0, callbacks=[early_stopping])
-            val_loss = history.history['val_loss'][-1]
-            val_losses.append(val_loss)
-
-        return np.mean(val_losses)
-
-    study = optuna.create_study(direction='minimize')
-    study.optimize(objective, n_trials=20)
+    # Optuna 병렬 튜닝 (optuna_runner.RNNObjective, fold마다 val_loss 보고 -> pruning)
+    study = run_study(RNNObjective(X_seq, y_seq, cell='gru'),
+                      study_name='0207_gru', n_trials=20, storage=TUNING_STORAGE,
+                      n_workers=N_TUNING_WORKERS, pruner=TUNING_PRUNER)
 
     print("\n[GRU] Best trial:")
     print("  Value:", study.best_trial.value)
@@ -672,12 +561,6 @@ plt.show()
 # 12. TCN (with Optuna)
 ########################################
 tf.config.run_functions_eagerly(True)
-def create_sequences(X, y, window_size):
-    X_seq, y_seq = [], []
-    for i in range(len(X) - window_size):
-        X_seq.append(X[i:i+window_size])
-        y_seq.append(y[i+window_size])
-    return np.array(X_seq), np.array(y_seq)
 
 def train_tcn(train_df, test_df, features, target='Cases', window_size=14):
     X = train_df[features].values
@@ -690,51 +573,10 @@ def train_tcn(train_df, test_df, features, target='Cases', window_size=14):
 
     X_seq, y_seq = create_sequences(X_scaled, y_scaled, window_size)
 
-    def objective(trial):
-        nb_filters = trial.suggest_int("nb_filters", 32, 128, step=32)
-        kernel_size = trial.suggest_int("kernel_size", 2, 5)
-        dilations = trial.suggest_categorical("dilations", [[1, 2], [1, 2, 4], [1, 2, 4, 8]])
-        dropout_rate = trial.suggest_float("dropout", 0.0, 0.3, step=0.1)
-        lr = trial.suggest_float("lr", 1e-4, 1e-2, log=True)
-        num_layers = trial.suggest_int("num_layers", 1, 2)
-
-        base_model = keras.Sequential()  # 기본 모델 구조
-        base_model.add(InputLayer(input_shape=(X_seq.shape[1], X_seq.shape[2])))
-        for i in range(num_layers):
-            base_model.add(
-                TCN(
-                    nb_filters=nb_filters,
-                    kernel_size=kernel_size,
-                    dilations=dilations,
-                    dropout_rate=dropout_rate,
-                    return_sequences=(i < num_layers - 1)
-                )
-            )
-        base_model.add(Dense(1))
-
-
-        tscv = TimeSeriesSplit(n_splits=3)
-        cv_losses = []
-
-        for train_idx, val_idx in tscv.split(X_seq):
-            X_train_cv, X_val_cv = X_seq[train_idx], X_seq[val_idx]
-            y_train_cv, y_val_cv = y_seq[train_idx], y_seq[val_idx]
-
-            model_cv = keras.models.clone_model(base_model) # 모델 구조 복제
-
-            # 매 루프마다 *새로운* optimizer 생성
-            optimizer = tf.keras.optimizers.Adam(learning_rate=lr)
-            model_cv.compile(optimizer=optimizer, loss="mse") # 컴파일
-
-            model_cv.fit(X_train_cv, y_train_cv, epochs=20, batch_size=32, verbose=0, shuffle=False)
-            val_pred = model_cv.predict(X_val_cv)
-            mse = mean_squared_error(y_val_cv, val_pred)
-            cv_losses.append(mse)
-
-        return np.mean(cv_losses)
-
-    study = optuna.create_study(direction="minimize")
-    study.optimize(objective, n_trials=20, timeout=600)
+    # Optuna 병렬 튜닝 (optuna_runner.TCNObjective, fold마다 MSE 보고 -> pruning)
+    study = run_study(TCNObjective(X_seq, y_seq),
+                      study_name='0207_tcn', n_trials=20, storage=TUNING_STORAGE,
+                      n_workers=N_TUNING_WORKERS, pruner=TUNING_PRUNER, timeout=600)
 
     best_trial = study.best_trial
     best_params = best_trial.params
@@ -894,4 +736,4 @@ for i, v in enumerate(rmse_list):
 plt.tight_layout()
 plt.show()
 
-print("\n=== ALL DONE ===")
\ No newline at end of file
+print("\n=== ALL DONE ===")
\ No newline at end of file
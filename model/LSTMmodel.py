@@ -8,6 +8,7 @@ from tensorflow.keras.layers import LSTM, Dense, Dropout
 from tensorflow.keras.callbacks import EarlyStopping
 from sklearn.metrics import mean_absolute_error, mean_squared_error
 import matplotlib.pyplot as plt
+from sequence_window import make_windows
 
 # 🔹 1. 엑셀 데이터 불러오기
 file_path = "Processed_COVID_Data_Filled_종합.xlsx"
@@ -30,11 +31,8 @@ df_scaled[features] = scaler.fit_transform(df[features])  # 정규화 적용
 
 # 🔹 6. 시퀀스 데이터 생성 (30일 입력)
 def create_sequences(data, target_col, seq_length=60):
-    X, y = [], []
-    for i in range(len(data) - seq_length):
-        X.append(data[i:i+seq_length])
-        y.append(data[i+seq_length, target_col])
-    return np.array(X), np.array(y)
+    # 복사 없이 원본을 공유하는 읽기 전용 뷰로 생성 (sequence_window.make_windows)
+    return make_windows(data, data[:, target_col], seq_length)
 
 # 🔹 7. 입력 데이터 배열 생성 (25개 변수 사용)
 data_values = df_scaled[features].values  # features 리스트 반영
@@ -1,12 +1,14 @@
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.integrate import solve_ivp
-from scipy.optimize import curve_fit
+
+import _paths  # noqa: F401  (csv_cache, figure_batch, weather_index 경로)
+from csv_cache import load_csv
+from sir_f_batch import fit_beta_batch, sweep_beta
 
 # ✅ 데이터 로드
-military_data = pd.read_csv("Processed_COVID_Data_Filled.csv", encoding="ISO-8859-1")
-civil_data = pd.read_csv("Processed_COVID_Data_Filled_Civil_20th.csv", encoding="ISO-8859-1")
+military_data = load_csv("Processed_COVID_Data_Filled.csv")
+civil_data = load_csv("Processed_COVID_Data_Filled_Civil_20th.csv")
 
 # ✅ 날짜 변환
 military_data.rename(columns={"Date": "date", "Cases": "cases"}, inplace=True)
@@ -53,38 +55,30 @@ S0_civil = N_civil - I0_civil - R0_civil
 t_military = np.arange(len(military_cases))
 t_civil = np.arange(len(civil_cases))
 
-# ✅ SIR-F 모델 정의
-def sir_f(t, y, beta, gamma, N):
-    S, I, R = y
-    dSdt = -beta * S * I / N
-    dIdt = beta * S * I / N - gamma * I
-    dRdt = gamma * I
-    return [dSdt, dIdt, dRdt]
-
-# ✅ 최적화 함수 정의
-def fit_sir_f(t, beta, gamma, N, S0, I0, R0):
-    sol = solve_ivp(sir_f, [t[0], t[-1]], [S0, I0, R0], args=(beta, gamma, N), t_eval=t)
-    return sol.y[1]
-
-# ✅ 최적화 실행
-p0_beta = 0.2
-max_nfev = 5000
-
-def optimize_beta(gamma):
-    popt_military, _ = curve_fit(
-        lambda t, beta: fit_sir_f(t, beta, gamma, N_military, S0_military, I0_military, R0_military),
-        t_military, military_cases["cases"], bounds=(0.001, [1]), p0=[p0_beta], max_nfev=max_nfev
-    )
-    popt_civil, _ = curve_fit(
-        lambda t, beta: fit_sir_f(t, beta, gamma, N_civil, S0_civil, I0_civil, R0_civil),
-        t_civil, civil_cases["cases"], bounds=(0.001, [1]), p0=[p0_beta], max_nfev=max_nfev
-    )
-    return popt_military[0], popt_civil[0]
-
-# 최소 및 최대 격리 기간별 감염률(β) 계산
-beta_military_min, beta_civil_min = optimize_beta(gamma_military_min)
-beta_military_max, beta_civil_max = optimize_beta(gamma_military_max)
+# ✅ 최적화 실행 (sir_f_batch: 여러 γ에 대한 β를 한 번의 배치 적분/피팅으로 계산)
+def optimize_beta(cases, t, gammas, N, S0, I0, R0):
+    """ γ 목록 각각에 대해 감염률 β를 동시에 피팅 (bounds는 기존 curve_fit과 동일하게 0.001~1) """
+    betas, _ = fit_beta_batch(t, cases["cases"].values, gammas, N, S0, I0, R0, bounds=(0.001, 1))
+    return betas
+
+# 최소 및 최대 격리 기간별 감염률(β) 계산 (군/민간 각각 자신의 γ 범위 사용)
+beta_military_min, beta_military_max = optimize_beta(
+    military_cases, t_military, [gamma_military_min, gamma_military_max], N_military, S0_military, I0_military, R0_military)
+beta_civil_min, beta_civil_max = optimize_beta(
+    civil_cases, t_civil, [gamma_civil_min, gamma_civil_max], N_civil, S0_civil, I0_civil, R0_civil)
 
 # ✅ 결과 출력
 print(f"군대 감염률 (β) 최소: {beta_military_min:.4f}, 최대: {beta_military_max:.4f}, 회복률 (γ) 최소: {gamma_military_min:.4f}, 최대: {gamma_military_max:.4f}")
 print(f"민간 감염률 (β) 최소: {beta_civil_min:.4f}, 최대: {beta_civil_max:.4f}, 회복률 (γ) 최소: {gamma_civil_min:.4f}, 최대: {gamma_civil_max:.4f}")
+
+# ✅ 회복 기간 전체 구간에 대한 β 곡면 (회복 기간 × 인구, 한 번의 배치 피팅)
+beta_surface_military, _ = sweep_beta(t_military, military_cases["cases"].values,
+                                      range(T_recovery_military_min, T_recovery_military_max + 1),
+                                      [N_military], I0_military, R0_military)
+beta_surface_civil, _ = sweep_beta(t_civil, civil_cases["cases"].values,
+                                   range(T_recovery_civil_min, T_recovery_civil_max + 1),
+                                   [N_civil], I0_civil, R0_civil)
+print("\n군대 회복 기간별 감염률 (β)")
+print(beta_surface_military.round(4))
+print("\n민간 회복 기간별 감염률 (β)")
+print(beta_surface_civil.round(4))
@@ -1,12 +1,15 @@
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.integrate import solve_ivp
+
+import _paths  # noqa: F401  (csv_cache, figure_batch, weather_index 경로)
+from csv_cache import load_csv
 from scipy.optimize import curve_fit
+import sir_f_kernel  # RK4 상태 + β 민감도 적분 (해석적 기울기 포함)
 
 # ✅ 데이터 로드
-military_data = pd.read_csv("Processed_COVID_Data_Filled.csv", encoding="ISO-8859-1")
-civil_data = pd.read_csv("Processed_COVID_Data_Filled_Civil_20th.csv", encoding="ISO-8859-1")
+military_data = load_csv("Processed_COVID_Data_Filled.csv")
+civil_data = load_csv("Processed_COVID_Data_Filled_Civil_20th.csv")
 
 # ✅ 날짜 변환
 military_data.rename(columns={"Date": "date", "Cases": "cases"}, inplace=True)
@@ -51,19 +54,14 @@ S0_civil = N_civil - I0_civil - R0_civil
 t_military = np.arange(len(military_cases))
 t_civil = np.arange(len(civil_cases))
 
-# ✅ SIR-F 모델 정의
-def sir_f(t, y, beta, gamma, N):
-    S, I, R = y
-    dSdt = -beta * S * I / N
-    dIdt = beta * S * I / N - gamma * I
-    dRdt = gamma * I
-    return [dSdt, dIdt, dRdt]
-
 # ✅ 최적화 함수 정의 (감염률 β 찾기) 
 def fit_sir_f(t, beta, gamma, N, S0, I0, R0):
-    """ 감염률 최적화 함수 """
-    sol = solve_ivp(sir_f, [t[0], t[-1]], [S0, I0, R0], args=(beta, gamma, N), t_eval=t)
-    return sol.y[1]  # 감염자 수 반환
+    """ 감염률 최적화 함수 (sir_f_kernel: I(t)와 ∂I/∂β를 한 번의 적분으로 계산) """
+    return sir_f_kernel.fit_sir_f(t, beta, gamma, N, S0, I0, R0)  # 감염자 수 반환
+
+def fit_sir_f_jac(t, beta, gamma, N, S0, I0, R0):
+    """ curve_fit용 해석적 Jacobian (∂I/∂β, 전방 민감도 방정식) """
+    return sir_f_kernel.fit_sir_f_jac(t, beta, gamma, N, S0, I0, R0)
 
 # ✅ 최적화 실행 (β 찾기, 최소값 0.001 이상 설정)
 p0_beta = 0.2  # 초기 감염률 추정값
@@ -72,14 +70,16 @@ max_nfev = 5000  # 최대 반복 횟수 증가
 # 군 데이터 피팅
 popt_military, _ = curve_fit(
     lambda t, beta: fit_sir_f(t, beta, gamma_military, N_military, S0_military, I0_military, R0_military),
-    t_military, military_cases["cases"], bounds=(0.001, [1]), p0=[p0_beta], max_nfev=max_nfev
+    t_military, military_cases["cases"], bounds=(0.001, [1]), p0=[p0_beta], max_nfev=max_nfev,
+    jac=lambda t, beta: fit_sir_f_jac(t, beta, gamma_military, N_military, S0_military, I0_military, R0_military)
 )
 beta_military = popt_military[0]
 
 # 민간 데이터 피팅
 popt_civil, _ = curve_fit(
     lambda t, beta: fit_sir_f(t, beta, gamma_civil, N_civil, S0_civil, I0_civil, R0_civil),
-    t_civil, civil_cases["cases"], bounds=(0.001, [1]), p0=[p0_beta], max_nfev=max_nfev
+    t_civil, civil_cases["cases"], bounds=(0.001, [1]), p0=[p0_beta], max_nfev=max_nfev,
+    jac=lambda t, beta: fit_sir_f_jac(t, beta, gamma_civil, N_civil, S0_civil, I0_civil, R0_civil)
 )
 beta_civil = popt_civil[0]
 
@@ -1,10 +1,13 @@
 import pandas as pd
-import numpy as np
 import matplotlib.pyplot as plt
 
+import _paths  # noqa: F401  (csv_cache, figure_batch, weather_index 경로)
+from csv_cache import load_csv
+from beta_tracker import closed_form_beta, rolling_beta_fit
+
 # ✅ 데이터 로드
-military_data = pd.read_csv("Processed_COVID_Data_Filled.csv", encoding="ISO-8859-1")
-civil_data = pd.read_csv("Processed_COVID_Data_Filled_Civil.csv", encoding="ISO-8859-1")
+military_data = load_csv("Processed_COVID_Data_Filled.csv")
+civil_data = load_csv("Processed_COVID_Data_Filled_Civil.csv")
 
 # ✅ 날짜 변환
 military_data.rename(columns={"Date": "date", "Cases": "cases"}, inplace=True)
@@ -27,31 +30,31 @@ T_recovery_civil = 7      # 민간: 7일
 gamma_military = 1 / T_recovery_military
 gamma_civil = 1 / T_recovery_civil
 
+# ✅ 총 인구 설정 2020년 기준 (구간별 SIR-F 피팅용)
+N_military = 555000      # 군 총 인원
+N_civil = 7038000       # 민간사회 총 인구
+
 # ✅ 감염률 변화 계산 함수 (감염자 수 작을 때 0 처리)
 def compute_beta(cases, gamma, window_size=7, min_infected=3):
     """ 감염률 β 계산 (감염자 수 작으면 0으로 설정) """
-    cases_diff = cases.diff().fillna(0)  # 일일 감염자 증가량 (dI/dt)
-    beta_values = (cases_diff + gamma * cases) / cases.replace(0, np.nan)  # 감염률 계산
-
-    # 감염자 수가 너무 작으면 감염률 0으로 설정
-    beta_values[cases < min_infected] = 0
-
-    # 음수 값 방지 (최소 0으로 설정)
-    beta_values = beta_values.apply(lambda x: max(x, 0) if pd.notna(x) else x)
-
-    # 이동 평균 적용 (급격한 변동 완화)
-    beta_values = beta_values.rolling(window=window_size, min_periods=1).mean()
-
-    return beta_values
+    # β = (dI/dt + γI) / I, 음수는 0, window 이동 평균 -> beta_tracker.closed_form_beta (NumPy 벡터 연산)
+    # 새 데이터가 하루씩 들어오는 경우에는 beta_tracker.BetaTracker.update로 O(1) 갱신 가능
+    return closed_form_beta(cases, gamma, window_size=window_size, min_infected=min_infected)
 
 # ✅ 각 시점의 감염률 계산 (7일 이동 평균)
 military_cases["beta"] = compute_beta(military_cases["cases"], gamma_military, window_size=7)
 civil_cases["beta"] = compute_beta(civil_cases["cases"], gamma_civil, window_size=7)
 
+# ✅ 14일 구간별 SIR-F 피팅 β (이전 구간 결과로 warm start)
+military_cases["beta_fit"] = rolling_beta_fit(military_cases["cases"], gamma_military, N_military, window_size=14)
+civil_cases["beta_fit"] = rolling_beta_fit(civil_cases["cases"], gamma_civil, N_civil, window_size=14)
+
 # ✅ 감염률 변화 그래프
 plt.figure(figsize=(12, 6))
 plt.plot(military_cases.index, military_cases["beta"], label="Military (β)", color="blue")
 plt.plot(civil_cases.index, civil_cases["beta"], label="Civil (β)", color="red")
+plt.plot(military_cases.index, military_cases["beta_fit"], label="Military (β, 14-day SIR-F fit)", color="blue", linestyle="dashed", alpha=0.6)
+plt.plot(civil_cases.index, civil_cases["beta_fit"], label="Civil (β, 14-day SIR-F fit)", color="red", linestyle="dashed", alpha=0.6)
 plt.xlabel("Date")
 plt.ylabel("Estimated β (Infection Rate)")
 plt.title("Time-Dependent Infection Rate (β) in Military vs. Civil Population")
@@ -0,0 +1,133 @@
+###############################################
+# 시간에 따라 변하는 감염률 β 추정 엔진
+###############################################
+# 1) closed_form_beta : SIR-Fmodeltime.py compute_beta와 같은 식을 NumPy로 한 번에 계산 (빠른 경로)
+#      β_t = (ΔI_t + γ·I_t) / I_t   (I_t < min_infected 이면 0, 음수는 0으로 clamp) -> window 이동평균
+# 2) BetaTracker       : 같은 값을 하루에 O(1)로 갱신하는 스트리밍 버전 (새 확진자 수 1개 -> β 1개)
+# 3) rolling_beta_fit  : sliding window마다 SIR-F 모형의 β를 최소제곱 피팅 (이전 window 결과로 warm start)
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from sir_f_batch import fit_beta_batch
+
+
+###############################################
+# 1. 벡터화 closed-form β
+###############################################
+def _raw_beta(cases, prev_cases, gamma, min_infected):
+    """하루치(또는 배열) 원시 β: (ΔI + γI) / I, I가 작으면 0, 음수는 0"""
+    cases = np.asarray(cases, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        beta = (cases - prev_cases + gamma * cases) / np.where(cases == 0, np.nan, cases)
+    beta = np.where(cases < min_infected, 0.0, beta)
+    return np.where(np.isnan(beta), beta, np.maximum(beta, 0.0))
+
+
+def closed_form_beta(cases, gamma, window_size=7, min_infected=3):
+    """
+    compute_beta의 벡터화 버전 (pandas apply/lambda 없이 NumPy 연산만 사용).
+    - cases: 일별 감염자 수 (Series 또는 1D 배열)
+    - gamma: 회복률
+    - window_size: 이동평균 기간 (min_periods=1, NaN은 평균에서 제외)
+    - min_infected: 이보다 작은 감염자 수에서는 β=0
+    - 반환값: cases가 Series면 같은 index의 Series, 아니면 1D 배열
+    """
+    values = np.asarray(cases, dtype=float)
+    prev = np.concatenate([values[:1], values[:-1]])  # diff().fillna(0)와 같게 첫날 증가량은 0
+    beta = _raw_beta(values, prev, gamma, min_infected)
+
+    # NaN을 제외한 rolling mean (min_periods=1)을 누적합으로 계산
+    valid = ~np.isnan(beta)
+    csum = np.concatenate([[0.0], np.cumsum(np.where(valid, beta, 0.0))])
+    ccnt = np.concatenate([[0], np.cumsum(valid)])
+    end = np.arange(1, len(beta) + 1)
+    start = np.maximum(end - window_size, 0)
+    cnt = ccnt[end] - ccnt[start]
+    with np.errstate(invalid='ignore'):
+        smoothed = np.where(cnt > 0, (csum[end] - csum[start]) / np.maximum(cnt, 1), np.nan)
+
+    if isinstance(cases, pd.Series):
+        return pd.Series(smoothed, index=cases.index, name=cases.name)
+    return smoothed
+
+
+###############################################
+# 2. 스트리밍(O(1)) β 갱신
+###############################################
+class BetaTracker:
+    """
+    새 일별 감염자 수가 들어올 때마다 이동평균 β를 O(1)로 갱신한다.
+    closed_form_beta를 전체 기록에 다시 돌린 결과의 마지막 값과 같다.
+
+    tracker = BetaTracker(gamma=0.1, window_size=7)
+    for c in new_cases:
+        beta_today = tracker.update(c)
+    """
+
+    def __init__(self, gamma, window_size=7, min_infected=3):
+        self.gamma = gamma
+        self.window_size = window_size
+        self.min_infected = min_infected
+        self._prev = None
+        self._window = deque()  # 최근 window_size일의 원시 β (NaN 포함)
+        self._sum = 0.0
+        self._count = 0
+
+    def update(self, cases):
+        """오늘 감염자 수를 반영하고 이동평균 β를 반환"""
+        prev = cases if self._prev is None else self._prev
+        beta = float(_raw_beta(cases, prev, self.gamma, self.min_infected))
+        self._prev = cases
+
+        self._window.append(beta)
+        if not np.isnan(beta):
+            self._sum += beta
+            self._count += 1
+        if len(self._window) > self.window_size:
+            old = self._window.popleft()
+            if not np.isnan(old):
+                self._sum -= old
+                self._count -= 1
+
+        return self._sum / self._count if self._count else np.nan
+
+    def update_many(self, cases):
+        """여러 날을 순서대로 반영하고 날짜별 β 배열을 반환"""
+        return np.array([self.update(c) for c in cases])
+
+
+###############################################
+# 3. sliding window SIR-F 피팅 (warm start)
+###############################################
+def rolling_beta_fit(cases, gamma, N, window_size=14, step=1, min_infected=3,
+                     bounds=(0.001, 1), substeps=2):
+    """
+    window_size일 구간마다 SIR-F 모형 I(t)를 관측 감염자 수에 최소제곱 피팅해 β를 구한다.
+    - 구간 시작 시점의 관측값으로 초기 조건을 잡는다. (I0 = 그날 감염자 수, S0 = N - 그때까지 누적 감염자 수)
+    - 이전 구간의 β를 다음 구간의 초기값(p0)으로 사용하므로 구간마다 몇 번의 반복으로 수렴한다.
+    - 감염자 수가 min_infected보다 작은 구간 시작점은 피팅하지 않고 0으로 둔다.
+    - 반환값: 구간의 마지막 날에 β를 기록한 Series/배열 (앞쪽 window_size-1일은 NaN)
+    """
+    values = np.asarray(cases, dtype=float)
+    cum_cases = np.concatenate([[0.0], np.cumsum(values)])
+    t = np.arange(window_size, dtype=float)
+
+    betas = np.full(len(values), np.nan)
+    beta_prev = None
+    for start in range(0, len(values) - window_size + 1, step):
+        end = start + window_size
+        I0 = values[start]
+        if I0 < min_infected:
+            betas[end - 1] = 0.0
+            continue
+        S0 = max(N - cum_cases[start] - I0, 0.0)
+        beta, _ = fit_beta_batch(t, values[start:end], gamma, N, S0, I0, 0,
+                                 bounds=bounds, p0=beta_prev, substeps=substeps)
+        beta_prev = beta[0]
+        betas[end - 1] = beta_prev
+
+    if isinstance(cases, pd.Series):
+        return pd.Series(betas, index=cases.index, name='beta_fit')
+    return betas
@@ -8,6 +8,10 @@ from statsmodels.graphics.tsaplots import plot_acf, plot_pacf
 from math import sqrt
 from sklearn.metrics import mean_squared_error, mean_absolute_error
 
+import _paths  # noqa: F401  (csv_cache, figure_batch, weather_index 경로)
+from csv_cache import load_csv
+from sarimax_rolling import one_step_forecast
+
 ###############################################################################
 # 1. ADF 검정 + 차분 (필요 시)
 ###############################################################################
@@ -48,11 +52,13 @@ def rolling_sarimax_forecast(endog, exog=None,
                              order=(1,0,1),
                              seasonal_order=(0,0,0,0),
                              test_size=10,
-                             freq='D'):
+                             freq='D',
+                             refit_every=None):
     """
     [역할]
       - (endog, exog) 시계열을 주고, SARIMAX로 rolling forecast(1-step ahead) 하는 예시
       - test_size: 뒤쪽 test_size개를 한 스텝씩 예측
+      - refit_every: None이면 초기 파라미터 고정, k면 k 스텝마다 파라미터 재추정
 
     [핵심 포인트: exog 데이터 처리]
       - get_forecast(steps=1, exogenous=…) 할 때,
@@ -93,45 +99,14 @@ def rolling_sarimax_forecast(endog, exog=None,
     print(results.summary())
 
     # 2) 롤링 예측
-    preds = []
-    actuals = []
-    current_results = results
-
-    for i in range(len(test_endog)):
-        this_date = test_endog.index[i]
-        y_true = test_endog.iloc[i]
-
-        # exog 준비
-        if test_exog is not None:
-            # shape=(1, n_features)
-            x_row = test_exog.iloc[[i]]       # i:i+1
-            # 인덱스를 예측할 날짜로!
-            x_row.index = [this_date]
-        else:
-            x_row = None
-
-        # (A) 1-step 예측
-        #     get_forecast(1, exogenous= x_row)
-        # fc = current_results.get_forecast(steps=1, exogenous=x_row)
-        # y_pred = fc.predicted_mean.iloc[0]
-        fc_val = current_results.predict(
-            start=current_results.nobs, 
-            end=current_results.nobs, 
-            exog=x_row
-        )
-        y_pred = fc_val.iloc[0]
-
-        preds.append(y_pred)
-        actuals.append(y_true)
-
-        # (B) 모델 상태 업데이트(append)
-        current_results = current_results.append(
-            endog=[y_true],
-            exog=x_row,
-            refit=False
-        )
-
-    df_res = pd.DataFrame({'actual': actuals, 'pred': preds}, index=test_endog.index)
+    #    (기존: 하루마다 predict -> append(refit=False) 반복, 매번 전체 기간 필터 재실행)
+    #    파라미터가 고정이면 test 구간을 한 번에 append해서 필터를 1회만 돌리고
+    #    1-step-ahead 예측을 한꺼번에 꺼내도 같은 값이 나온다. (sarimax_rolling.one_step_forecast)
+    preds, current_results = one_step_forecast(
+        results, test_endog, test_exog, refit_every=refit_every
+    )
+
+    df_res = pd.DataFrame({'actual': test_endog.values, 'pred': preds.values}, index=test_endog.index)
 
     # RMSE, MAE
     rmse_ = sqrt(mean_squared_error(df_res['actual'], df_res['pred']))
@@ -165,7 +140,7 @@ if __name__ == "__main__":
     #  - 여기서는 가정: df = pd.read_csv('your_data.csv', parse_dates=['Date'], index_col='Date')
     #    ... 사용자 환경에 맞춰 조정!
     print("\n[Load CSV to df ...]")
-    df = pd.read_csv('Processed_COVID_Data_Filled.csv', parse_dates=['Date'], index_col='Date', encoding='ANSI')
+    df = load_csv('Processed_COVID_Data_Filled.csv', parse_dates=['Date'], index_col='Date')
     df.sort_index(inplace=True)
     print(df.head())
     print(df.tail())
@@ -224,4 +199,4 @@ if __name__ == "__main__":
     # (G) 최종 요약
     rmse_ = sqrt(mean_squared_error(df_out['actual'], df_out['pred']))
     mae_  = mean_absolute_error(df_out['actual'], df_out['pred'])
-    print(f"\n[Done] Rolling SARIMAX => RMSE={rmse_:.4f}, MAE={mae_:.4f}")
\ No newline at end of file
+    print(f"\n[Done] Rolling SARIMAX => RMSE={rmse_:.4f}, MAE={mae_:.4f}")
\ No newline at end of file
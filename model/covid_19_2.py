@@ -8,6 +8,10 @@ from statsmodels.graphics.tsaplots import plot_acf
 from math import sqrt
 from sklearn.metrics import mean_squared_error, mean_absolute_error
 
+import _paths  # noqa: F401  (csv_cache, figure_batch, weather_index 경로)
+from csv_cache import load_csv
+from sarimax_rolling import one_step_forecast
+
 ###############################################################################
 # 1. ADF 검정 + 차분 (필요 시)
 ###############################################################################
@@ -30,7 +34,7 @@ def check_stationarity_and_diff(series, alpha=0.05, max_diff=2):
 ###############################################################################
 # 2. SARIMAX Rolling Forecast
 ###############################################################################
-def rolling_sarimax_forecast(endog, exog=None, order=(1, 0, 1), seasonal_order=(0, 0, 0, 0), test_size=10):
+def rolling_sarimax_forecast(endog, exog=None, order=(1, 0, 1), seasonal_order=(0, 0, 0, 0), test_size=10, refit_every=None):
     n = len(endog)
     train_n = n - test_size
     train_endog = endog.iloc[:train_n]
@@ -48,27 +52,11 @@ def rolling_sarimax_forecast(endog, exog=None, order=(1, 0, 1), seasonal_order=(
     )
     results = model.fit(disp=False)
 
-    preds = []
-    actuals = []
-    current_results = results
-
-    for i in range(len(test_endog)):
-        this_date = test_endog.index[i]
-        y_true = test_endog.iloc[i]
-        x_row = test_exog.iloc[[i]] if test_exog is not None else None
-        if x_row is not None:
-            x_row.index = [this_date]
-        fc_val = current_results.predict(
-            start=current_results.nobs,
-            end=current_results.nobs,
-            exog=x_row
-        )
-        y_pred = max(fc_val.iloc[0], 0)
-        preds.append(y_pred)
-        actuals.append(y_true)
-        current_results = current_results.append(endog=[y_true], exog=x_row, refit=False)
+    # test 구간 1-step 예측을 필터 1회로 계산 (refit_every=k면 k 스텝마다 재추정)
+    preds, current_results = one_step_forecast(results, test_endog, test_exog, refit_every=refit_every)
+    preds = preds.clip(lower=0)
 
-    df_res = pd.DataFrame({'actual': actuals, 'pred': preds}, index=test_endog.index)
+    df_res = pd.DataFrame({'actual': test_endog.values, 'pred': preds.values}, index=test_endog.index)
     rmse_ = sqrt(mean_squared_error(df_res['actual'], df_res['pred']))
     mae_ = mean_absolute_error(df_res['actual'], df_res['pred'])
     return df_res, current_results, train_endog, rmse_, mae_
@@ -77,7 +65,7 @@ def rolling_sarimax_forecast(endog, exog=None, order=(1, 0, 1), seasonal_order=(
 # 3. 전체 실행 예시
 ###############################################################################
 if __name__ == "__main__":
-    df = pd.read_csv('Processed_COVID_Data_Filled.csv', parse_dates=['Date'], index_col='Date', encoding='ANSI')
+    df = load_csv('Processed_COVID_Data_Filled.csv', parse_dates=['Date'], index_col='Date')
     df.sort_index(inplace=True)
     target_col = 'Cases'
     exog_cols = [c for c in df.columns if c != target_col]
@@ -0,0 +1,173 @@
+###############################################
+# 선언형 피처 엔지니어링 파이프라인 + 디스크 캐시
+###############################################
+import os
+import re
+import json
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+
+# 블록 연산별 기본 컬럼 접미사
+#   lag          -> {col}_lag{k}      : k 시점 이전 값 (shift)
+#   rolling_mean -> {col}_roll{w}     : w 시점 이동평균 (suffix='ma'이면 {col}_ma{w})
+#   rolling_std  -> {col}_std{w}      : w 시점 이동표준편차
+#   diff         -> {col}_diff / {col}_diff{k} : k 시점 차분 (k=1이면 숫자 생략)
+#   log1p        -> {col}_log         : log(1+x)
+DEFAULT_SUFFIX = {
+    'lag': 'lag',
+    'rolling_mean': 'roll',
+    'rolling_std': 'std',
+    'diff': 'diff',
+    'log1p': 'log',
+}
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    """입력 파일 내용의 SHA-256 해시 (캐시 키의 기준)"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _output_names(block):
+    """블록 spec으로부터 생성될 컬럼 이름 목록을 만든다. (block['out']이 있으면 그대로 사용)"""
+    if 'out' in block:
+        return list(block['out'])
+
+    col = block['col']
+    op = block['op']
+    suffix = block.get('suffix', DEFAULT_SUFFIX[op])
+    if op == 'log1p':
+        return [f"{col}_{suffix}"]
+    if op == 'diff':
+        return [f"{col}_{suffix}" if k == 1 else f"{col}_{suffix}{k}" for k in block.get('args', [1])]
+    return [f"{col}_{suffix}{k}" for k in block['args']]
+
+
+def _compute_block(series, block):
+    """블록 하나를 계산해 새 컬럼들만 담은 DataFrame을 반환한다."""
+    op = block['op']
+    names = _output_names(block)
+
+    if op == 'lag':
+        values = [series.shift(k) for k in block['args']]
+    elif op == 'rolling_mean':
+        values = [series.rolling(w).mean() for w in block['args']]
+    elif op == 'rolling_std':
+        values = [series.rolling(w).std() for w in block['args']]
+    elif op == 'diff':
+        values = [series.diff(k) for k in block.get('args', [1])]
+    elif op == 'log1p':
+        values = [np.log1p(series)]
+    else:
+        raise ValueError(f"지원하지 않는 op: {op}")
+
+    return pd.DataFrame(dict(zip(names, values)), index=series.index)
+
+
+def _block_key(block, input_hash, series):
+    """
+    블록 캐시 키 = 입력 파일 해시 + 블록 spec + 원본 컬럼 내용 해시.
+    - 원본 컬럼이 이전 블록의 결과(예: Cases_lag1 -> Cases_lag1_log)라면,
+      그 내용이 바뀔 때만 키가 바뀌므로 의존 블록만 다시 계산된다.
+    """
+    col_hash = hashlib.sha256(
+        pd.util.hash_pandas_object(series, index=False).values.tobytes()
+    ).hexdigest()
+    payload = json.dumps(
+        {'input': input_hash, 'block': block, 'source': col_hash},
+        sort_keys=True, ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def build_features(df, spec, source_path=None, cache_dir=None, verbose=True):
+    """
+    spec(블록 목록)에 따라 파생 컬럼을 추가한 DataFrame을 반환한다.
+    각 블록은 Parquet 파일로 캐시되며, 키가 같으면 다시 계산하지 않고 불러온다.
+    - df: 원본(전처리 완료) DataFrame. 행 순서가 시간 순서여야 한다.
+    - spec: [{'op': 'lag', 'col': 'Cases', 'args': [1, 7]}, ...] 형태의 블록 목록
+        * op: 'lag', 'rolling_mean', 'rolling_std', 'diff', 'log1p'
+        * col: 원본 컬럼 (앞 블록에서 만든 컬럼도 가능)
+        * args: lag/window/차분 간격 목록
+        * suffix: 컬럼 접미사 변경 (선택), out: 컬럼 이름 직접 지정 (선택)
+    - source_path: df를 읽어 온 CSV 경로. 파일 해시가 캐시 키에 포함된다.
+    - cache_dir: 캐시 폴더 (기본: source_path 옆의 feature_cache/, source_path가 없으면 캐시 사용 안 함)
+    * 결측치(shift/rolling으로 생긴 NaN)는 제거하지 않으므로 필요 시 호출한 쪽에서 dropna 한다.
+    """
+    df_ext = df.copy()
+
+    input_hash = file_sha256(source_path) if source_path else None
+    if cache_dir is None and source_path:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(source_path)), 'feature_cache')
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+
+    for block in spec:
+        if block['col'] not in df_ext.columns:
+            if verbose:
+                print(f"[Feature] {block['col']} 컬럼 없음 -> skip")
+            continue
+        series = df_ext[block['col']]
+
+        cache_path = None
+        if cache_dir:
+            key = _block_key(block, input_hash, series)
+            safe_col = re.sub(r'[^\w]+', '_', block['col'])  # 파일명에 쓸 수 없는 문자(/, 괄호 등) 치환
+            cache_path = os.path.join(cache_dir, f"{safe_col}_{block['op']}_{key}.parquet")
+
+        if cache_path and os.path.exists(cache_path):
+            block_df = pd.read_parquet(cache_path)
+            block_df.index = df_ext.index
+            status = 'cache'
+        else:
+            block_df = _compute_block(series, block)
+            if cache_path:
+                block_df.reset_index(drop=True).to_parquet(cache_path)
+            status = 'computed'
+
+        for c in block_df.columns:
+            df_ext[c] = block_df[c]
+        if verbose:
+            print(f"[Feature] {block['op']}({block['col']}) -> {list(block_df.columns)} [{status}]")
+
+    return df_ext
+
+
+def lag_roll_spec(lag_features=None, roll_features=None):
+    """
+    {'컬럼명': [1, 2]} 형태의 lag_features / roll_features 설정을 build_features용 spec으로 변환한다.
+    (0120 스크립트의 create_feature_engineering과 같은 컬럼 이름: {col}_lag{k}, {col}_roll{w})
+    """
+    spec = []
+    for col, lags in (lag_features or {}).items():
+        spec.append({'op': 'lag', 'col': col, 'args': list(lags)})
+    for col, windows in (roll_features or {}).items():
+        spec.append({'op': 'rolling_mean', 'col': col, 'args': list(windows)})
+    return spec
+
+
+# 0207 스크립트의 확진자(Cases) 파생 변수 spec
+CASES_FEATURE_SPEC = [
+    # 1,5,7,14일 전 확진자 수
+    {'op': 'lag', 'col': 'Cases', 'args': [1, 5, 7, 14]},
+    # 최근 5/7/14일 이동평균(추세) / 이동표준편차(변동성)
+    {'op': 'rolling_mean', 'col': 'Cases', 'args': [5, 7, 14], 'suffix': 'ma'},
+    {'op': 'rolling_std', 'col': 'Cases', 'args': [5, 7, 14]},
+    # 로그 변환 log(1+x)
+    {'op': 'log1p', 'col': 'Cases'},
+    # 1일 차분 (어제 vs 오늘 증감)
+    {'op': 'diff', 'col': 'Cases', 'args': [1]},
+    # 1일/7일 전 확진자 수의 로그 변환
+    {'op': 'log1p', 'col': 'Cases_lag1'},
+    {'op': 'log1p', 'col': 'Cases_lag7'},
+    # 1일 전 확진자 수의 1일 차분
+    {'op': 'diff', 'col': 'Cases_lag1', 'args': [1]},
+    # 2차 차분 (변화량의 변화량)
+    {'op': 'diff', 'col': 'Cases_diff', 'args': [1], 'out': ['Cases_diff2']},
+]
@@ -0,0 +1,341 @@
+###############################################
+# Optuna 병렬 튜닝 러너 (공유 스토리지 + fold 단위 pruning + 이어서 실행)
+###############################################
+# - 여러 worker 프로세스가 같은 스토리지(Journal 파일 또는 SQLite)에 붙어서 trial을 동시에 실행한다.
+# - objective는 TimeSeriesSplit의 fold가 끝날 때마다 누적 평균 loss를 trial.report로 보고하고,
+#   Median/Hyperband pruner가 가망 없는 trial을 첫 fold 이후 바로 중단시킨다.
+# - study_name + 스토리지가 같으면 중단된 study를 이어서 실행한다. (완료/pruned trial 수 기준으로 n_trials까지)
+#   실제 study 이름은 '<study_name>-<objective 지문>'이라 데이터/특성/타깃이나 탐색 공간이 바뀌면
+#   예전 study(와 best_params)를 불러오지 않고 새 study로 시작한다.
+#
+# worker는 multiprocessing이 아니라 별도 python 프로세스로 띄운다.
+# 0207 스크립트처럼 __main__ 가드 없이 위에서부터 실행되는 스크립트를 spawn 방식으로 다시 import하면
+# 스크립트 전체가 worker마다 다시 실행되기 때문이다. objective는 이 모듈의 클래스 인스턴스(데이터 포함)를
+# pickle로 넘기므로 worker는 이 모듈만 import 한다.
+import os
+import sys
+import pickle
+import hashlib
+import inspect
+import tempfile
+import subprocess
+
+import numpy as np
+import optuna
+from optuna.trial import TrialState
+from sklearn.model_selection import TimeSeriesSplit
+from sklearn.metrics import mean_absolute_error, mean_squared_error
+from sklearn.ensemble import RandomForestRegressor
+
+try:
+    from optuna.storages.journal import JournalFileBackend, JournalFileOpenLock
+except ImportError:  # optuna 3.x
+    from optuna.storages import JournalFileStorage as JournalFileBackend
+    from optuna.storages import JournalFileOpenLock
+
+
+DEFAULT_STORAGE = 'optuna_journal.log'
+
+
+###############################################
+# 1. 스토리지 / pruner
+###############################################
+def make_storage(storage=DEFAULT_STORAGE):
+    """
+    - 'sqlite:///...' 등 URL이면 그대로 RDB 스토리지로 사용
+    - 그 외에는 Journal 파일 경로로 보고 JournalStorage 생성
+      (여러 프로세스가 동시에 써도 안전하고, Windows에서도 동작하도록 open lock 사용)
+    - None이면 InMemoryStorage (현재 프로세스에서 만든 객체 안에만 남으므로 한 번 만들어 재사용해야 함)
+    - 이미 만든 스토리지 객체는 그대로 반환
+    """
+    if storage is None:
+        return optuna.storages.InMemoryStorage()
+    if not isinstance(storage, str):
+        return storage
+    if '://' in storage:
+        return storage
+    backend = JournalFileBackend(storage, lock_obj=JournalFileOpenLock(storage))
+    return optuna.storages.JournalStorage(backend)
+
+
+def make_pruner(pruner='median', n_folds=3):
+    """
+    - 'median'   : 같은 fold까지의 중간값보다 나쁘면 중단 (처음 5개 trial은 pruning 안 함)
+    - 'hyperband': fold 수를 자원(resource)으로 보는 Hyperband
+    - None/'none': pruning 사용 안 함
+    """
+    if pruner == 'median':
+        return optuna.pruners.MedianPruner(n_startup_trials=5, n_warmup_steps=0)
+    if pruner == 'hyperband':
+        return optuna.pruners.HyperbandPruner(min_resource=1, max_resource=n_folds, reduction_factor=3)
+    if pruner in (None, 'none'):
+        return optuna.pruners.NopPruner()
+    return pruner
+
+
+def objective_fingerprint(objective):
+    """objective 입력의 SHA-256 앞 12자리 (클래스와 탐색 공간 코드, X/y 모양·dtype·내용, 그 밖의 설정)"""
+    h = hashlib.sha256()
+    cls = type(objective)
+    h.update(f'{cls.__module__}.{cls.__qualname__}'.encode())
+    try:
+        h.update(inspect.getsource(cls.__call__).encode())  # suggest_* 탐색 공간이 바뀌면 지문도 바뀜
+    except (OSError, TypeError):
+        pass
+    for key, value in sorted(vars(objective).items()):
+        h.update(key.encode())
+        if isinstance(value, np.ndarray):
+            h.update(repr((value.shape, value.dtype.str)).encode())
+            h.update(np.ascontiguousarray(value).tobytes())
+        else:
+            h.update(repr(value).encode())
+    return h.hexdigest()[:12]
+
+
+def _finished_count(study):
+    return len(study.get_trials(deepcopy=False, states=(TrialState.COMPLETE, TrialState.PRUNED)))
+
+
+def _run_worker(objective, study_name, storage, n_trials, timeout, seed, pruner):
+    """worker 1개: study를 불러와 전체 완료 trial 수가 n_trials에 도달할 때까지 실행"""
+    study = optuna.load_study(
+        study_name=study_name,
+        storage=make_storage(storage),
+        sampler=optuna.samplers.TPESampler(seed=seed),
+        pruner=make_pruner(pruner, getattr(objective, 'n_splits', 3)),
+    )
+    if _finished_count(study) >= n_trials:
+        return
+    stop = optuna.study.MaxTrialsCallback(n_trials, states=(TrialState.COMPLETE, TrialState.PRUNED))
+    study.optimize(objective, timeout=timeout, callbacks=[stop], gc_after_trial=True)
+
+
+###############################################
+# 2. 병렬 실행
+###############################################
+def run_study(objective, study_name, n_trials, storage=DEFAULT_STORAGE, n_workers=None,
+              pruner='median', direction='minimize', timeout=None, seed=42):
+    """
+    objective를 n_workers개 프로세스에서 동시에 실행하고 study를 반환한다.
+    - objective: 이 모듈의 *Objective 인스턴스 (pickle 가능한 callable)
+    - study_name: study 이름의 앞부분. 실제 이름은 '<study_name>-<objective_fingerprint>'이고,
+      이름(= 같은 입력과 탐색 공간)이 같을 때만 이전 실행을 이어서 한다.
+    - n_trials: 목표 trial 수 (완료 + pruned 합계, 이미 끝난 trial 포함)
+    - storage: Journal 파일 경로 또는 'sqlite:///tuning.db' 같은 URL
+      (None 또는 스토리지 객체는 n_workers=1에서만: worker 프로세스가 같은 파일/DB에 붙어야 하므로)
+    - n_workers: worker 프로세스 수 (기본: CPU 코어 수). 1이면 현재 프로세스에서 실행
+    - pruner: 'median', 'hyperband', None
+    - timeout: worker별 최대 실행 시간(초)
+    """
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    if n_workers > 1 and not isinstance(storage, str):
+        raise ValueError("n_workers > 1에는 worker 프로세스가 함께 쓸 Journal 파일 경로나 DB URL storage가 필요합니다 "
+                         f"(storage={storage!r}); 메모리 스토리지는 n_workers=1로 실행하세요")
+
+    fingerprint = objective_fingerprint(objective)
+    study_name = f'{study_name}-{fingerprint}'
+    storage_obj = make_storage(storage)  # 한 번 만들어 create/worker/load가 같은 스토리지를 쓴다
+    study = optuna.create_study(
+        study_name=study_name,
+        storage=storage_obj,
+        direction=direction,
+        load_if_exists=True,
+    )
+    study.set_user_attr('objective_fingerprint', fingerprint)
+    done = _finished_count(study)
+    print(f"[Optuna] {study_name}: {done}/{n_trials} trials 완료된 상태에서 시작 (workers={n_workers})")
+
+    if done < n_trials:
+        if n_workers == 1:
+            _run_worker(objective, study_name, storage_obj, n_trials, timeout, seed, pruner)
+        else:
+            _run_worker_processes(objective, study_name, storage, n_trials, timeout, seed, pruner, n_workers)
+
+    study = optuna.load_study(study_name=study_name, storage=storage_obj)
+    n_pruned = len(study.get_trials(deepcopy=False, states=(TrialState.PRUNED,)))
+    print(f"[Optuna] {study_name}: 완료 {_finished_count(study) - n_pruned}, pruned {n_pruned}")
+    return study
+
+
+def _run_worker_processes(objective, study_name, storage, n_trials, timeout, seed, pruner, n_workers):
+    """objective를 pickle 파일로 저장하고 worker 프로세스 n_workers개를 띄운다."""
+    # worker마다 코어를 나눠 쓰도록 BLAS/TF 스레드 수 제한 (과다 구독 방지)
+    threads = str(max((os.cpu_count() or 1) // n_workers, 1))
+    env = dict(os.environ)
+    env.update({'OMP_NUM_THREADS': threads, 'MKL_NUM_THREADS': threads,
+                'TF_NUM_INTRAOP_THREADS': threads, 'TF_NUM_INTEROP_THREADS': '1',
+                'TF_CPP_MIN_LOG_LEVEL': '2'})
+    module_dir = os.path.dirname(os.path.abspath(__file__))
+    env['PYTHONPATH'] = module_dir + os.pathsep + env.get('PYTHONPATH', '')
+
+    fd, payload_path = tempfile.mkstemp(suffix='.pkl', prefix=f'{study_name}_')
+    with os.fdopen(fd, 'wb') as f:
+        pickle.dump(objective, f)
+
+    try:
+        procs = []
+        for i in range(n_workers):
+            args = [sys.executable, '-m', 'optuna_runner', payload_path, study_name,
+                    storage, str(n_trials), str(timeout or 0), str(seed + i), str(pruner)]
+            procs.append(subprocess.Popen(args, env=env))
+        codes = [p.wait() for p in procs]
+    finally:
+        os.remove(payload_path)
+
+    if any(codes):
+        raise RuntimeError(f"[Optuna] worker 실패 (exit codes={codes}). 같은 study_name으로 다시 실행하면 이어서 진행합니다.")
+
+
+###############################################
+# 3. Objective (0207 스크립트의 탐색 공간 그대로)
+###############################################
+class RandomForestObjective:
+    """RandomForest: TimeSeriesSplit fold별 MAE 평균 최소화"""
+
+    def __init__(self, X, y, n_splits=3):
+        self.X = np.asarray(X)
+        self.y = np.asarray(y)
+        self.n_splits = n_splits
+
+    def __call__(self, trial):
+        n_estimators = trial.suggest_categorical("n_estimators", [50, 100, 150])
+        max_depth = trial.suggest_categorical("max_depth", [3, 5, 7, 9])
+        min_samples_leaf = trial.suggest_categorical("min_samples_leaf", [1, 3, 5])
+
+        model = RandomForestRegressor(
+            n_estimators=n_estimators,
+            max_depth=max_depth,
+            min_samples_leaf=min_samples_leaf,
+            random_state=42,
+            n_jobs=1  # 병렬화는 trial 단위로 하므로 모델 내부는 단일 스레드
+        )
+
+        tscv = TimeSeriesSplit(n_splits=self.n_splits)
+        mae_list = []
+        for fold, (train_index, val_index) in enumerate(tscv.split(self.X)):
+            model.fit(self.X[train_index], self.y[train_index])
+            preds = model.predict(self.X[val_index])
+            mae_list.append(mean_absolute_error(self.y[val_index], preds))
+
+            trial.report(np.mean(mae_list), step=fold)
+            if trial.should_prune():
+                raise optuna.TrialPruned()
+
+        return np.mean(mae_list)
+
+
+class RNNObjective:
+    """LSTM/GRU: fold별 마지막 val_loss 평균 최소화 (cell='lstm' 또는 'gru')"""
+
+    def __init__(self, X_seq, y_seq, cell='lstm', n_splits=3):
+        self.X_seq = np.ascontiguousarray(X_seq)
+        self.y_seq = np.array(y_seq)
+        self.cell = cell
+        self.n_splits = n_splits
+
+    def __call__(self, trial):
+        import tensorflow as tf
+        from tensorflow import keras
+        from tensorflow.keras.layers import LSTM, GRU, Dense, Dropout
+
+        n_layers = trial.suggest_int('n_layers', 1, 2)
+        n_units = trial.suggest_int('n_units', 32, 128)
+        dropout_rate = trial.suggest_float('dropout_rate', 0.1, 0.4)
+        lr = trial.suggest_float('lr', 1e-4, 1e-2, log=True)
+
+        Cell = LSTM if self.cell == 'lstm' else GRU
+        model = keras.Sequential()
+        for i in range(n_layers):
+            model.add(Cell(n_units, return_sequences=(i < n_layers-1)))
+            model.add(Dropout(dropout_rate))
+        model.add(Dense(1))
+
+        optimizer = tf.keras.optimizers.Adam(learning_rate=lr)
+        model.compile(optimizer=optimizer, loss='mse')
+
+        tscv = TimeSeriesSplit(n_splits=self.n_splits)
+        val_losses = []
+        for fold, (train_idx, val_idx) in enumerate(tscv.split(self.X_seq)):
+            X_tr, X_val = self.X_seq[train_idx], self.X_seq[val_idx]
+            y_tr, y_val = self.y_seq[train_idx], self.y_seq[val_idx]
+
+            early_stopping = tf.keras.callbacks.EarlyStopping(monitor='val_loss', patience=5, restore_best_weights=True)
+            history = model.fit(X_tr, y_tr, validation_data=(X_val, y_val), epochs=30, batch_size=32, verbose=0, callbacks=[early_stopping])
+            val_losses.append(history.history['val_loss'][-1])
+
+            trial.report(np.mean(val_losses), step=fold)
+            if trial.should_prune():
+                keras.backend.clear_session()
+                raise optuna.TrialPruned()
+
+        keras.backend.clear_session()
+        return np.mean(val_losses)
+
+
+class TCNObjective:
+    """TCN: fold마다 구조를 복제(clone)한 새 모델로 학습, fold별 MSE 평균 최소화"""
+
+    def __init__(self, X_seq, y_seq, n_splits=3):
+        self.X_seq = np.ascontiguousarray(X_seq)
+        self.y_seq = np.array(y_seq)
+        self.n_splits = n_splits
+
+    def __call__(self, trial):
+        import tensorflow as tf
+        from tensorflow import keras
+        from tensorflow.keras.layers import Dense, InputLayer
+        from tcn import TCN
+
+        nb_filters = trial.suggest_int("nb_filters", 32, 128, step=32)
+        kernel_size = trial.suggest_int("kernel_size", 2, 5)
+        dilations = trial.suggest_categorical("dilations", [[1, 2], [1, 2, 4], [1, 2, 4, 8]])
+        dropout_rate = trial.suggest_float("dropout", 0.0, 0.3, step=0.1)
+        lr = trial.suggest_float("lr", 1e-4, 1e-2, log=True)
+        num_layers = trial.suggest_int("num_layers", 1, 2)
+
+        base_model = keras.Sequential()  # 기본 모델 구조
+        base_model.add(InputLayer(input_shape=(self.X_seq.shape[1], self.X_seq.shape[2])))
+        for i in range(num_layers):
+            base_model.add(
+                TCN(
+                    nb_filters=nb_filters,
+                    kernel_size=kernel_size,
+                    dilations=dilations,
+                    dropout_rate=dropout_rate,
+                    return_sequences=(i < num_layers - 1)
+                )
+            )
+        base_model.add(Dense(1))
+
+        tscv = TimeSeriesSplit(n_splits=self.n_splits)
+        cv_losses = []
+        for fold, (train_idx, val_idx) in enumerate(tscv.split(self.X_seq)):
+            X_train_cv, X_val_cv = self.X_seq[train_idx], self.X_seq[val_idx]
+            y_train_cv, y_val_cv = self.y_seq[train_idx], self.y_seq[val_idx]
+
+            model_cv = keras.models.clone_model(base_model)  # 모델 구조 복제
+            model_cv.compile(optimizer=tf.keras.optimizers.Adam(learning_rate=lr), loss="mse")
+            model_cv.fit(X_train_cv, y_train_cv, epochs=20, batch_size=32, verbose=0, shuffle=False)
+            val_pred = model_cv.predict(X_val_cv, verbose=0)
+            cv_losses.append(mean_squared_error(y_val_cv, val_pred))
+
+            trial.report(np.mean(cv_losses), step=fold)
+            if trial.should_prune():
+                keras.backend.clear_session()
+                raise optuna.TrialPruned()
+
+        keras.backend.clear_session()
+        return np.mean(cv_losses)
+
+
+###############################################
+# 4. worker 진입점 (python -m optuna_runner ...)
+###############################################
+if __name__ == "__main__":
+    payload_path, study_name, storage, n_trials, timeout, seed, pruner = sys.argv[1:8]
+    with open(payload_path, 'rb') as f:
+        objective = pickle.load(f)
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    _run_worker(objective, study_name, storage, int(n_trials), float(timeout) or None,
+                int(seed), None if pruner == 'None' else pruner)
@@ -0,0 +1,52 @@
+###############################################################################
+# SARIMAX 1-step rolling forecast (칼만 필터 1회 실행)
+###############################################################################
+# covid_19_1.py / covid_19_2.py의 rolling_sarimax_forecast는 test 구간을 하루씩 돌며
+#   predict(start=nobs, end=nobs) -> append([y_true], refit=False)
+# 를 반복한다. append마다 결과 객체를 새로 만들고 전체 기간에 필터를 다시 돌리므로
+# test 길이 T에 대해 O(T * n) 이다.
+# 파라미터가 고정(refit=False)이면 "t 시점까지 필터링한 상태로 t+1을 예측"한 값은
+# train+test 전체에 필터를 한 번 돌렸을 때의 1-step-ahead 예측(predict, dynamic=False)과 같다.
+# 그래서 test 구간을 한 번에 append하고 1-step 예측을 한꺼번에 꺼낸다. (O(n))
+import pandas as pd
+
+
+def one_step_forecast(results, test_endog, test_exog=None, refit_every=None, fit_kwargs=None):
+    """
+    train 구간에 피팅된 SARIMAX 결과(results)로 test 구간의 1-step-ahead 예측을 구한다.
+    - results: train 데이터로 fit한 SARIMAXResults
+    - test_endog: test 구간 실제값 (Series)
+    - test_exog: test 구간 exog (DataFrame, 없으면 None)
+    - refit_every: None이면 파라미터 고정 (기존 append(refit=False) 루프와 같은 결과).
+                   정수 k면 k 스텝마다 그때까지의 데이터로 파라미터를 다시 추정
+                   (이전 파라미터를 start_params로 사용) 후 다음 k 스텝을 한 번에 필터링
+    - fit_kwargs: 재추정 시 model.fit에 넘길 옵션 (기본 disp=False)
+    - 반환값: (preds, final_results)
+        preds: test_endog와 같은 index의 1-step 예측 Series
+        final_results: test 구간까지 반영된 결과 객체 (기존 루프의 마지막 current_results와 같음)
+    """
+    fit_kwargs = dict({'disp': False}, **(fit_kwargs or {}))
+    n_test = len(test_endog)
+    block = refit_every or n_test
+
+    preds = []
+    current = results
+    for start in range(0, n_test, block):
+        stop = min(start + block, n_test)
+
+        if start > 0 and refit_every:
+            # 지금까지 반영된 데이터(train + test[:start])로 같은 모형 재추정
+            data = current.model.data
+            model = current.model.clone(data.orig_endog, exog=data.orig_exog)
+            current = model.fit(start_params=current.params, **fit_kwargs)
+
+        endog_blk = test_endog.iloc[start:stop]
+        exog_blk = test_exog.iloc[start:stop] if test_exog is not None else None
+
+        # 블록 전체를 한 번에 필터링 -> 블록 구간의 1-step-ahead 예측
+        extended = current.append(endog_blk, exog=exog_blk, refit=False)
+        pred_blk = extended.predict(start=current.nobs, end=extended.nobs - 1)
+        preds.extend(list(pred_blk))
+        current = extended
+
+    return pd.Series(preds, index=test_endog.index, name='pred'), current
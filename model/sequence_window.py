@@ -0,0 +1,56 @@
+###############################################
+# RNN/TCN 공용 시퀀스(슬라이딩 윈도우) 생성 모듈
+###############################################
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def make_windows(X, y, window_size, copy=False):
+    """
+    window 길이만큼 슬라이딩 윈도우로 시퀀스 데이터를 생성합니다.
+    예) window_size=4일 때
+        i=0~3 입력 -> i=4 예측
+        i=1~4 입력 -> i=5 예측 ...
+    - X: (샘플 수, feature 수) 2D 배열
+    - y: X와 길이가 같은 1D 타겟 배열
+    - copy: False면 원본 메모리를 공유하는 읽기 전용 뷰(strided view)를 반환 (복사/할당 없음)
+            True면 프레임워크에 넘길 연속(contiguous) 배열로 한 번만 복사
+    - 반환값: X_seq [샘플 수-window, window, feature 수], y_seq [샘플 수-window]
+      (기존 Python 루프 + np.array 방식과 같은 값/shape)
+    """
+    X = np.asarray(X)
+    y = np.asarray(y)
+    n_windows = max(len(X) - window_size, 0)
+
+    # 데이터가 window보다 짧으면 빈 시퀀스 반환
+    if n_windows == 0:
+        return np.empty((0, window_size) + X.shape[1:], dtype=X.dtype), y[:0].copy()
+
+    # sliding_window_view: (n-window+1, feature 수, window) -> 축 교환으로 (n-window+1, window, feature 수)
+    # 마지막 윈도우는 예측할 다음 시점이 없으므로 제외
+    X_seq = sliding_window_view(X, window_size, axis=0).swapaxes(1, 2)[:n_windows]
+    y_seq = y[window_size:window_size + n_windows]
+
+    if copy:
+        return np.ascontiguousarray(X_seq), np.array(y_seq)
+
+    y_seq = y_seq.view()
+    y_seq.flags.writeable = False
+    return X_seq, y_seq
+
+
+def iter_window_batches(X, y, window_size, batch_size=256, copy=True):
+    """
+    make_windows와 같은 시퀀스를 batch_size개씩 나누어 yield하는 제너레이터.
+    - 전체 [샘플 수, window, feature 수] 배열을 한 번에 만들지 않으므로
+      window가 크거나 데이터가 길어도 메모리 사용량은 배치 하나 크기로 제한된다.
+    - copy: True면 각 배치를 연속 배열로 복사해서 반환 (Keras 등 프레임워크 입력용)
+    """
+    X_seq, y_seq = make_windows(X, y, window_size, copy=False)
+    for start in range(0, len(X_seq), batch_size):
+        X_batch = X_seq[start:start + batch_size]
+        y_batch = y_seq[start:start + batch_size]
+        if copy:
+            X_batch = np.ascontiguousarray(X_batch)
+            y_batch = np.array(y_batch)
+        yield X_batch, y_batch
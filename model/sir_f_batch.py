@@ -0,0 +1,209 @@
+###############################################
+# 배치(벡터화) SIR-F 솔버 + β 피팅 / 그리드 스윕
+###############################################
+# SIR-F 스크립트의 sir_f / fit_sir_f와 같은 모형(S, I, R)을
+# 여러 (beta, gamma, N, S0, I0, R0) 조합에 대해 한 번에 적분한다.
+#   dS/dt = -β S I / N
+#   dI/dt =  β S I / N - γ I
+#   dR/dt =  γ I
+# - 고정 스텝 RK4 (하루를 substeps개로 나눔)를 NumPy 배열 (조합 수,) 단위로 계산하므로
+#   Python RHS를 조합마다 solve_ivp로 부르는 것보다 훨씬 빠르다.
+# - β 피팅은 β에 대한 민감도(∂S/∂β, ∂I/∂β)를 같이 적분해 정확한 기울기로
+#   모든 조합을 동시에 Levenberg-Marquardt 방식으로 푼다. (curve_fit과 같은 최소제곱 기준)
+import numpy as np
+import pandas as pd
+
+
+###############################################
+# 1. 배치 적분
+###############################################
+def _broadcast_params(*params):
+    """스칼라/배열 파라미터를 같은 1D 배열 모양 (조합 수,)으로 맞춘다."""
+    arrs = np.broadcast_arrays(*[np.asarray(p, dtype=float) for p in params])
+    return [a.reshape(-1).copy() for a in arrs]
+
+
+def _rhs(S, I, beta, gamma, N):
+    force = beta * S * I / N
+    return -force, force - gamma * I
+
+
+def _rhs_sens(S, I, Sb, Ib, beta, gamma, N):
+    """상태 (S, I)와 β 민감도 (Sb=∂S/∂β, Ib=∂I/∂β)의 미분"""
+    SI_N = S * I / N
+    force = beta * SI_N
+    d_force = SI_N + beta * (Sb * I + S * Ib) / N  # ∂(β S I / N)/∂β
+    return -force, force - gamma * I, -d_force, d_force - gamma * Ib
+
+
+def simulate_sir_batch(t, beta, gamma, N, S0, I0, R0=0, substeps=4, return_all=False):
+    """
+    여러 파라미터 조합의 SIR-F 경로를 한 번에 적분한다.
+    - t: 관측 시점 (일 단위 정수 간격, 예: np.arange(len(cases)))
+    - beta, gamma, N, S0, I0, R0: 스칼라 또는 배열 (브로드캐스트되어 조합 수 P가 됨)
+    - substeps: 하루를 몇 개의 RK4 스텝으로 나눌지 (4면 solve_ivp 기본 허용오차보다 정확)
+    - return_all: True면 (S, I, R) 모두 반환
+    - 반환값: I [P, len(t)] (return_all=True면 S, I, R 각각 [P, len(t)])
+    """
+    t = np.asarray(t, dtype=float)
+    beta, gamma, N, S, I, R0 = _broadcast_params(beta, gamma, N, S0, I0, R0)
+    total = S + I + R0  # R은 보존식으로 복원 (R = S0+I0+R0 - S - I)
+
+    S_out = np.empty((len(beta), len(t)))
+    I_out = np.empty((len(beta), len(t)))
+    S_out[:, 0], I_out[:, 0] = S, I
+
+    for k in range(1, len(t)):
+        h = (t[k] - t[k - 1]) / substeps
+        for _ in range(substeps):
+            k1s, k1i = _rhs(S, I, beta, gamma, N)
+            k2s, k2i = _rhs(S + 0.5 * h * k1s, I + 0.5 * h * k1i, beta, gamma, N)
+            k3s, k3i = _rhs(S + 0.5 * h * k2s, I + 0.5 * h * k2i, beta, gamma, N)
+            k4s, k4i = _rhs(S + h * k3s, I + h * k3i, beta, gamma, N)
+            S = S + h / 6 * (k1s + 2 * k2s + 2 * k3s + k4s)
+            I = I + h / 6 * (k1i + 2 * k2i + 2 * k3i + k4i)
+        S_out[:, k], I_out[:, k] = S, I
+
+    if return_all:
+        return S_out, I_out, total[:, None] - S_out - I_out
+    return I_out
+
+
+def simulate_with_sensitivity(t, beta, gamma, N, S0, I0, substeps):
+    """
+    I 경로와 ∂I/∂β 경로를 함께 적분한다. (fit_beta_batch와 sir_f_kernel의 NumPy 경로에서 사용)
+    - beta, gamma, N, S0, I0: 같은 길이 P의 1D float 배열
+    - 반환값: I [P, len(t)], ∂I/∂β [P, len(t)]
+    """
+    S, I = S0.copy(), I0.copy()
+    Sb, Ib = np.zeros_like(S), np.zeros_like(I)
+
+    I_out = np.empty((len(beta), len(t)))
+    Ib_out = np.empty((len(beta), len(t)))
+    I_out[:, 0], Ib_out[:, 0] = I, Ib
+
+    for k in range(1, len(t)):
+        h = (t[k] - t[k - 1]) / substeps
+        for _ in range(substeps):
+            a = _rhs_sens(S, I, Sb, Ib, beta, gamma, N)
+            b = _rhs_sens(S + 0.5 * h * a[0], I + 0.5 * h * a[1], Sb + 0.5 * h * a[2], Ib + 0.5 * h * a[3], beta, gamma, N)
+            c = _rhs_sens(S + 0.5 * h * b[0], I + 0.5 * h * b[1], Sb + 0.5 * h * b[2], Ib + 0.5 * h * b[3], beta, gamma, N)
+            d = _rhs_sens(S + h * c[0], I + h * c[1], Sb + h * c[2], Ib + h * c[3], beta, gamma, N)
+            S = S + h / 6 * (a[0] + 2 * b[0] + 2 * c[0] + d[0])
+            I = I + h / 6 * (a[1] + 2 * b[1] + 2 * c[1] + d[1])
+            Sb = Sb + h / 6 * (a[2] + 2 * b[2] + 2 * c[2] + d[2])
+            Ib = Ib + h / 6 * (a[3] + 2 * b[3] + 2 * c[3] + d[3])
+        I_out[:, k], Ib_out[:, k] = I, Ib
+
+    return I_out, Ib_out
+
+
+###############################################
+# 2. 배치 β 피팅 (최소제곱, 경계 포함 Levenberg-Marquardt)
+###############################################
+def _grid_start(t, y, gamma, N, S0, I0, lo, hi, n_grid, substeps):
+    """
+    β 후보 n_grid개를 모든 조합에 대해 한 번의 배치 적분으로 평가해 SSE 최소 β를 고른다.
+    - I(t) ≈ I0·exp((β-γ)t)라서 SSE의 골짜기는 β-γ(순증가율) 근처에서 매우 좁다.
+      그래서 β 자체가 아니라 r = β-γ를 0 주변에서 로그 간격으로 촘촘하게 잡는다.
+    """
+    P = len(gamma)
+    n_neg = n_grid // 4
+    r = np.concatenate([-np.geomspace(1e-4, 1, n_neg)[::-1], np.geomspace(1e-4, hi, n_grid - n_neg)])
+    cand = np.clip(gamma[:, None] + r[None, :], lo, hi)  # [P, n_grid]
+    rep = lambda a: np.repeat(a, n_grid)
+    I_grid = simulate_sir_batch(t, cand.ravel(), rep(gamma), rep(N), rep(S0), rep(I0), substeps=substeps)
+    resid = I_grid.reshape(P, n_grid, len(t)) - y[:, None, :]
+    sse = np.einsum('pgt,pgt->pg', resid, resid)
+    return cand[np.arange(P), np.nanargmin(sse, axis=1)]
+
+
+def fit_beta_batch(t, cases, gamma, N, S0, I0, R0=0, bounds=(0.001, 1), p0=None,
+                   n_grid=64, max_iter=30, tol=1e-7, substeps=2):
+    """
+    모든 파라미터 조합에 대해 β를 동시에 피팅한다. (조합별 curve_fit 호출을 대체)
+    - t: 관측 시점, cases: 관측 감염자 수 [len(t)] 또는 조합별 [P, len(t)]
+    - gamma, N, S0, I0, R0: 스칼라 또는 배열 (브로드캐스트)
+    - bounds: β 범위 (curve_fit의 bounds=(0.001, [1])와 동일)
+    - p0: β 초기값 (스칼라 또는 조합별 배열; 이전 결과를 넣으면 warm start).
+          None이면 γ 주변 격자 n_grid개를 배치로 평가해 가장 좋은 값에서 시작
+    - substeps: 하루당 RK4 스텝 수
+    - 반환값: (beta [P], sse [P]) - 조합별 최적 β와 잔차 제곱합
+    """
+    t = np.asarray(t, dtype=float)
+    gamma, N, S0, I0, R0 = _broadcast_params(gamma, N, S0, I0, R0)
+    P = len(gamma)
+    y = np.broadcast_to(np.asarray(cases, dtype=float), (P, len(t)))
+    lo, hi = bounds
+
+    if p0 is None:
+        beta = _grid_start(t, y, gamma, N, S0, I0, lo, hi, n_grid, substeps)
+    else:
+        beta = np.broadcast_to(np.asarray(p0, dtype=float), (P,)).copy()
+    beta = np.clip(beta, lo, hi)
+
+    I_fit, J = simulate_with_sensitivity(t, beta, gamma, N, S0, I0, substeps)
+    resid = I_fit - y
+    sse = np.einsum('pt,pt->p', resid, resid)
+    lam = np.full(P, 1e-3)
+    active = np.ones(P, dtype=bool)
+
+    for _ in range(max_iter):
+        if not active.any():
+            break
+        idx = np.flatnonzero(active)
+
+        # Gauss-Newton 스텝 (파라미터 1개라 J^T J는 스칼라) + 감쇠
+        JtJ = np.einsum('pt,pt->p', J[idx], J[idx])
+        Jtr = np.einsum('pt,pt->p', J[idx], resid[idx])
+        step = -Jtr / (JtJ * (1 + lam[idx]) + 1e-300)
+        beta_new = np.clip(beta[idx] + step, lo, hi)
+
+        I_new, J_new = simulate_with_sensitivity(t, beta_new, gamma[idx], N[idx], S0[idx], I0[idx], substeps)
+        resid_new = I_new - y[idx]
+        sse_new = np.einsum('pt,pt->p', resid_new, resid_new)
+
+        # 개선된 조합만 받아들이고 감쇠를 줄임, 나머지는 감쇠를 키움
+        ok = sse_new <= sse[idx]
+        acc = idx[ok]
+        rel_change = np.abs(beta_new[ok] - beta[acc]) / np.maximum(np.abs(beta[acc]), 1e-12)
+        sse_prev = sse[acc]
+        beta[acc], sse[acc] = beta_new[ok], sse_new[ok]
+        resid[acc], J[acc] = resid_new[ok], J_new[ok]
+        lam[acc] *= 0.3
+        lam[idx[~ok]] *= 10
+
+        # 수렴 판정: β 변화량 또는 SSE 변화량이 tol 이하, 감쇠가 너무 커진 조합은 종료
+        converged = (rel_change < tol) | (np.abs(sse_prev - sse[acc]) <= tol * np.maximum(sse_prev, 1e-300))
+        active[acc[converged]] = False
+        active[lam > 1e12] = False
+
+    return beta, sse
+
+
+###############################################
+# 3. 회복기간 × 인구 그리드 스윕
+###############################################
+def sweep_beta(t, cases, T_recovery, N, I0, R0=0, **fit_kwargs):
+    """
+    회복 기간(T_recovery, γ=1/T)과 인구(N) 격자 전체에 대해 β 곡면을 한 번의 배치 피팅으로 구한다.
+    - T_recovery: 회복 기간 목록 (예: range(5, 21))
+    - N: 인구 목록 (스칼라도 가능)
+    - I0, R0: 초기 감염자/완치자 (S0 = N - I0 - R0)
+    - fit_kwargs: fit_beta_batch 옵션 (bounds, p0, substeps 등)
+    - 반환값: (beta_surface, sse_surface) - index=T_recovery, columns=N 인 DataFrame 2개
+    """
+    T_grid = np.atleast_1d(np.asarray(T_recovery, dtype=float))
+    N_grid = np.atleast_1d(np.asarray(N, dtype=float))
+    TT, NN = np.meshgrid(T_grid, N_grid, indexing='ij')
+
+    gamma = 1 / TT.ravel()
+    N_flat = NN.ravel()
+    S0 = N_flat - I0 - R0
+    beta, sse = fit_beta_batch(t, cases, gamma, N_flat, S0, I0, R0, **fit_kwargs)
+
+    index = pd.Index(T_grid, name='T_recovery')
+    columns = pd.Index(N_grid, name='N')
+    beta_surface = pd.DataFrame(beta.reshape(TT.shape), index=index, columns=columns)
+    sse_surface = pd.DataFrame(sse.reshape(TT.shape), index=index, columns=columns)
+    return beta_surface, sse_surface
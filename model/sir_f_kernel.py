@@ -0,0 +1,121 @@
+###############################################
+# SIR-F 적분 커널 (Numba JIT 선택) + 해석적 Jacobian / 전방 민감도
+###############################################
+# SIR-Fmodel.py의 fit_sir_f(solve_ivp + Python RHS)를 그대로 대체하는 함수와,
+# curve_fit에 넘길 정확한 기울기(∂I/∂β) 함수를 제공한다.
+#   상태 x = (S, I),  f(x) = (-βSI/N, βSI/N - γI)
+#   민감도 s = ∂x/∂β  ->  ds/dt = (∂f/∂x)·s + ∂f/∂β
+# curve_fit은 jac가 없으면 β를 조금씩 바꿔 적분을 반복(유한차분)하지만,
+# 여기서는 적분 1번으로 I와 ∂I/∂β를 같이 얻으므로 반복당 추가 적분이 없다.
+#
+# numba가 설치되어 있으면 스칼라 RK4 커널(상태 + 민감도)을 JIT 컴파일해서 쓰고,
+# 없으면 같은 RK4를 sir_f_batch.simulate_with_sensitivity (NumPy, 조합 1개)로 계산한다.
+# f와 jac가 같은 β로 연달아 호출되므로 마지막 적분 결과를 재사용한다.
+import numpy as np
+from scipy.optimize import curve_fit
+
+from sir_f_batch import simulate_with_sensitivity
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+SUBSTEPS = 4  # 하루당 RK4 스텝 수
+
+
+def _rhs_sens(S, I, Sb, Ib, beta, gamma, N):
+    """상태 (S, I)와 β 민감도 (Sb, Ib)의 미분 (스칼라, sir_f_batch._rhs_sens와 같은 식)"""
+    SI_N = S * I / N
+    force = beta * SI_N
+    d_force = SI_N + beta * (Sb * I + S * Ib) / N
+    return -force, force - gamma * I, -d_force, d_force - gamma * Ib
+
+
+def _sir_sens_kernel(t, beta, gamma, N, S0, I0, substeps):
+    """numba 경로: RK4로 (S, I)와 (Sb, Ib)를 함께 적분. 반환: I[len(t)], ∂I/∂β[len(t)]"""
+    n = t.shape[0]
+    I_out = np.empty(n)
+    Ib_out = np.empty(n)
+    S, I, Sb, Ib = S0, I0, 0.0, 0.0
+    I_out[0] = I
+    Ib_out[0] = Ib
+
+    for k in range(1, n):
+        h = (t[k] - t[k - 1]) / substeps
+        for _ in range(substeps):
+            a0, a1, a2, a3 = _rhs_sens(S, I, Sb, Ib, beta, gamma, N)
+            b0, b1, b2, b3 = _rhs_sens(S + 0.5 * h * a0, I + 0.5 * h * a1, Sb + 0.5 * h * a2, Ib + 0.5 * h * a3,
+                                       beta, gamma, N)
+            c0, c1, c2, c3 = _rhs_sens(S + 0.5 * h * b0, I + 0.5 * h * b1, Sb + 0.5 * h * b2, Ib + 0.5 * h * b3,
+                                       beta, gamma, N)
+            d0, d1, d2, d3 = _rhs_sens(S + h * c0, I + h * c1, Sb + h * c2, Ib + h * c3, beta, gamma, N)
+            S += h / 6 * (a0 + 2 * b0 + 2 * c0 + d0)
+            I += h / 6 * (a1 + 2 * b1 + 2 * c1 + d1)
+            Sb += h / 6 * (a2 + 2 * b2 + 2 * c2 + d2)
+            Ib += h / 6 * (a3 + 2 * b3 + 2 * c3 + d3)
+        I_out[k] = I
+        Ib_out[k] = Ib
+
+    return I_out, Ib_out
+
+
+if HAS_NUMBA:
+    _rhs_sens = njit(cache=True)(_rhs_sens)
+    _sir_sens_kernel = njit(cache=True)(_sir_sens_kernel)
+
+
+_last = {'key': None, 'value': None}
+
+
+def solve_sir_sens(t, beta, gamma, N, S0, I0, substeps=SUBSTEPS, use_numba=None):
+    """
+    I(t)와 ∂I/∂β(t)를 한 번의 적분으로 계산 (numba RK4 커널 또는 sir_f_batch NumPy RK4)
+    - use_numba: True/False로 경로를 고정 (None이면 numba가 있을 때 사용)
+    """
+    if use_numba is None:
+        use_numba = HAS_NUMBA
+    if use_numba and not HAS_NUMBA:
+        raise ImportError("numba가 설치되어 있지 않습니다")
+
+    t = np.asarray(t, dtype=float)
+    key = (t.shape[0], t[0], t[-1], float(beta), float(gamma), float(N), float(S0), float(I0), substeps, use_numba)
+    if _last['key'] == key:
+        return _last['value']
+
+    if use_numba:
+        value = _sir_sens_kernel(t, float(beta), float(gamma), float(N), float(S0), float(I0), substeps)
+    else:
+        params = [np.array([float(p)]) for p in (beta, gamma, N, S0, I0)]
+        I, Ib = simulate_with_sensitivity(t, *params, substeps)
+        value = (I[0], Ib[0])
+
+    _last['key'], _last['value'] = key, value
+    return value
+
+
+###############################################
+# fit_sir_f 대체 함수들
+###############################################
+def fit_sir_f(t, beta, gamma, N, S0, I0, R0):
+    """ 감염자 수 I(t) 반환 (SIR-Fmodel.fit_sir_f와 같은 인자/반환값, R0는 I에 영향 없음) """
+    return solve_sir_sens(t, beta, gamma, N, S0, I0)[0]
+
+
+def fit_sir_f_jac(t, beta, gamma, N, S0, I0, R0):
+    """ curve_fit용 Jacobian: ∂I/∂β를 (len(t), 1) 모양으로 반환 """
+    return solve_sir_sens(t, beta, gamma, N, S0, I0)[1][:, None]
+
+
+def curve_fit_beta(t, cases, gamma, N, S0, I0, R0, p0_beta=0.2, bounds=(0.001, [1]), max_nfev=5000):
+    """
+    curve_fit으로 β를 피팅하되 해석적 기울기(jac)를 넘긴다.
+    (기존: curve_fit(lambda t, beta: fit_sir_f(...), ...)와 같은 인자/반환값 (popt, pcov))
+    """
+    return curve_fit(
+        lambda t, beta: fit_sir_f(t, beta, gamma, N, S0, I0, R0),
+        t, cases, bounds=bounds, p0=[p0_beta], max_nfev=max_nfev,
+        jac=lambda t, beta: fit_sir_f_jac(t, beta, gamma, N, S0, I0, R0),
+    )
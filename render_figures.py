@@ -0,0 +1,52 @@
+###############################################
+# weather / air 그래프 전체를 창 없이 한 번에 저장
+###############################################
+# 각 Graph_*.py의 figure_jobs()로 작업을 모은 뒤 figure_batch.render_jobs로
+# 프로세스 풀에서 그린다. 값이 바뀐 그래프만 다시 그린다.
+#   python render_figures.py [출력 폴더] [--svg]     (기본 출력 폴더: ./figures)
+import os
+import sys
+import importlib
+
+import matplotlib
+matplotlib.use('Agg')
+
+from figure_batch import render_jobs
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+WEATHER_DIR = os.path.join(ROOT, 'weather')
+AIR_DIR = os.path.join(ROOT, 'air')
+
+# (폴더, 스크립트 모듈, 입력 파일)
+SCRIPTS = [
+    (WEATHER_DIR, 'Graph_humidity', '12-24weather.csv'),
+    (WEATHER_DIR, 'Graph_wind', '12-24weather.csv'),
+    (WEATHER_DIR, 'Graph_daily_range', '12-24weather.csv'),
+    (WEATHER_DIR, 'Graph_yearly_Temp_Korea', 'yearly_averages_korea.csv'),
+    (WEATHER_DIR, 'Graph_quarterly_Temp_Korea', 'quarterly_averages_korea.csv'),
+    (WEATHER_DIR, 'Graph_yearly_Temp_Region', 'yearly_averages_by_region.csv'),
+    (WEATHER_DIR, 'Graph_quarterly_Temp_Region', 'quarterly_averages_by_region.csv'),
+    (AIR_DIR, 'Graph_air_quarterly', 'region_quarterly_avg.csv'),
+    (AIR_DIR, 'Graph_air_yearly', 'region_yearly_avg.csv'),
+]
+
+
+def collect_jobs(scripts=SCRIPTS):
+    """모든 스크립트의 그래프 작업 (입력 파일이 없는 스크립트는 건너뜀)"""
+    jobs = []
+    for folder, module_name, input_file in scripts:
+        path = os.path.join(folder, input_file)
+        if not os.path.exists(path):
+            print(f"[render_figures] {module_name}: 입력 파일 없음 ({path}), 건너뜀")
+            continue
+        if folder not in sys.path:
+            sys.path.insert(0, folder)
+        jobs += importlib.import_module(module_name).figure_jobs(path)
+    return jobs
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    out_dir = args[0] if args else os.path.join(ROOT, 'figures')
+    formats = ('png', 'svg') if '--svg' in sys.argv else ('png',)
+    render_jobs(collect_jobs(), out_dir, formats=formats)
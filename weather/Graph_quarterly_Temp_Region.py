@@ -1,46 +1,34 @@
 import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib import font_manager, rc
-
-# 한글 폰트 설정 (환경에 맞게 수정)
-font_path = 'C:/Windows/Fonts/malgun.ttf'  # Windows 예제
-font = font_manager.FontProperties(fname=font_path).get_name()
-rc('font', family=font)
+from weather_figures import temperature_lines
+from weather_index import RegionTimeIndex
+import _paths  # noqa: F401  (csv_cache, figure_batch, weather_index 경로)
+from figure_batch import show_or_render
 
 # 데이터 불러오기
 file_path = './quarterly_averages_by_region.csv'  # 실제 파일 경로
-quarterly_regional_data = pd.read_csv(file_path, encoding='cp949')
 
 # 시각화 대상 지역
 target_regions = ["강릉", "대구", "대전", "부산", "서울", "수원",
                   "영광군", "원주", "창원", "춘천", "포항", "홍천","청주"]
 
-# 각 지역별 그래프 생성
-for region in target_regions:
-    region_data = quarterly_regional_data[quarterly_regional_data['지역'] == region]
-    
-    # 그래프 생성
-    plt.figure(figsize=(12, 6))
-    plt.plot(region_data['연도_분기'], region_data['최고기온 (C)'], label='최고기온 (℃)', marker='o', color='#FF5733')  # 오렌지색
-    plt.plot(region_data['연도_분기'], region_data['최저기온 (C)'], label='최저기온 (℃)', marker='o', color='#3498DB')  # 하늘색
-    plt.plot(region_data['연도_분기'], region_data['일 평균기온 (C)'], label='일 평균기온 (℃)', marker='o', color='#2ECC71')  # 라임 그린
-
-    # x축 커스텀: 각 해의 1분기만 표시
-    x_ticks = region_data['연도_분기']
-    x_labels = [tick if '1분기' in tick else '' for tick in x_ticks]
-    plt.xticks(range(len(x_ticks)), x_labels, rotation=45)
-
-    # 그래프 꾸미기
-    plt.title(f'{region} 분기별 기온 변화', fontsize=16)
-    plt.xlabel('분기', fontsize=12)
-    plt.ylabel('기온 (°C)', fontsize=12)
-    plt.grid(True, linestyle='--', alpha=0.5)
-
-    # 범례를 그래프 외부로 이동
-    plt.legend(fontsize=12, loc='upper center', bbox_to_anchor=(0.5, -0.2), ncol=3)
-
-    # 그래프의 여백 조정 (범례가 잘리지 않도록)
-    plt.tight_layout(rect=[0, 0.2, 1, 1])  # 아래 여백 추가
 
-    # 그래프 출력
-    plt.show()
\ No newline at end of file
+def figure_jobs(file_path=file_path, regions=target_regions):
+    """지역별 분기별 기온 변화 그래프 작업 (x축은 각 해의 1분기만 표시)"""
+    quarterly_regional_data = pd.read_csv(file_path, encoding='cp949')
+    index = RegionTimeIndex(quarterly_regional_data, '지역', '연도_분기')  # (지역, 기간) 순 정렬 + 지역 오프셋 표
+    jobs = []
+    for region, region_data in index.items(regions):
+        jobs.append({
+            'name': f'temperature/{region}_분기',
+            'lines': temperature_lines(region_data, '연도_분기'),
+            'title': f'{region} 분기별 기온 변화', 'xlabel': '분기', 'ylabel': '기온 (°C)', 'xticks': 'q1',
+            # 범례를 그래프 외부로 이동 + 아래 여백 추가 (범례가 잘리지 않도록)
+            'legend': {'fontsize': 12, 'loc': 'upper center', 'bbox_to_anchor': (0.5, -0.2), 'ncol': 3},
+            'tight_rect': [0, 0.2, 1, 1],
+        })
+    return jobs
+
+
+if __name__ == "__main__":
+    # --batch: ./figures/temperature/*.png 로 저장 (창 없이)
+    show_or_render(figure_jobs(), './figures')
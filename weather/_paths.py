@@ -0,0 +1,17 @@
+###############################################
+# 폴더 밖 공용 모듈을 import할 수 있게 sys.path 설정
+###############################################
+# model/, weather/, air/ 스크립트는 csv_cache, figure_batch(저장소 루트)와
+# weather_index(weather/)를 쓰기 전에 이 모듈을 명시적으로 import한다.
+#   import _paths  # noqa: F401
+# 세 폴더의 _paths.py는 내용이 같다. (render_figures처럼 여러 폴더의 스크립트를
+# 한 프로세스에서 불러 먼저 캐시된 _paths가 쓰여도 결과가 같도록)
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WEATHER_DIR = os.path.join(ROOT, 'weather')
+
+for _path in (ROOT, WEATHER_DIR):
+    if _path not in sys.path:
+        sys.path.append(_path)
@@ -0,0 +1,237 @@
+###############################################################################
+# 파생 기후 지표 커널 (증기압, 절대습도, 이슬점, 열지수, 풍속냉각, 체감온도)
+###############################################################################
+# weather.py는 일교차만 만들고, 저온·저습 분석에 쓰는 습도 지표는 노트북마다 따로 계산했다.
+# 여기서는 일 평균기온(TA), 일 평균 상대습도(HM), 일 평균 풍속(WS) 열로 모든 지점·날짜의 지표를
+# 한 번에 계산한다. (결과는 float32)
+#   포화증기압 es = 6.112·exp(17.62·T / (243.12 + T))          [hPa, Magnus (WMO)]
+#   증기압     e  = HM/100 · es                                 [hPa]
+#   절대습도   AH = 216.7 · e / (273.15 + T)                    [g/m³]
+#   이슬점     Td = 243.12·γ / (17.62 − γ),  γ = ln(e / 6.112)  [°C]
+#   열지수     NWS Rothfusz 회귀식 (°F로 계산 후 °C로), T ≥ 26.7°C 일 때만, 아니면 T
+#   풍속냉각   13.12 + 0.6215T − 11.37V^0.16 + 0.3965T·V^0.16 (V km/h), T ≤ 10°C, V ≥ 4.8km/h 일 때만, 아니면 T
+#   체감온도   더우면 열지수, 추우면 풍속냉각, 그 밖에는 T
+# numba가 설치되어 있으면 행 단위 루프 커널을 JIT 컴파일해서 쓰고, 없으면 같은 식을 NumPy 배열 연산으로 계산한다.
+#
+# 저장소(weather_store)에는 store_dir/derived/year=YYYY/climate_indices.parquet 으로 저장한다.
+# 원본 파티션 파일(이름/크기/수정시각)이 그대로면 다시 계산하지 않는다.
+import os
+import glob
+import json
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from weather_qc import MISSING_CODES
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+TA_COL = '일 평균기온 (C)'
+HM_COL = '일 평균 상대습도 (%)'
+WS_COL = '일 평균 풍속 (m/s)'
+
+# 지표 열 이름 (커널 출력 순서)
+INDEX_COLUMNS = ['증기압 (hPa)', '절대습도 (g/m3)', '이슬점 (C)', '열지수 (C)', '풍속냉각 (C)', '체감온도 (C)']
+
+DERIVED_DIR = 'derived'
+DERIVED_FILE = 'climate_indices.parquet'
+
+
+def _index_kernel_numpy(ta, hm, ws):
+    """배열 연산 경로: 입력 float32 [n] -> 출력 float32 [n, 6]"""
+    ta = ta.astype(np.float64)
+    hm = hm.astype(np.float64)
+    ws = ws.astype(np.float64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        es = 6.112 * np.exp(17.62 * ta / (243.12 + ta))
+        e = hm / 100.0 * es
+        ah = 216.7 * e / (273.15 + ta)
+        g = np.log(e / 6.112)
+        td = 243.12 * g / (17.62 - g)
+
+        # 열지수 (°F 회귀식)
+        tf = ta * 9.0 / 5.0 + 32.0
+        hi = (-42.379 + 2.04901523 * tf + 10.14333127 * hm - 0.22475541 * tf * hm
+              - 6.83783e-3 * tf * tf - 5.481717e-2 * hm * hm + 1.22874e-3 * tf * tf * hm
+              + 8.5282e-4 * tf * hm * hm - 1.99e-6 * tf * tf * hm * hm)
+        hot = ta >= 26.7
+        hi = np.where(hot, (hi - 32.0) * 5.0 / 9.0, ta)
+
+        # 풍속냉각 (V: km/h)
+        v16 = (ws * 3.6) ** 0.16
+        wc = 13.12 + 0.6215 * ta - 11.37 * v16 + 0.3965 * ta * v16
+        cold = (ta <= 10.0) & (ws * 3.6 >= 4.8)
+        wc = np.where(cold, wc, ta)
+
+        feels = np.where(hot, hi, np.where(cold, wc, ta))
+    return np.column_stack([e, ah, td, hi, wc, feels]).astype(np.float32)
+
+
+def _index_kernel_loop(ta, hm, ws, out):
+    """numba 경로: 행마다 같은 식 (NaN 입력은 NaN 출력)"""
+    for k in range(ta.shape[0]):
+        t = np.float64(ta[k])
+        h = np.float64(hm[k])
+        w = np.float64(ws[k])
+        es = 6.112 * np.exp(17.62 * t / (243.12 + t))
+        e = h / 100.0 * es
+        out[k, 0] = e
+        out[k, 1] = 216.7 * e / (273.15 + t)
+        g = np.log(e / 6.112)
+        out[k, 2] = 243.12 * g / (17.62 - g)
+
+        hot = t >= 26.7
+        if hot:
+            tf = t * 9.0 / 5.0 + 32.0
+            hi = (-42.379 + 2.04901523 * tf + 10.14333127 * h - 0.22475541 * tf * h
+                  - 6.83783e-3 * tf * tf - 5.481717e-2 * h * h + 1.22874e-3 * tf * tf * h
+                  + 8.5282e-4 * tf * h * h - 1.99e-6 * tf * tf * h * h)
+            hi = (hi - 32.0) * 5.0 / 9.0
+        else:
+            hi = t
+        out[k, 3] = hi
+
+        cold = (t <= 10.0) and (w * 3.6 >= 4.8)
+        if cold:
+            v16 = (w * 3.6) ** 0.16
+            wc = 13.12 + 0.6215 * t - 11.37 * v16 + 0.3965 * t * v16
+        else:
+            wc = t
+        out[k, 4] = wc
+        out[k, 5] = hi if hot else (wc if cold else t)
+    return out
+
+
+if HAS_NUMBA:
+    _index_kernel_loop = njit(cache=True)(_index_kernel_loop)
+
+
+def compute_indices(ta, hm, ws, use_numba=None):
+    """
+    Compute all indices for every station-day in one pass.
+
+    Parameters:
+        ta, hm, ws (array-like): Daily mean temperature (°C), relative humidity (%), wind speed (m/s).
+        use_numba (bool | None): Force/disable the numba kernel (None = use it when installed).
+
+    Returns:
+        ndarray: float32 [n, 6] in INDEX_COLUMNS order.
+    """
+    ta = np.ascontiguousarray(ta, dtype=np.float32)
+    hm = np.ascontiguousarray(hm, dtype=np.float32)
+    ws = np.ascontiguousarray(ws, dtype=np.float32)
+    if use_numba is None:
+        use_numba = HAS_NUMBA
+    if use_numba:
+        if not HAS_NUMBA:
+            raise ImportError("numba가 설치되어 있지 않습니다")
+        return _index_kernel_loop(ta, hm, ws, np.empty((ta.shape[0], len(INDEX_COLUMNS)), dtype=np.float32))
+    return _index_kernel_numpy(ta, hm, ws)
+
+
+def _clean(values, column):
+    """결측 부호(-9, -99 등) -> NaN"""
+    x = pd.to_numeric(values, errors='coerce').to_numpy(dtype=np.float32)
+    return np.where(np.isin(x, MISSING_CODES.get(column, ())), np.nan, x).astype(np.float32)
+
+
+def add_indices(data, use_numba=None):
+    """
+    Add the index columns to a daily table (관측시각, 지점, 일 평균기온/상대습도/풍속).
+
+    Returns:
+        DataFrame: data with INDEX_COLUMNS appended (float32).
+    """
+    out = compute_indices(_clean(data[TA_COL], TA_COL), _clean(data[HM_COL], HM_COL),
+                          _clean(data[WS_COL], WS_COL), use_numba=use_numba)
+    result = data.copy()
+    for i, col in enumerate(INDEX_COLUMNS):
+        result[col] = out[:, i]
+    return result
+
+
+###############################################################################
+# 저장소 캐시 (store_dir/derived/year=YYYY/climate_indices.parquet)
+###############################################################################
+def _partition_signature(store_dir, year):
+    """원본 파티션 파일 이름/크기/수정시각"""
+    files = sorted(glob.glob(os.path.join(store_dir, f'year={year}', '*.parquet')))
+    return json.dumps([(os.path.basename(f), os.stat(f).st_size, os.stat(f).st_mtime_ns) for f in files])
+
+
+def _derived_path(store_dir, year):
+    return os.path.join(store_dir, DERIVED_DIR, f'year={year}', DERIVED_FILE)
+
+
+def update_store_indices(store_dir, years=None, rebuild=False, use_numba=None):
+    """
+    Compute and cache the indices for store partitions whose source files changed.
+
+    Parameters:
+        store_dir (str): Weather store root (weather_store / kma_parse layout).
+        years (iterable of int | None): Years to check (None = all).
+        rebuild (bool): Recompute even when the cache is current.
+
+    Returns:
+        list of int: Years recomputed.
+    """
+    from kma_parse import read_store, store_years
+    from weather_store import TIME_COL, STATION_COL
+
+    updated = []
+    for year in (store_years(store_dir) if years is None else sorted(years)):
+        signature = _partition_signature(store_dir, year)
+        path = _derived_path(store_dir, year)
+        if not rebuild and os.path.exists(path):
+            meta = pq.read_schema(path).metadata or {}
+            if meta.get(b'climate_indices.signature', b'').decode() == signature:
+                continue
+
+        data = read_store(store_dir, years=[year], columns=[TIME_COL, STATION_COL, TA_COL, HM_COL, WS_COL])
+        derived = add_indices(data, use_numba=use_numba)[[TIME_COL, STATION_COL] + INDEX_COLUMNS]
+        table = pa.Table.from_pandas(derived, preserve_index=False)
+        meta = dict(table.schema.metadata or {})
+        meta[b'climate_indices.signature'] = signature.encode()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        pq.write_table(table.replace_schema_metadata(meta), path + '.tmp')
+        os.replace(path + '.tmp', path)
+        updated.append(year)
+    return updated
+
+
+def read_with_indices(store_dir, start=None, end=None, columns=None):
+    """
+    Read store years together with their cached indices (recomputing only stale years).
+
+    Parameters:
+        store_dir (str): Weather store root.
+        start, end (int | None): Year range (inclusive).
+        columns (list | None): Source columns to read (None = all); index columns are always added.
+
+    Returns:
+        DataFrame: Source rows with INDEX_COLUMNS appended.
+    """
+    from kma_parse import read_store, store_years
+    from weather_store import TIME_COL
+
+    years = [y for y in store_years(store_dir)
+             if (start is None or y >= start) and (end is None or y <= end)]
+    update_store_indices(store_dir, years)
+    frames = []
+    for year in years:
+        data = read_store(store_dir, years=[year], columns=columns)
+        derived = pd.read_parquet(_derived_path(store_dir, year))
+        # 파생 파일은 원본 파티션과 같은 행 순서로 저장된다
+        if TIME_COL in data.columns and not np.array_equal(data[TIME_COL].to_numpy(), derived[TIME_COL].to_numpy()):
+            raise ValueError(f"{year}년 파생 지표의 행 순서가 원본과 다릅니다 (rebuild=True로 다시 계산)")
+        frames.append(pd.concat([data.reset_index(drop=True), derived[INDEX_COLUMNS]], axis=1))
+    if not frames:
+        return pd.DataFrame(columns=(columns or []) + INDEX_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
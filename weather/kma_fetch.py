@@ -0,0 +1,197 @@
+###############################################################################
+# 기상청 API허브 kma_sfcdd3 (ASOS 일자료) 비동기 청크 다운로드
+###############################################################################
+# weather.py는 1년치 전체 지점을 requests.get 한 번으로 받고, 연도마다 tm1/tm2를 바꿔 다시 실행했다.
+# 여기서는 기간 × 지점을 API 한 번에 요청할 크기의 청크로 나눠
+#   - aiohttp 세션 1개 (keep-alive 연결 풀)로 동시에 요청하고
+#   - 요청 시작 간격(rate)과 동시 요청 수(concurrency)를 제한하며
+#   - 429/5xx/연결 오류는 지수 백오프로 재시도한다.
+# 받은 청크는 out_dir에 원본 그대로 저장하므로, 중간에 끊겨도 다시 실행하면 남은 청크만 받는다.
+# 상태 코드가 200이어도 본문이 '#7777END' 종료 줄로 끝나지 않거나 자료 줄이 없으면
+# (오류 안내 페이지, 빈 응답, 연결이 끊겨 잘린 응답) 저장하지 않고 재시도한다.
+# base_url을 로컬 HTTP 서버로 바꾸면 미리 저장해 둔 응답으로 그대로 테스트할 수 있다.
+import os
+import time
+import random
+import asyncio
+from datetime import date, timedelta
+
+import aiohttp
+
+# 기상청 API허브 일자료(ASOS) 엔드포인트
+KMA_URL = "https://apihub.kma.go.kr/api/typ01/url/kma_sfcdd3.php"
+
+# 재시도할 HTTP 상태 코드 (요청 과다 / 서버 오류)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+# typ01 텍스트 응답의 마지막 줄
+END_MARKER = b'#7777END'
+
+
+class IncompleteResponse(Exception):
+    """상태 코드 200이지만 본문이 완전한 typ01 응답이 아님 (재시도 대상)"""
+
+
+def check_body(body):
+    """
+    Raise IncompleteResponse unless body is a complete typ01 response.
+
+    A complete response ends with the '#7777END' line and has at least one data line (not starting with '#').
+    """
+    lines = body.strip().splitlines()
+    if not lines:
+        raise IncompleteResponse("빈 응답")
+    if lines[-1].strip() != END_MARKER:
+        raise IncompleteResponse(f"종료 줄 없음 (잘린 응답 또는 오류 페이지, {len(body)} bytes)")
+    if not any(line.strip() and not line.lstrip().startswith(b'#') for line in lines):
+        raise IncompleteResponse("자료 줄 없음")
+
+
+def _to_date(value):
+    """'20240101' / date 객체를 date로 변환"""
+    if isinstance(value, date):
+        return value
+    value = str(value)
+    return date(int(value[:4]), int(value[4:6]), int(value[6:8]))
+
+
+def make_chunks(start, end, stations=(0,), chunk_days=None):
+    """
+    Split a date range and a station list into API-sized request chunks.
+
+    Parameters:
+        start, end (str | date): Inclusive date range, e.g. '20120101', '20241231'.
+        stations (iterable of int): Station IDs. 0 means all stations in one request.
+        chunk_days (int | None): Maximum days per request. None splits only at year boundaries.
+
+    Returns:
+        list of dict: Each chunk has 'tm1', 'tm2', 'stn' and a unique 'id'.
+    """
+    start, end = _to_date(start), _to_date(end)
+    chunks = []
+    for stn in stations:
+        cur = start
+        while cur <= end:
+            # 연도가 바뀌는 지점에서 항상 자른다 (나중에 연도별 파일/파티션으로 저장하기 쉽게)
+            stop = min(end, date(cur.year, 12, 31))
+            if chunk_days:
+                stop = min(stop, cur + timedelta(days=chunk_days - 1))
+            tm1, tm2 = cur.strftime('%Y%m%d'), stop.strftime('%Y%m%d')
+            chunks.append({'tm1': tm1, 'tm2': tm2, 'stn': int(stn), 'id': f"{tm1}_{tm2}_stn{int(stn)}"})
+            cur = stop + timedelta(days=1)
+    return chunks
+
+
+class RateLimiter:
+    """요청 시작 간격을 최소 1/rate 초로 유지하는 간단한 비동기 rate limiter"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._lock = asyncio.Lock()
+        self._next = 0.0
+
+    async def wait(self):
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def chunk_path(out_dir, chunk):
+    """청크 원본 응답 저장 경로 (응답 바이트 그대로, EUC-KR)"""
+    return os.path.join(out_dir, f"{chunk['id']}.txt")
+
+
+async def _fetch_chunk(session, limiter, chunk, base_url, auth_key, out_dir, max_retries, backoff):
+    path = chunk_path(out_dir, chunk)
+    if os.path.exists(path):  # 이전 실행에서 완료된 청크는 건너뜀 (재시작 시 이어받기)
+        with open(path, 'rb') as f:
+            try:
+                check_body(f.read())
+                return path, 'cached'
+            except IncompleteResponse as e:  # 검사 없이 저장됐던 불완전한 파일은 다시 받는다
+                print(f"[KMA] {chunk['id']} 저장된 응답 무시 ({e})")
+
+    params = {'tm1': chunk['tm1'], 'tm2': chunk['tm2'], 'stn': chunk['stn'], 'help': 0, 'authKey': auth_key}
+    for attempt in range(max_retries + 1):
+        await limiter.wait()
+        try:
+            async with session.get(base_url, params=params) as resp:
+                if resp.status == 200:
+                    body = await resp.read()
+                    check_body(body)
+                    # 다 받은 뒤 임시 파일 -> rename 으로 저장 (중간에 끊기면 완료로 보지 않음)
+                    tmp = path + '.part'
+                    with open(tmp, 'wb') as f:
+                        f.write(body)
+                    os.replace(tmp, path)
+                    return path, 'downloaded'
+                if resp.status not in RETRY_STATUS:
+                    raise RuntimeError(f"API 요청 실패: 상태 코드 {resp.status} ({chunk['id']})")
+                reason = f"status {resp.status}"
+        except (aiohttp.ClientError, asyncio.TimeoutError, IncompleteResponse) as e:
+            reason = repr(e)
+
+        if attempt == max_retries:
+            raise RuntimeError(f"API 요청 재시도 초과 ({chunk['id']}): {reason}")
+        # 지수 백오프 + 지터
+        delay = backoff * (2 ** attempt) * (0.5 + random.random())
+        print(f"[KMA] {chunk['id']} 재시도 {attempt + 1}/{max_retries} ({reason}), {delay:.1f}s 대기")
+        await asyncio.sleep(delay)
+
+
+async def fetch_chunks_async(chunks, auth_key, out_dir, base_url=KMA_URL, concurrency=4, rate=5.0,
+                             max_retries=5, backoff=1.0, timeout=120):
+    """
+    Download chunks concurrently over one pooled keep-alive session.
+
+    Parameters:
+        chunks (list of dict): Output of make_chunks.
+        auth_key (str): API hub authKey.
+        out_dir (str): Folder for the raw per-chunk responses (also the resume state).
+        base_url (str): Endpoint URL. Point it at a local stand-in server for testing.
+        concurrency (int): Maximum simultaneous requests (= connection pool size).
+        rate (float): Maximum request starts per second.
+        max_retries (int): Retries per chunk on 429/5xx/network errors and incomplete 200 bodies.
+        backoff (float): Base delay (seconds) of the exponential backoff.
+        timeout (float): Total timeout per request in seconds.
+
+    Returns:
+        list of str: Raw response file paths in the same order as chunks.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    limiter = RateLimiter(rate)
+    connector = aiohttp.TCPConnector(limit=concurrency, keepalive_timeout=60)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=timeout)) as session:
+        async def run(chunk):
+            async with semaphore:
+                path, status = await _fetch_chunk(session, limiter, chunk, base_url, auth_key,
+                                                  out_dir, max_retries, backoff)
+                print(f"[KMA] {chunk['id']}: {status}")
+                return path
+
+        return await asyncio.gather(*(run(c) for c in chunks))
+
+
+def fetch_range(start, end, auth_key, out_dir='./kma_chunks', stations=(0,), chunk_days=None, **kwargs):
+    """
+    Fetch every chunk of a date range (and station set) and return the raw response paths.
+
+    Parameters:
+        start, end (str | date): Inclusive date range, e.g. '20120101', '20241231'.
+        auth_key (str): API hub authKey.
+        out_dir (str): Folder for the raw per-chunk responses. Re-running resumes from it.
+        stations (iterable of int): Station IDs (0 = all stations).
+        chunk_days (int | None): Maximum days per request (None = one request per year).
+        **kwargs: Passed to fetch_chunks_async (base_url, concurrency, rate, max_retries, ...).
+
+    Returns:
+        list of (dict, str): (chunk, raw response path) pairs in date order.
+    """
+    chunks = make_chunks(start, end, stations, chunk_days)
+    paths = asyncio.run(fetch_chunks_async(chunks, auth_key, out_dir, **kwargs))
+    return list(zip(chunks, paths))
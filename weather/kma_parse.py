@@ -0,0 +1,196 @@
+###############################################################################
+# kma_sfcdd3 응답 스트리밍 파서 -> 연도별 파티션 컬럼형 저장소 (Parquet)
+###############################################################################
+# weather.py는 응답 전체를 decode -> StringIO -> read_csv(56개 열 전부)로 읽은 뒤
+# 10개 열만 남기고, 지점번호는 lambda로 한 행씩 지점명으로 바꿨다.
+# 여기서는
+#   - 응답 파일을 block_bytes씩 읽어 EUC-KR 증분 디코더로 디코딩하고 (줄 중간에서 끊긴 부분은 다음 블록으로)
+#   - 블록마다 필요한 열만 파싱하며 (read_csv usecols -> 나머지 열은 변환하지 않음)
+#   - 지점번호는 "번호 -> 지점명 코드" 배열 한 번 인덱싱으로 바꾸고 (Categorical)
+#   - 블록 결과를 바로 store_dir/year=YYYY/*.parquet 으로 써서 버린다.
+# 그래서 1년치든 10년치 전체 지점이든 메모리 사용량은 블록 크기 정도로 일정하다.
+import io
+import os
+import glob
+import codecs
+
+import numpy as np
+import pandas as pd
+
+
+# kma_sfcdd3 응답의 열 순서 (help=0)
+KMA_COLUMNS = [
+    "TM", "STN", "WS_AVG", "WR_DAY", "WD_MAX", "WS_MAX", "WS_MAX_TM", "WD_INS", "WS_INS", "WS_INS_TM",
+    "TA_AVG", "TA_MAX", "TA_MAX_TM", "TA_MIN", "TA_MIN_TM", "TD_AVG", "TS_AVG", "TG_MIN", "HM_AVG",
+    "HM_MIN", "HM_MIN_TM", "PV_AVG", "EV_S", "EV_L", "FG_DUR", "PA_AVG", "PS_AVG", "PS_MAX", "PS_MAX_TM",
+    "PS_MIN", "PS_MIN_TM", "CA_TOT", "SS_DAY", "SS_DUR", "SS_CMB", "SI_DAY", "SI_60M_MAX", "SI_60M_MAX_TM", "RN_DAY",
+    "RN_D99", "RN_DUR", "RN_60M_MAX", "RN_60M_MAX_TM", "RN_10M_MAX", "RN_10M_MAX_TM", "RN_POW_MAX", "RN_POW_MAX_TM",
+    "SD_NEW", "SD_NEW_TM", "SD_MAX", "SD_MAX_TM", "TE_05", "TE_10", "TE_15", "TE_30", "TE_50"
+]
+
+# 저장할 열: KMA 열 이름 -> 저장소/CSV 열 이름 (weather.py의 {연도}weather.csv와 같은 이름)
+WEATHER_COLUMNS = {
+    "TM": "관측시각 (KST)",
+    "STN": "국내 지점번호",
+    "TA_MAX": "최고기온 (C)",
+    "TA_MIN": "최저기온 (C)",
+    "TA_AVG": "일 평균기온 (C)",
+    "WS_AVG": "일 평균 풍속 (m/s)",
+    "RN_DAY": "일강수량 (mm)",
+    "SD_NEW": "최심 신적설 (cm)",
+    "HM_AVG": "일 평균 상대습도 (%)",
+}
+
+UNKNOWN_STATION = "미확인"
+BLOCK_BYTES = 4 << 20  # 한 번에 읽는 응답 바이트 수 (4MB)
+
+
+def station_lookup(station_mapping):
+    """
+    Build a vectorized station ID -> name lookup.
+
+    Parameters:
+        station_mapping (dict): {station ID: station name}.
+
+    Returns:
+        tuple: (lut, categories). lut[stn] is the category code of station stn;
+               unknown IDs map to the code of "미확인".
+    """
+    categories = list(dict.fromkeys(station_mapping.values())) + [UNKNOWN_STATION]
+    unknown = len(categories) - 1
+    lut = np.full(max(station_mapping) + 1, unknown, dtype=np.int16)
+    for stn, name in station_mapping.items():
+        lut[stn] = categories.index(name)
+    return lut, categories
+
+
+def _map_stations(stn, lut, categories):
+    """지점번호 배열 -> 지점명 Categorical (범위 밖/결측 번호는 '미확인')"""
+    stn = np.asarray(stn, dtype=float)
+    valid = np.isfinite(stn) & (stn >= 0) & (stn < len(lut))
+    codes = np.full(len(stn), len(categories) - 1, dtype=np.int16)
+    codes[valid] = lut[stn[valid].astype(np.int64)]
+    return pd.Categorical.from_codes(codes, categories=categories)
+
+
+def iter_text_blocks(path, block_bytes=BLOCK_BYTES, encoding='euc-kr'):
+    """
+    Decode a raw response file block by block and yield text made of complete lines only.
+
+    Parameters:
+        path (str): Raw response file (e.g. kma_chunks/20240101_20241231_stn0.txt).
+        block_bytes (int): Bytes read per block.
+        encoding (str): Response encoding.
+
+    Yields:
+        str: Decoded text ending at a line boundary.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    tail = ''
+    with open(path, 'rb') as f:
+        while True:
+            raw = f.read(block_bytes)
+            text = tail + decoder.decode(raw, final=not raw)
+            if not raw:
+                if text:
+                    yield text
+                return
+            cut = text.rfind('\n') + 1  # 마지막 줄바꿈 뒤는 다음 블록으로 넘김
+            tail = text[cut:]
+            if cut:
+                yield text[:cut]
+
+
+def iter_weather_frames(path, station_mapping, columns=WEATHER_COLUMNS, block_bytes=BLOCK_BYTES):
+    """
+    Parse a raw kma_sfcdd3 response into typed DataFrames, one per text block.
+
+    Parameters:
+        path (str): Raw response file.
+        station_mapping (dict): {station ID: station name}.
+        columns (dict): {KMA column: output column} to keep. TM and STN are always kept.
+        block_bytes (int): Bytes read per block.
+
+    Yields:
+        DataFrame: Projected columns. TM is int32 (YYYYMMDD), STN is a station-name
+                   Categorical, values are float64, plus "일교차 (C)" when TA_MAX/TA_MIN are kept.
+    """
+    columns = dict({"TM": WEATHER_COLUMNS["TM"], "STN": WEATHER_COLUMNS["STN"]}, **columns)
+    usecols = sorted(KMA_COLUMNS.index(c) for c in columns)
+    names = [KMA_COLUMNS[i] for i in usecols]
+    dtypes = {KMA_COLUMNS[i]: 'float64' for i in usecols}
+    lut, categories = station_lookup(station_mapping)
+
+    for text in iter_text_blocks(path, block_bytes):
+        # '#'로 시작하는 헤더/종료 줄은 건너뛰고, 필요한 열만 변환
+        block = pd.read_csv(io.StringIO(text), sep=r'\s+', header=None, comment='#',
+                            usecols=usecols, names=names, dtype=dtypes)
+        if block.empty:
+            continue
+        block = block.dropna(subset=["TM"])
+        block["TM"] = block["TM"].astype(np.int32)
+        block["STN"] = _map_stations(block["STN"].to_numpy(), lut, categories)
+        block = block.rename(columns=columns)[list(columns.values())]
+
+        if "TA_MAX" in columns and "TA_MIN" in columns:
+            block["일교차 (C)"] = block[columns["TA_MAX"]] - block[columns["TA_MIN"]]
+        yield block.reset_index(drop=True)
+
+
+###############################################################################
+# 연도별 파티션 저장소
+###############################################################################
+def append_to_store(frames, store_dir, part_name):
+    """
+    Append frames to a year-partitioned Parquet store (store_dir/year=YYYY/<part_name>-NNNN.parquet).
+    Parts previously written under the same part_name are replaced, so re-running a chunk is safe.
+
+    Parameters:
+        frames (iterable of DataFrame): Output of iter_weather_frames.
+        store_dir (str): Store root folder.
+        part_name (str): Prefix for this source's part files (e.g. the chunk ID).
+
+    Returns:
+        int: Number of rows written.
+    """
+    for old in glob.glob(os.path.join(store_dir, 'year=*', f'{part_name}-*.parquet')):
+        os.remove(old)
+
+    time_col = WEATHER_COLUMNS["TM"]
+    rows = 0
+    for i, frame in enumerate(frames):
+        years = frame[time_col].to_numpy() // 10000
+        for year in np.unique(years):
+            part_dir = os.path.join(store_dir, f'year={year}')
+            os.makedirs(part_dir, exist_ok=True)
+            frame[years == year].to_parquet(os.path.join(part_dir, f'{part_name}-{i:04d}.parquet'), index=False)
+        rows += len(frame)
+    return rows
+
+
+def store_years(store_dir):
+    """Years (partitions) present in the store, ascending."""
+    return sorted(int(d.split('=')[1]) for d in os.listdir(store_dir) if d.startswith('year=')) \
+        if os.path.isdir(store_dir) else []
+
+
+def read_store(store_dir, years=None, columns=None):
+    """
+    Read the store, only opening the requested year partitions.
+
+    Parameters:
+        store_dir (str): Store root folder.
+        years (iterable of int | None): Years to read (None = all).
+        columns (list | None): Columns to read (None = all).
+
+    Returns:
+        DataFrame: Rows of the selected partitions, in year and part order.
+    """
+    years = store_years(store_dir) if years is None else sorted(years)
+    frames = []
+    for year in years:
+        for part in sorted(glob.glob(os.path.join(store_dir, f'year={year}', '*.parquet'))):
+            frames.append(pd.read_parquet(part, columns=columns))
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(frames, ignore_index=True)
@@ -1,35 +1,29 @@
 import os
-import pandas as pd
+from weather_store import ingest_csv_files, export_csv
 
-def merge_csv_files(input_folder, output_file):
+def merge_csv_files(input_folder, output_file, store_dir='./weather_store'):
     """
     Merge all CSV files in a folder into a single CSV file.
+    Only new or changed files are parsed: they are validated and appended to the
+    year-partitioned store, and the merged CSV is written from the store.
 
     Parameters:
         input_folder (str): Path to the folder containing CSV files.
         output_file (str): Path to save the merged CSV file.
+        store_dir (str): Path of the year-partitioned store (weather_store/year=YYYY/*.parquet).
     """
-    # List to store individual DataFrames
-    csv_list = []
+    # Ingest new/changed CSV files (file hashes are kept in weather_store/manifest.json)
+    ingested = ingest_csv_files(input_folder, store_dir)
+    if not ingested and os.path.exists(output_file):
+        print(f"No new or changed files, merged CSV is up to date: {output_file}")
+        return
 
-    # Iterate through all files in the input folder
-    for filename in os.listdir(input_folder):
-        # Check if the file is a CSV
-        if filename.endswith('.csv'):
-            file_path = os.path.join(input_folder, filename)
-            print(f"Reading file: {file_path}")
-            # Read the CSV file and append it to the list
-            csv_list.append(pd.read_csv(file_path))
-
-    # Concatenate all DataFrames in the list
-    merged_csv = pd.concat(csv_list, ignore_index=True)
-
-    # Save the merged DataFrame to a new CSV file
-    merged_csv.to_csv(output_file, index=False)
+    # Write the merged CSV one year partition at a time
+    export_csv(store_dir, output_file)
     print(f"Merged CSV saved to: {output_file}")
 
 # Example usage
 input_folder = './1224weather'  # 폴더 경로를 지정하세요
 output_file = './1224weather.csv'  # 병합된 파일 저장 경로를 지정하세요
 
-merge_csv_files(input_folder, output_file)
+merge_csv_files(input_folder, output_file)
\ No newline at end of file
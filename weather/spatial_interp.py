@@ -0,0 +1,219 @@
+###############################################################################
+# 관측 지점 -> 병원/시도 공간 보간 (IDW / 정규 크리깅, 희소 가중치 행렬 재사용)
+###############################################################################
+# 지역 기상값은 이름이 같은 지점 하나(12-24 Korea,station/*_by_region.csv의 '지역')를 쓰거나,
+# 병원은 가까운 지점 하나(고양 -> 서울)로 대신했다.
+# 여기서는 대상(병원, 시도)마다 가까운 지점 k개의 가중 평균으로 값을 만든다.
+#   - 가중치 행렬 W [대상 수 × 지점 수]는 희소 행렬 (행마다 k개만 0이 아님)
+#   - 그날 값이 있는 지점 조합(가용 패턴)마다 W를 한 번만 만들어 캐시
+#     (결측 지점은 빼고 나머지 지점으로 다시 정규화 -> 대부분의 날은 같은 패턴)
+#   - 하루의 전체 대상 값 = W @ (그날 지점 값)  ->  같은 패턴의 날들은 한 번의 희소 행렬 곱
+#   - 변수가 달라도 가용 패턴이 같으면 같은 W를 쓴다
+# IDW     : w_i ∝ 1 / d_i^p
+# 크리깅  : 지수 variogram γ(h) = nugget + sill·(1 − exp(−h / range)) 으로 대상마다 (k+1)×(k+1) 계를 한꺼번에 푼다
+import os
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.spatial import cKDTree
+
+from station_catalog import load_catalog, to_xyz, _chord_to_km
+from weather_qc import station_day_matrix, check_rules, MISSING, RANGE, CONSISTENCY, STUCK
+from weather_cube import WEATHER_VARIABLES
+import _paths  # noqa: F401  (csv_cache, figure_batch, weather_index 경로)
+from csv_cache import load_csv
+
+
+PROVINCE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'provinces.tsv')
+HOSPITAL_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'military', '군병원 정보.csv')
+
+# 보간에서 제외하는 QC 플래그 (결측/범위/일관성/고착 모두)
+EXCLUDE_FLAGS = MISSING | RANGE | CONSISTENCY | STUCK
+
+
+def station_coordinates(names, catalog=None):
+    """
+    Coordinates of station names as used in the daily data (weather.py names).
+
+    Returns:
+        tuple: (lat, lon) arrays; NaN for names without coordinates (e.g. '미확인').
+    """
+    catalog = catalog or load_catalog()
+    coords = catalog.table.set_index('지점번호')[['위도', '경도']]
+    by_name = {name: coords.loc[stn] for stn, name in catalog.mapping.items() if stn in coords.index}
+    lat = np.array([by_name[n]['위도'] if n in by_name else np.nan for n in names], dtype=float)
+    lon = np.array([by_name[n]['경도'] if n in by_name else np.nan for n in names], dtype=float)
+    return lat, lon
+
+
+class SpatialInterpolator:
+    """
+    Station -> target interpolation with sparse weight matrices cached per availability pattern.
+
+    interp = SpatialInterpolator(station_lat, station_lon, target_lat, target_lon, method='idw')
+    fields = interp.interpolate(values)   # values [days, stations] -> [days, targets]
+    """
+
+    def __init__(self, station_lat, station_lon, target_lat, target_lon, method='idw', k=6, power=2.0,
+                 max_km=None, variogram=(0.0, 1.0, 100.0)):
+        """
+        Parameters:
+            station_lat, station_lon (array-like): Station coordinates (NaN = no coordinates, never used).
+            target_lat, target_lon (array-like): Target coordinates.
+            method (str): 'idw' or 'kriging'.
+            k (int): Stations per target.
+            power (float): IDW power.
+            max_km (float | None): Ignore stations farther than this.
+            variogram (tuple): (nugget, sill, range km) of the exponential variogram for kriging.
+        """
+        if method not in ('idw', 'kriging'):
+            raise ValueError(f"method는 'idw' 또는 'kriging'입니다: {method!r}")
+        self.station_xyz = to_xyz(station_lat, station_lon)
+        self.has_coords = ~np.isnan(self.station_xyz).any(axis=1)
+        self.target_xyz = to_xyz(target_lat, target_lon)
+        self.method = method
+        self.k = k
+        self.power = power
+        self.max_km = max_km
+        self.variogram = variogram
+        self._weights = {}  # 가용 패턴 bytes -> CSR [대상, 지점]
+
+    def _gamma(self, h):
+        nugget, sill, rng = self.variogram
+        return np.where(h > 0, nugget + sill * (1.0 - np.exp(-h / rng)), 0.0)
+
+    def weights(self, available):
+        """
+        Sparse weight matrix for one availability pattern (cached).
+
+        Parameters:
+            available (ndarray of bool): Stations with a value.
+
+        Returns:
+            csr_matrix: [targets, stations]; each row sums to 1 (empty row if no station in reach).
+        """
+        key = np.packbits(available).tobytes()
+        if key in self._weights:
+            return self._weights[key]
+
+        use = np.flatnonzero(available & self.has_coords)
+        n_targets, n_stations = len(self.target_xyz), len(self.station_xyz)
+        if len(use) == 0:
+            W = sparse.csr_matrix((n_targets, n_stations))
+            self._weights[key] = W
+            return W
+
+        k = min(self.k, len(use))
+        chord, idx = cKDTree(self.station_xyz[use]).query(self.target_xyz, k=k)
+        chord, idx = chord.reshape(n_targets, k), idx.reshape(n_targets, k)
+        dist = _chord_to_km(chord)
+        valid = np.ones(dist.shape, dtype=bool) if self.max_km is None else dist <= self.max_km
+
+        if self.method == 'idw':
+            with np.errstate(divide='ignore'):
+                w = np.where(valid, 1.0 / np.maximum(dist, 1e-6) ** self.power, 0.0)
+            exact = dist < 1e-6  # 대상이 지점 위치와 같으면 그 지점 값
+            w = np.where(exact.any(axis=1, keepdims=True), exact.astype(float), w)
+        else:
+            w = self._kriging_weights(use[idx], dist, valid)
+
+        total = w.sum(axis=1, keepdims=True)
+        w = np.divide(w, total, out=np.zeros_like(w), where=total != 0)
+        rows = np.repeat(np.arange(n_targets), k)
+        W = sparse.csr_matrix((w.ravel(), (rows, use[idx].ravel())), shape=(n_targets, n_stations))
+        W.eliminate_zeros()
+        self._weights[key] = W
+        return W
+
+    def _kriging_weights(self, neighbors, dist, valid):
+        """정규 크리깅 가중치: 대상마다 (k+1)×(k+1) 계를 np.linalg.solve로 한꺼번에 푼다."""
+        n, k = neighbors.shape
+        xyz = self.station_xyz[neighbors]  # [n, k, 3]
+        pair = _chord_to_km(np.linalg.norm(xyz[:, :, None, :] - xyz[:, None, :, :], axis=-1))
+        A = np.ones((n, k + 1, k + 1))
+        A[:, :k, :k] = self._gamma(pair)
+        A[:, k, k] = 0.0
+        b = np.ones((n, k + 1))
+        b[:, :k] = self._gamma(dist)
+        w = np.linalg.solve(A + 1e-9 * np.eye(k + 1), b[..., None])[:, :k, 0]
+        return np.where(valid, w, 0.0)  # max_km 밖 지점은 빼고 weights()에서 다시 정규화
+
+    def interpolate(self, values):
+        """
+        Interpolate every day at once.
+
+        Parameters:
+            values (ndarray): [days, stations] with NaN for missing values.
+
+        Returns:
+            ndarray: [days, targets]; days with the same availability pattern share one sparse product.
+        """
+        values = np.asarray(values, dtype=float)
+        available = ~np.isnan(values)
+        patterns, inverse = np.unique(np.packbits(available, axis=1), axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+        out = np.full((values.shape[0], len(self.target_xyz)), np.nan)
+        filled = np.nan_to_num(values)
+        for p in range(len(patterns)):
+            days = np.flatnonzero(inverse == p)
+            W = self.weights(available[days[0]])
+            result = (W @ filled[days].T).T
+            reach = np.asarray(W.sum(axis=1)).ravel() > 0
+            out[np.ix_(days, reach)] = result[:, reach]
+        return out
+
+
+###############################################################################
+# 대상 목록과 일자료 보간
+###############################################################################
+def load_provinces(path=PROVINCE_FILE):
+    """시도 대표 좌표 (도청/시청 소재지): 이름 열 '시도'"""
+    return load_csv(path, encoding='utf-8', use_cache=False, sep='\t').rename(columns={'시도': '대상'})
+
+
+def load_hospitals(path=HOSPITAL_FILE):
+    """군병원 좌표: 이름 열 '병원명' -> '대상'"""
+    return load_csv(path)[['병원명', '위도', '경도']].rename(columns={'병원명': '대상'})
+
+
+def interpolate_daily(data, targets, variables=WEATHER_VARIABLES, method='idw', catalog=None, **kwargs):
+    """
+    Interpolate daily station values onto targets for all days and variables.
+
+    Parameters:
+        data (DataFrame): Daily rows (관측시각 (KST), 지역 or 국내 지점번호, variables).
+        targets (DataFrame): 대상, 위도, 경도 (see load_provinces / load_hospitals).
+        variables (list): Variables to interpolate (weights are shared between variables).
+        method (str): 'idw' or 'kriging'.
+        **kwargs: Passed to SpatialInterpolator (k, power, max_km, variogram).
+
+    Returns:
+        DataFrame: 관측시각 (KST) (YYYYMMDD), 대상, variables (rounded to 0.1).
+    """
+    variables = list(variables)
+    values, present, stations, days, _ = station_day_matrix(data, variables)
+    flags, values = check_rules(values, variables)  # 강수/적설 '현상 없음'은 0
+    values = np.where((flags & EXCLUDE_FLAGS) > 0, np.nan, values)
+
+    lat, lon = station_coordinates(stations, catalog)
+    interp = SpatialInterpolator(lat, lon, targets['위도'].to_numpy(), targets['경도'].to_numpy(),
+                                 method=method, **kwargs)
+
+    n_days, n_targets = len(days), len(targets)
+    result = pd.DataFrame({
+        '관측시각 (KST)': np.repeat(days.strftime('%Y%m%d').astype(int), n_targets),
+        '대상': np.tile(targets['대상'].to_numpy(), n_days),
+    })
+    for i, v in enumerate(variables):
+        result[v] = np.round(interp.interpolate(values[:, :, i].T).ravel(), 1)
+    return result
+
+
+if __name__ == "__main__":
+    # 2012~2024 일자료 -> 군병원/시도별 일별 보간값
+    weather = load_csv('./12-24weather.csv')
+    for name, targets in [('hospital', load_hospitals()), ('province', load_provinces())]:
+        daily = interpolate_daily(weather, targets, method='idw', k=6)
+        daily.to_csv(f'./{name}_weather_idw.csv', index=False, encoding='utf-8-sig')
+        print(f"'{name}_weather_idw.csv' 저장 완료 ({len(daily)}행)")
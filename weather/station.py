@@ -1,113 +1,13 @@
-import pandas as pd
-import io
+import warnings
+warnings.filterwarnings('ignore')
+from station_catalog import load_catalog
 
-# 데이터 텍스트를 문자열로 저장
-data = """
-지점번호	종료시각	시작시각	(현)지점명	(현)주소	위도	경도	노장 해발고도(m)	관측장비지상높이(m) 기압계	기온계	풍속계	강우계
- 90	~	 1968.01.01 00:00:00	 속초	 강원도 고성군 토성면 봉포리	 38.25085	 128.56473	 17.53	 18.73	 1.7	 10.0	 1.4
- 93	~	 2016.10.01 00:00:00	 북춘천	 	 37.94738	 127.75443	 95.78	 96.78	 1.5	 10.0	 1.4
- 95	~	 1988.01.01 00:00:00	 철원	 강원도 철원군 갈말읍 군탄리	 38.14787	 127.3042	 155.48	 156.98	 1.8	 13.0	 1.5
- 98	~	 1998.02.01 00:00:00	 동두천	 경기도 동두천시 생연동	 37.90188	 127.0607	 115.62	 116.74	 1.7	 10.0	 1.0
- 99	~	 2001.12.07 00:00:00	 파주	 경기도 파주시 문산읍 운천리	 37.88589	 126.76648	 30.59	 31.99	 1.7	 10.0	 1.0
- 100	~	 1971.07.15 00:00:00	 대관령	 강원도 평창군 대관령면 횡계리	 37.67713	 128.71834	 772.43	 773.43	 1.7	 10.0	 1.4
- 101	~	 1966.01.01 00:00:00	 춘천	 강원도 춘천시 우두동	 37.90262	 127.7357	 75.82	 77.05	 1.5	 10.0	 1.4
- 102	~	 2000.11.01 00:00:00	 백령도	 인천광역시 옹진군 백령면 연화리	 37.97396	 124.71237	 36.0	 37.2	 1.8	 9.0	 1.2
- 104	~	 2008.07.28 09:00:00	 북강릉	 강원도 강릉시 사천면 방동리	 37.80456	 128.85535	 75.24	 76.67	 1.7	 10.0	 1.4
- 105	~	 1911.10.03 00:00:00	 강릉	 강원도 강릉시 용강동	 37.75147	 128.89099	 27.12	 28.22	 1.7	 10.0	 0.5
- 106	~	 1992.05.01 00:00:00	 동해	 강원도 동해시 용정동	 37.50709	 129.12433	 40.46	 41.66	 1.7	 10.0	 1.4
- 108	~	 1907.10.01 00:00:00	 서울	 서울특별시 종로구 송월동	 37.57142	 126.9658	 85.67	 86.67	 1.5	 10.0	 0.5
- 112	~	 1904.08.29 00:00:00	 인천	 인천광역시 중구 전동	 37.47772	 126.6249	 68.99	 70.19	 1.6	 10.0	 1.2
- 114	~	 1971.09.06 00:00:00	 원주	 강원도 원주시 명륜동	 37.33749	 127.94659	 150.11	 151.11	 1.7	 14.0	 1.4
- 115	~	 1938.08.10 00:00:00	 울릉도	 경상북도 울릉군 울릉읍 도동리	 37.48129	 130.89864	 221.14	 223.7	 1.6	 10.0	 1.3
- 119	~	 1964.01.01 00:00:00	 수원	 경기도 수원시 권선구 서둔동	 37.25746	 126.983	 39.81	 40.81	 1.6	 18.7	 1.1
- 121	~	 1994.12.01 00:00:00	 영월	 강원도 영월군 영월읍 하송리	 37.18126	 128.45743	 240.54	 242.05	 1.7	 10.0	 1.4
- 127	~	 1972.01.01 00:00:00	 충주	 충청북도 충주시 안림동	 36.97045	 127.9525	 114.85	 116.25	 1.65	 10.0	 1.0
- 129	~	 1968.01.01 00:00:00	 서산	 충청남도 서산시 수석동	 36.77658	 126.4939	 25.25	 26.55	 1.6	 20.2	 1.1
- 130	~	 1971.01.12 00:00:00	 울진	 경상북도 울진군 울진읍 연지리	 36.99176	 129.41278	 48.98	 50.18	 1.75	 10.0	 1.3
- 131	~	 1967.01.01 00:00:00	 청주	 충청북도 청주시흥덕구 복대동	 36.63924	 127.44066	 58.7	 60.1	 1.7	 10.0	 0.8
- 133	~	 1969.01.01 00:00:00	 대전	 대전광역시 유성구 구성동	 36.37199	 127.3721	 67.79	 68.49	 1.4	 23.7	 1.0
- 135	~	 1937.01.11 00:00:00	 추풍령	 충청북도 영동군 추풍령면 관리	 36.22025	 127.99458	 244.98	 246.18	 1.6	 10.0	 1.1
- 136	~	 1973.01.01 00:00:00	 안동	 경상북도 안동시 운안동	 36.57293	 128.70734	 141.26	 142.76	 1.8	 10.0	 1.3
- 137	~	 2002.01.01 00:00:00	 상주	 경상북도 상주시 낙양동	 36.40837	 128.15741	 96.58	 97.98	 1.8	 10.0	 1.4
- 138	~	 1943.01.01 00:00:00	 포항	 경상북도 포항시남구 송도동	 36.03201	 129.38002	 3.94	 4.92	 1.6	 10.0	 1.2
- 140	~	 1968.01.01 00:00:00	 군산	 전라북도 군산시 내흥동	 36.0053	 126.76135	 27.85	 24.6	 1.7	 10.0	 1.0
- 143	~	 1907.01.31 00:00:00	 대구	 대구광역시 동구 효목동	 35.87797	 128.65295	 54.27	 55.52	 1.8	 10.0	 0.6
- 146	~	 1918.06.23 00:00:00	 전주	 전라북도 전주시덕진구 덕진동2가	 35.84092	 127.11718	 60.44	 62.9	 1.6	 10.0	 1.4
- 152	~	 1932.01.06 00:00:00	 울산	 울산광역시 중구 북정동	 35.58237	 129.33469	 81.14	 83.2	 1.8	 10.0	 1.3
- 155	~	 1985.07.01 00:00:00	 창원	 경상남도 창원시 마산합포구 가포동	 35.17019	 128.57281	 34.97	 39.1	 1.7	 10.0	 1.3
- 156	~	 1939.05.01 00:00:00	 광주	 광주광역시 북구 운암동	 35.17294	 126.89156	 70.28	 73.9	 1.7	 17.5	 0.8
- 159	~	 1904.04.09 00:00:00	 부산	 부산광역시 중구 대청동1가	 35.10468	 129.03203	 69.56	 70.9	 1.5	 18.0	 1.3
- 162	~	 1968.01.01 00:00:00	 통영	 경상남도 통영시 정량동	 34.84541	 128.43561	 31.24	 33.2	 1.5	 18.0	 1.3
- 165	~	 1904.04.08 00:00:00	 목포	 전라남도 목포시 연산동	 34.81732	 126.38151	 44.7	 39.2	 1.5	 14.5	 1.0
- 168	~	 1942.03.01 00:00:00	 여수	 전라남도 여수시 중앙동	 34.73929	 127.74063	 65.93	 66.1	 1.5	 13.0	 0.6
- 169	~	 1997.01.01 00:00:00	 흑산도	 전라남도 신안군 흑산면 예리	 34.68719	 125.45105	 75.12	 78.0	 1.5	 15.5	 0.6
- 170	~	 1971.01.31 00:00:00	 완도	 전라남도 완도군 군외면 불목리	 34.3959	 126.70182	 35.37	 36.7	 1.5	 10.0	 0.8
- 172	~	 2010.12.01 00:00:00	 고창	 전라북도 고창군 대산면 매산리	 35.34824	 126.599	 52.42	 53.5	 1.8	 10.0	 1.7
- 174	~	 2011.04.01 00:00:00	 순천	 전라남도 순천시 승주읍 평중리	 35.0204	 127.3694	 165.0	 166.5	 1.5	 10.0	 0.8
- 177	~	 2015.11.03 15:00:00	 홍성	 	 36.65759	 126.68772	 27.74	 28.7	 1.5	 10.0	 1.5
- 181	~	 2022.01.21 00:00:00	 서청주	 	 36.63994	 127.38458	 33.55	 33.55	 1.5	 10.0	 0.5
- 184	~	 1923.05.01 00:00:00	 제주	 제주특별자치도 제주시 건입동	 33.51411	 126.52969	 20.79	 21.99	 1.7	 15.0	 1.5
- 185	~	 1988.01.01 00:00:00	 고산	 제주특별자치도 제주시 한경면 고산리	 33.29382	 126.16283	 71.39	 72.49	 1.7	 10.0	 1.5
- 188	~	 1971.07.15 00:00:00	 성산	 제주특별자치도 서귀포시 성산읍 신산리	 33.38677	 126.8802	 20.34	 21.74	 1.7	 10.0	 1.5
- 189	~	 1961.01.01 00:00:00	 서귀포	 제주특별자치도 서귀포시 서귀동	 33.24616	 126.5653	 51.86	 53.16	 1.7	 10.0	 1.5
- 192	~	 1969.03.01 00:00:00	 진주	 경상남도 진주시 평거동	 35.16378	 128.04004	 29.35	 31.6	 1.8	 10.0	 1.3
- 201	~	 1972.01.11 00:00:00	 강화	 인천광역시 강화군 불은면 삼성리	 37.70739	 126.44634	 47.84	 49.24	 1.6	 10.0	 0.6
- 202	~	 1972.01.11 00:00:00	 양평	 경기도 양평군 양평읍 양근리	 37.48863	 127.49446	 47.26	 48.76	 1.9	 10.0	 0.6
- 203	~	 1972.01.11 00:00:00	 이천	 경기도 이천시 부발읍 신하리	 37.26399	 127.48421	 80.09	 81.59	 1.8	 10.0	 0.6
- 211	~	 1971.12.01 00:00:00	 인제	 강원도 인제군 인제읍 남북리	 38.05986	 128.16714	 201.78	 202.78	 1.5	 10.0	 0.5
- 212	~	 1971.09.27 00:00:00	 홍천	 강원도 홍천군 홍천읍 연봉리	 37.6836	 127.88043	 140.2	 141.2	 1.6	 13.0	 0.5
- 216	~	 1985.08.01 00:00:00	 태백	 강원도 태백시 황지동	 37.17038	 128.98929	 714.45	 715.25	 1.6	 16.0	 0.6
- 217	~	 2010.08.06 00:00:00	 정선군	 강원도 정선군 정선읍 북실리	 37.37732	 128.67348	 312.0	 312.0	 1.5	 10.0	 0.5
- 221	~	 1972.01.11 00:00:00	 제천	 충청북도 제천시 신월동	 37.15928	 128.19434	 264.62	 265.39	 1.5	 10.0	 0.5
- 226	~	 1972.01.09 00:00:00	 보은	 충청북도 보은군 보은읍 성주리	 36.48761	 127.73415	 171.31	 172.71	 1.5	 10.0	 0.5
- 232	~	 1972.01.08 00:00:00	 천안	 충청남도 천안시 신방동	 36.76217	 127.29282	 84.78	 83.0	 1.8	 10.0	 1.2
- 235	~	 1972.01.24 00:00:00	 보령	 충청남도 보령시 요암동	 36.32724	 126.55744	 9.98	 17.0	 1.6	 10.0	 1.1
- 236	~	 1972.01.09 00:00:00	 부여	 충청남도 부여군 부여읍 가탑리	 36.27242	 126.92079	 13.42	 14.88	 1.7	 10.0	 0.5
- 238	~	 1972.01.09 00:00:00	 금산	 충청남도 금산군 금산읍 아인리	 36.10563	 127.48175	 172.69	 173.99	 1.5	 10.0	 0.5
- 239	~	 2019.05.31 10:00:00	 세종	 	 36.48522	 127.24438	 89.5	 95.0	 1.6	 10.0	 1.0
- 243	~	 1972.03.01 00:00:00	 부안	 전라북도 부안군 행안면 역리	 35.72961	 126.71657	 12.2	 13.5	 1.8	 10.0	 0.6
- 244	~	 1970.06.02 00:00:00	 임실	 전라북도 임실군 임실읍 이도리	 35.61203	 127.28556	 247.04	 248.44	 1.8	 10.0	 0.6
- 245	~	 1970.01.05 00:00:00	 정읍	 전라북도 정읍시 상동	 35.56337	 126.83904	 68.7	 70.97	 1.9	 10.0	 1.0
- 247	~	 1972.01.04 00:00:00	 남원	 전라북도 남원시 도통동	 35.4213	 127.39652	 133.49	 91.8	 1.7	 10.0	 0.7
- 248	~	 1988.01.01 00:00:00	 장수	 전라북도 장수군 장수읍 선창리	 35.65696	 127.52031	 406.87	 408.0	 1.6	 10.0	 0.5
- 251	~	 2007.11.01 00:00:00	 고창군	 전라북도 고창군 고창읍 덕산리	 35.42661	 126.697	 58.84	 55.5	 1.7	 10.0	 0.6
- 252	~	 2007.11.26 00:00:00	 영광군	 전라남도 영광군 군서면 만곡리	 35.28366	 126.47784	 37.2	 38.7	 1.5	 13.0	 0.6
- 253	~	 2008.02.13 14:00:00	 김해시	 경상남도 김해시 부원동	 35.22981	 128.89075	 54.59	 54.6	 1.7	 10.0	 0.5
- 254	~	 2008.07.16 20:00:00	 순창군	 전라북도 순창군 순창읍 교성리	 35.37131	 127.1286	 129.38	 128.4	 1.6	 10.0	 0.6
- 255	~	 2008.12.26 00:00:00	 북창원	 경상남도 창원시 내동	 35.22655	 128.6726	 50.95	 50.3	 1.8	 10.0	 0.7
- 257	~	 2008.12.26 00:00:00	 양산시	 경상남도 양산시 동면 금산리	 35.30737	 129.0201	 6.29	 16.1	 1.8	 10.0	 0.6
- 258	~	 2010.02.08 00:00:00	 보성군	 전라남도 보성군 득량면 예당리	 34.76335	 127.21226	 1.41	 4.3	 1.5	 10.0	 0.6
- 259	~	 2009.11.10 00:00:00	 강진군	 전라남도 강진군 강진읍 남포리	 34.64457	 126.78408	 16.0	 20.0	 1.5	 10.0	 0.6
- 260	~	 1972.01.21 00:00:00	 장흥	 전라남도 장흥군 장흥읍 축내리	 34.68886	 126.91951	 43.99	 46.3	 1.5	 10.0	 0.8
- 261	~	 1971.02.03 00:00:00	 해남	 전라남도 해남군 해남읍 남천리	 34.55375	 126.56907	 16.36	 17.91	 1.5	 10.0	 0.8
- 262	~	 1972.01.22 00:00:00	 고흥	 전라남도 고흥군 고흥읍 행정리	 34.61826	 127.27572	 51.91	 53.31	 1.5	 10.0	 0.8
- 263	~	 2010.06.21 00:00:00	 의령군	 경상남도 의령군 의령읍 무전리	 35.32258	 128.28812	 14.1	 14.9	 2.0	 10.0	 0.6
- 264	~	 2010.06.21 00:00:00	 함양군	 경상남도 함양군 함양읍 용평리	 35.51138	 127.74538	 152.07	 152.5	 1.8	 10.0	 0.6
- 266	~	 2011.01.01 00:00:00	 광양시	 전라남도 광양시 중동	 34.9434	 127.6914	 88.21	 87.9	 1.7	 10.0	 0.6
- 268	~	 2014.05.09 21:15:00	 진도군	 전라남도 진도군 진도읍 남동리	 34.47296	 126.25846	 9.82	 6.9	 1.7	 10.0	 0.6
- 271	~	 1988.01.01 00:00:00	 봉화	 경상북도 봉화군 춘양면 의양리	 36.94361	 128.91449	 324.67	 326.22	 1.9	 10.0	 0.6
- 272	~	 1972.11.28 00:00:00	 영주	 경상북도 영주시 풍기읍 성내리	 36.87183	 128.51688	 211.32	 212.78	 1.91	 10.0	 0.58
- 273	~	 1973.01.01 00:00:00	 문경	 경상북도 문경시 유곡동	 36.62727	 128.14879	 173.01	 174.51	 1.8	 10.0	 0.6
- 276	~	 2010.09.01 00:00:00	 청송군	 경상북도 청송군 청송읍	 36.4351	 129.04005	 208.65	 210.2	 1.75	 10.0	 0.5
- 277	~	 1972.01.03 00:00:00	 영덕	 경상북도 영덕군 영해면 성내리	 36.53337	 129.40926	 40.71	 42.01	 1.7	 10.0	 0.6
- 278	~	 1973.01.01 00:00:00	 의성	 경상북도 의성군 의성읍 원당리	 36.3561	 128.68864	 81.44	 82.94	 1.7	 10.0	 0.6
- 279	~	 1973.01.01 00:00:00	 구미	 경상북도 구미시 남통동	 36.13055	 128.32056	 49.17	 50.67	 1.7	 10.0	 1.4
- 281	~	 1972.01.21 00:00:00	 영천	 경상북도 영천시 망정동	 35.97742	 128.9514	 96.12	 97.62	 1.7	 10.0	 0.5
- 283	~	 2010.08.06 00:00:00	 경주시	 경상북도 경주시 탑동	 35.8174	 129.2009	 40.13	 41.63	 1.67	 10.0	 0.59
- 284	~	 1972.01.24 00:00:00	 거창	 경상남도 거창군 거창읍 정장리	 35.66739	 127.9099	 228.45	 227.3	 1.5	 10.0	 1.3
- 285	~	 1973.01.01 00:00:00	 합천	 경상남도 합천군 합천읍 합천리	 35.56505	 128.16994	 26.72	 33.2	 1.5	 10.0	 0.5
- 288	~	 1973.01.01 00:00:00	 밀양	 경상남도 밀양시 내이동	 35.49147	 128.74413	 8.31	 12.5	 2.0	 10.0	 1.3
- 289	~	 1972.03.30 00:00:00	 산청	 경상남도 산청군 산청읍 지리	 35.413	 127.8791	 138.22	 138.8	 1.6	 10.0	 0.6
- 294	~	 1972.01.24 00:00:00	 거제	 경상남도 거제시 신현읍 장평리	 34.88818	 128.60458	 44.83	 46.7	 1.7	 10.0	 0.6
- 295	~	 1972.01.24 00:00:00	 남해	 경상남도 남해군 이동면 다정리	 34.81662	 127.92641	 45.71	 47.01	 1.8	 10.0	 0.8
- 296	~	 2023.01.11 00:00:00	 북부산	 	 35.21778	 128.96024	 3.0	 4.5	 1.5	 10.0	 0.7
-"""
-
-# 데이터를 데이터프레임으로 변환
-df = pd.read_csv(io.StringIO(data), delim_whitespace=True, skiprows=1)
+# 지점 목록(stations.tsv: 지점번호, 관측 시작/종료 시각, 지점명, 주소, 위도, 경도, 해발고도 등) 로드
+catalog = load_catalog()
 
 # 지점번호와 지점명 매핑을 딕셔너리로 생성
-station_mapping = dict(zip(df['지점번호'], df['(현)지점명']))
+station_mapping = catalog.mapping
 
 # 결과 출력
+print(catalog.table[['지점번호', '지점명', '위도', '경도', '노장해발고도(m)', '시작시각']])
 print(station_mapping)
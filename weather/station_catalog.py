@@ -0,0 +1,170 @@
+###############################################################################
+# ASOS 관측 지점 목록 + 최근접 지점 검색 (KD-tree)
+###############################################################################
+# 지점 정보(위도/경도/해발고도/관측 시작·종료 시각)는 stations.tsv 한 곳에서 읽는다.
+# (station.py에 붙여넣은 텍스트와 weather.py의 station_mapping을 대체)
+# 좌표는 지구 중심 직교좌표(ECEF, km)로 바꿔 scipy cKDTree에 넣으므로
+# 병원/시군구 등 좌표 목록 전체의 k개 최근접 지점을 한 번의 query로 구한다.
+#   직교좌표 거리(현의 길이) 순서 = 구면 거리 순서 -> 결과 거리는 대원 거리(km)로 변환해서 반환
+import os
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+import _paths  # noqa: F401  (csv_cache, figure_batch, weather_index 경로)
+from csv_cache import load_csv
+
+
+STATION_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'stations.tsv')
+EARTH_RADIUS_KM = 6371.0
+
+# weather.py의 기존 지점명 표기 중 목록과 다른 것 (기존 CSV 출력과 같게 유지)
+#   - 175(고산), 256(해남군): 응답에는 나오지만 목록에 좌표가 없는 지점
+#   - 185: 목록에는 '고산'이지만 기존 CSV에는 '고산(제주)'로 저장됨
+NAME_OVERRIDES = {175: "고산", 185: "고산(제주)", 256: "해남군"}
+
+
+def to_xyz(lat, lon):
+    """위도/경도(도) -> 지구 중심 직교좌표 (km), shape [n, 3]"""
+    lat = np.radians(np.asarray(lat, dtype=float))
+    lon = np.radians(np.asarray(lon, dtype=float))
+    return EARTH_RADIUS_KM * np.column_stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)])
+
+
+def _chord_to_km(chord):
+    """직교좌표 거리(현) -> 대원 거리 (km)"""
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.clip(chord / (2 * EARTH_RADIUS_KM), 0, 1))
+
+
+class StationCatalog:
+    """
+    Station table with a spatial index.
+
+    catalog = load_catalog()
+    catalog.mapping                      # {station ID: name} for parsing API responses
+    catalog.nearest(lat, lon, k=3)       # k nearest active stations for many points at once
+    """
+
+    def __init__(self, table):
+        self.table = table.reset_index(drop=True)
+        self._trees = {}  # 활성 지점 조합별 KD-tree 캐시
+
+    @property
+    def mapping(self):
+        """Station ID -> name, including the names weather.py has always written."""
+        mapping = dict(zip(self.table['지점번호'], self.table['지점명']))
+        mapping.update(NAME_OVERRIDES)
+        return dict(sorted(mapping.items()))
+
+    def active(self, start=None, end=None):
+        """
+        Boolean mask of stations operating over the whole [start, end] period.
+
+        Parameters:
+            start, end (str | Timestamp | None): Period bounds (None = unbounded on that side).
+
+        Returns:
+            ndarray of bool: One flag per catalog row.
+        """
+        mask = np.ones(len(self.table), dtype=bool)
+        if start is not None:
+            mask &= (self.table['시작시각'] <= pd.Timestamp(start)).to_numpy()
+        last = end if end is not None else start  # 이 시점까지 관측이 이어져야 함
+        if last is not None:
+            mask &= (self.table['종료시각'].isna() | (self.table['종료시각'] >= pd.Timestamp(last))).to_numpy()
+        return mask
+
+    def _tree(self, mask):
+        key = mask.tobytes()
+        if key not in self._trees:
+            rows = np.flatnonzero(mask)
+            xyz = to_xyz(self.table['위도'].to_numpy()[rows], self.table['경도'].to_numpy()[rows])
+            self._trees[key] = (cKDTree(xyz), rows)
+        return self._trees[key]
+
+    def nearest(self, lat, lon, k=1, start=None, end=None):
+        """
+        Find the k nearest active stations for every point in one batched query.
+
+        Parameters:
+            lat, lon (array-like): Point coordinates in degrees.
+            k (int): Number of stations per point.
+            start, end: Only stations operating over this period are considered (see active).
+
+        Returns:
+            tuple: (station IDs [n, k], distances in km [n, k]), nearest first.
+        """
+        tree, rows = self._tree(self.active(start, end))
+        k = min(k, len(rows))
+        chord, idx = tree.query(to_xyz(lat, lon), k=k)
+        chord, idx = chord.reshape(-1, k), idx.reshape(-1, k)
+        stn = self.table['지점번호'].to_numpy()[rows[idx]]
+        return stn, _chord_to_km(chord)
+
+    def join(self, points, k=1, lat_col='위도', lon_col='경도', start=None, end=None):
+        """
+        Attach the k nearest active stations to each row of a coordinate table.
+
+        Parameters:
+            points (DataFrame): Rows with latitude/longitude columns.
+            k (int): Number of stations per row.
+            lat_col, lon_col (str): Coordinate column names.
+            start, end: Period the stations must cover.
+
+        Returns:
+            DataFrame: One row per (point, rank) with the point's columns plus
+                       순위, 지점번호, 지점명, 거리(km).
+        """
+        stn, dist = self.nearest(points[lat_col], points[lon_col], k=k, start=start, end=end)
+        k = stn.shape[1]
+        names = self.mapping
+        result = points.loc[points.index.repeat(k)].reset_index(drop=True)
+        result['순위'] = np.tile(np.arange(1, k + 1), len(points))
+        result['지점번호'] = stn.ravel()
+        result['지점명'] = [names[s] for s in stn.ravel()]
+        result['거리(km)'] = dist.ravel().round(2)
+        return result
+
+
+def load_catalog(path=STATION_FILE):
+    """
+    Load the station table (stations.tsv).
+
+    Returns:
+        StationCatalog: 종료시각 is NaT for stations still operating ('~').
+    """
+    table = load_csv(path, encoding='utf-8', use_cache=False, sep='\t', dtype={'주소': str})
+    table['시작시각'] = pd.to_datetime(table['시작시각'], format='%Y.%m.%d %H:%M:%S')
+    table['종료시각'] = pd.to_datetime(table['종료시각'].replace('~', None), format='%Y.%m.%d %H:%M:%S')
+    return StationCatalog(table)
+
+
+def hospital_stations(hospital_file, k=3, start=None, end=None, catalog=None):
+    """
+    Compute the hospital -> nearest weather station join.
+
+    Parameters:
+        hospital_file (str | list of str): CSV(s) with 병원명, 위도, 경도
+            (military/군병원 정보.csv, plus military/군병원 추가 좌표.csv for the hospitals it lacks).
+        k (int): Number of stations per hospital.
+        start, end: Period the stations must cover (e.g. the analysis period).
+        catalog (StationCatalog | None): Defaults to load_catalog().
+
+    Returns:
+        DataFrame: 병원명, 위도, 경도, 순위, 지점번호, 지점명, 거리(km).
+    """
+    catalog = catalog or load_catalog()
+    files = [hospital_file] if isinstance(hospital_file, str) else list(hospital_file)
+    hospitals = pd.concat([load_csv(f)[['병원명', '위도', '경도']] for f in files], ignore_index=True)
+    return catalog.join(hospitals, k=k, start=start, end=end)
+
+
+if __name__ == "__main__":
+    # 군병원별 최근접 관측 지점 3곳 (2012~2024년 내내 관측한 지점만)
+    # 군병원 정보.csv에 없는 5곳(부산, 원주, 포항, 해양의료원, 항공우주의료원)은 추가 좌표 파일에서 읽는다
+    joined = hospital_stations(["../military/군병원 정보.csv", "../military/군병원 추가 좌표.csv"],
+                               k=3, start="2012-01-01", end="2024-12-31")
+    print(joined[joined['순위'] == 1])
+    joined.to_csv("병원위치-지역.csv", index=False, encoding="utf-8-sig")
+    print("병원-관측 지점 매핑이 '병원위치-지역.csv' 파일로 저장되었습니다.")
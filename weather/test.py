@@ -1,4 +1,5 @@
 import pandas as pd
+from weather_qc import run_qc
 
 # 파일 경로
 file_path = './1224weather.csv'
@@ -13,6 +14,13 @@ except UnicodeDecodeError:
 df_cleaned = df.dropna(how='all')  # NaN 값만 있는 행 제거
 df_cleaned = df_cleaned.loc[~(df_cleaned == "").all(axis=1)]  # 빈 문자열만 있는 행 제거
 
+# 품질 검사: 결측 부호/불가능한 값/최고<최저/센서 고착 -> QC, QC_REPAIR 열 추가
+# (repair='both'면 인접 지점 평균 -> 시간 보간 순으로 보정하고 보정 방법을 QC_REPAIR에 기록)
+qc = run_qc(df_cleaned, repair=None)
+df_cleaned = qc.data
+print(qc.summary().sort_values('가용률').head(10))
+qc.summary().to_csv("qc_station_summary.csv", index=False, encoding='cp949')
+
 # 결과 저장
 output_path = "cleaned_1224weather.csv"
 df_cleaned.to_csv(output_path, index=False, encoding='cp949')  # 저장 시에도 인코딩 유지
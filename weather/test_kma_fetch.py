@@ -0,0 +1,78 @@
+###############################################################################
+# kma_fetch 재시도/이어받기 검사 (로컬 대체 서버)
+###############################################################################
+# python -m pytest weather/test_kma_fetch.py
+import os
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from kma_fetch import make_chunks, fetch_chunks_async, chunk_path, check_body, IncompleteResponse
+
+
+COMPLETE = (b'#START7777\n'
+            b'# YYMMDD STN WS_AVG\n'
+            b'20240101 108 1.5\n'
+            b'20240101 112 2.0\n'
+            b'#7777END\n')
+
+
+def _fetch(tmp_path, bodies):
+    """bodies를 차례로 돌려주는 대체 서버로 청크 1개를 받는다. 반환: (파일 경로, 요청 수)"""
+    calls = []
+
+    async def handler(request):
+        calls.append(request.query['tm1'])
+        return web.Response(body=bodies[min(len(calls), len(bodies)) - 1])
+
+    async def run():
+        app = web.Application()
+        app.router.add_get('/kma', handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            return await fetch_chunks_async(make_chunks('20240101', '20240102'), 'key', str(tmp_path),
+                                            base_url=f'http://127.0.0.1:{port}/kma', rate=0,
+                                            max_retries=2, backoff=0.01)
+        finally:
+            await runner.cleanup()
+
+    paths = asyncio.run(run())
+    return paths[0], len(calls)
+
+
+def test_truncated_200_is_retried(tmp_path):
+    path, calls = _fetch(tmp_path, [COMPLETE[:-12], COMPLETE])
+    assert calls == 2
+    with open(path, 'rb') as f:
+        assert f.read() == COMPLETE
+
+
+def test_error_page_is_never_saved(tmp_path):
+    with pytest.raises(RuntimeError, match='재시도 초과'):
+        _fetch(tmp_path, [b'<html>authKey error</html>'])
+    assert not os.listdir(tmp_path)
+
+
+def test_incomplete_cached_chunk_is_downloaded_again(tmp_path):
+    chunk = make_chunks('20240101', '20240102')[0]
+    with open(chunk_path(str(tmp_path), chunk), 'wb') as f:
+        f.write(COMPLETE[:20])
+    path, calls = _fetch(tmp_path, [COMPLETE])
+    assert calls == 1
+    with open(path, 'rb') as f:
+        assert f.read() == COMPLETE
+
+    _, calls = _fetch(tmp_path, [COMPLETE])  # 완전한 파일은 다시 받지 않는다
+    assert calls == 0
+
+
+def test_check_body():
+    check_body(COMPLETE)
+    for body in [b'', b'  \n', COMPLETE.replace(b'#7777END', b''), b'#START7777\n#7777END\n']:
+        with pytest.raises(IncompleteResponse):
+            check_body(body)
@@ -0,0 +1,64 @@
+###############################################################################
+# weather_qc 보정 검사 (강수 '현상 없음' -9는 0 mm로 보정에 쓴다)
+###############################################################################
+# python -m pytest weather/test_weather_qc.py
+import numpy as np
+import pandas as pd
+
+from station_catalog import StationCatalog
+from weather_cube import WEATHER_VARIABLES
+from weather_qc import run_qc, RAIN
+
+
+CATALOG = StationCatalog(pd.DataFrame({
+    '지점번호': [108, 112, 119, 98],
+    '지점명': ['서울', '인천', '수원', '동두천'],
+    '위도': [37.571, 37.478, 37.257, 37.902],
+    '경도': [126.966, 126.625, 126.983, 127.061],
+}))
+
+
+def _rows(rain):
+    """rain: {지점: 날짜별 일강수량} -> 일자료 (나머지 변수는 정상 값)"""
+    rows = []
+    for station, series in rain.items():
+        for day, value in enumerate(series):
+            row = dict(zip(WEATHER_VARIABLES, [10.0, 2.0, 6.0, 1.5, 0.0, -9.0, 60.0, 8.0]))
+            row.update({'관측시각 (KST)': 20240101 + day, '지역': station, RAIN: value})
+            rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def _rain(result, station):
+    data = result.data
+    return data.loc[data['지역'] == station, RAIN].to_list()
+
+
+def test_neighbor_fill_counts_no_event_as_zero():
+    data = _rows({'서울': [-99.0], '인천': [-9.0], '수원': [-9.0], '동두천': [30.0]})
+    result = run_qc(data, repair='neighbor', catalog=CATALOG)
+    assert _rain(result, '서울') == [10.0]
+
+
+def test_neighbor_fill_all_no_event_is_zero():
+    data = _rows({'서울': [-99.0], '인천': [-9.0], '수원': [-9.0], '동두천': [-9.0]})
+    result = run_qc(data, repair='neighbor', catalog=CATALOG)
+    assert _rain(result, '서울') == [0.0]
+
+
+def test_temporal_fill_counts_no_event_as_zero():
+    data = _rows({'서울': [-9.0, -99.0, 4.0]})
+    result = run_qc(data, repair='temporal', catalog=CATALOG)
+    assert _rain(result, '서울') == [-9.0, 2.0, 4.0]  # 검사만 한 칸은 원래 부호 그대로
+    assert np.all(result.data['QC_REPAIR'].to_numpy()[[0, 2]] == 0)
+
+
+def test_build_cube_leaves_out_flagged_values():
+    from weather_cube import build_cube
+
+    data = _rows({'서울': [2.0, -99.0, 4.0]})
+    result = run_qc(data, catalog=CATALOG)
+    cell = build_cube(result.data).query("단위 == '월' and 지역 == '서울' and 변수 == @RAIN").iloc[0]
+    assert (cell['sum'], cell['count'], cell['rows']) == (6.0, 2, 3)
+    raw = build_cube(result.data, qc=False).query("단위 == '월' and 지역 == '서울' and 변수 == @RAIN").iloc[0]
+    assert raw['count'] == 3
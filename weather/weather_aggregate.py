@@ -0,0 +1,144 @@
+###############################################################################
+# 지점 × 기간(월/분기/연) 기상 평균 집계 엔진
+###############################################################################
+# weathercalculate.py는 연도 파일 하나마다 전체 평균을 구한 뒤,
+# 지점(약 95개)마다 groupby를 다시 돌려 작은 DataFrame들을 이어 붙였다.
+# 여기서는 여러 해의 일별 데이터를 (지점, 연도, 월) 키로 한 번만 groupby해서 합계/개수를 구하고,
+#   - 분기/연도 값은 월별 합계/개수를 다시 더해서 (일별 데이터를 다시 훑지 않음)
+#   - 전국 값은 지점별 합계/개수를 더해서
+# 평균 = 합계 / 개수 로 계산한다. (결측은 개수에서 빠지므로 groupby mean과 같은 값)
+import numpy as np
+import pandas as pd
+
+
+TIME_COL = '관측시각 (KST)'
+STATION_COL = '국내 지점번호'
+
+# 집계할 일별 변수 -> 결과 열 이름 뒷부분 (월평균기온, 분기평균기온, 연평균기온 ...)
+MEAN_COLUMNS = {
+    '일 평균기온 (C)': '기온',
+    '일교차 (C)': '일교차',
+    '최고기온 (C)': '최고기온',
+    '최저기온 (C)': '최저기온',
+    '일 평균 상대습도 (%)': '상대습도',
+}
+
+LEVEL_PREFIX = {'월': '월평균', '분기': '분기평균', '연도': '연평균'}
+KOREA = '전국'
+
+
+def add_period_keys(data):
+    """관측시각(YYYYMMDD 숫자/문자열 또는 datetime)에서 연도/월/분기 정수 열을 만든다."""
+    tm = data[TIME_COL]
+    if pd.api.types.is_datetime64_any_dtype(tm):
+        ymd = (tm.dt.year * 10000 + tm.dt.month * 100 + tm.dt.day).to_numpy()
+    else:
+        ymd = pd.to_numeric(tm, errors='coerce').to_numpy()
+    valid = ~np.isnan(ymd)  # 관측시각이 없는 행(응답 끝 표시 등)은 제외
+    data, ymd = data[valid].copy(), ymd[valid].astype(np.int64)
+    data['연도'] = ymd // 10000
+    data['월'] = ymd // 100 % 100
+    data['분기'] = (data['월'] - 1) // 3 + 1
+    return data
+
+
+def monthly_partials(data, columns=MEAN_COLUMNS):
+    """
+    One pass over the daily rows: sum and count per (station, year, month, variable).
+
+    Parameters:
+        data (DataFrame): Daily weather rows (관측시각 (KST), 국내 지점번호, variables).
+        columns (dict): Variables to aggregate.
+
+    Returns:
+        DataFrame: Index (station, 연도, 월), columns MultiIndex (variable, 'sum'/'count').
+    """
+    data = add_period_keys(data)
+    values = list(columns)
+    grouped = data.groupby([STATION_COL, '연도', '월'], observed=True)[values]
+    partials = pd.concat({'sum': grouped.sum(), 'count': grouped.count()}, axis=1)
+    return partials.swaplevel(0, 1, axis=1).sort_index(axis=1)
+
+
+def _means(partials, keys, level, columns):
+    """합계/개수 부분합을 keys로 다시 묶어 평균 열(월평균기온 ...)을 만든다."""
+    rolled = partials.groupby(level=keys).sum() if keys else partials.sum().to_frame().T
+    out = {}
+    for col, name in columns.items():
+        with np.errstate(invalid='ignore', divide='ignore'):
+            out[LEVEL_PREFIX[level] + name] = rolled[(col, 'sum')] / rolled[(col, 'count')].replace(0, np.nan)
+    return pd.DataFrame(out, index=rolled.index).round(2)
+
+
+def aggregate_periods(data, columns=MEAN_COLUMNS):
+    """
+    Monthly, quarterly and yearly means for every station and for the whole country.
+
+    Parameters:
+        data (DataFrame): Daily weather rows for any number of years.
+        columns (dict): Variables to aggregate.
+
+    Returns:
+        dict: {'월' | '분기' | '연도': DataFrame}. Each frame has columns
+              [국내 지점번호, 연도, (월 | 분기), 월평균기온, ...]; national rows have 국내 지점번호 '전국'.
+    """
+    partials = monthly_partials(data, columns)
+    partials = partials.reset_index()
+    partials['분기'] = (partials['월'] - 1) // 3 + 1
+    partials = partials.set_index([STATION_COL, '연도', '분기', '월'])
+
+    # 전국 = 지점 부분합을 모두 더한 것
+    korea = partials.groupby(level=['연도', '분기', '월']).sum()
+    korea = pd.concat({KOREA: korea}, names=[STATION_COL])
+
+    results = {}
+    for level, keys in [('월', ['연도', '월']), ('분기', ['연도', '분기']), ('연도', ['연도'])]:
+        frames = [_means(p, [STATION_COL] + keys, level, columns) for p in (partials, korea)]
+        results[level] = pd.concat(frames).reset_index()
+    return results
+
+
+###############################################################################
+# 기존 *_Korea_weather_summary.csv / *_station_weather_summary.csv 형식
+###############################################################################
+def _summary_layout(monthly, quarterly, year):
+    """한 지점(또는 전국)의 월별 + 분기별 행을 기존 CSV와 같은 열 순서로 만든다."""
+    monthly = monthly[monthly['연도'] == year].drop(columns=['연도']).copy()
+    monthly['월'] = monthly['월'].astype(float)
+    monthly['구분'] = '월별'
+    quarterly = quarterly[quarterly['연도'] == year].copy()
+    quarterly['분기'] = quarterly['연도'].astype(str) + 'Q' + quarterly['분기'].astype(str)
+    quarterly = quarterly.drop(columns=['연도'])
+    quarterly['구분'] = '분기별'
+
+    month_cols = ['월'] + [LEVEL_PREFIX['월'] + n for n in MEAN_COLUMNS.values()] + ['구분']
+    quarter_cols = ['분기'] + [LEVEL_PREFIX['분기'] + n for n in MEAN_COLUMNS.values()]
+    combined = pd.concat([monthly, quarterly], ignore_index=True)
+    return combined[[STATION_COL] + month_cols + quarter_cols]
+
+
+def summary_tables(results):
+    """
+    Split the aggregation into the per-year Korea/station summary layouts.
+
+    Parameters:
+        results (dict): Output of aggregate_periods.
+
+    Returns:
+        dict: {year: (korea_df, station_df)} in the same layout as
+              {year}_Korea_weather_summary.csv / {year}_station_weather_summary.csv.
+    """
+    monthly, quarterly = results['월'], results['분기']
+    tables = {}
+    for year in sorted(monthly['연도'].unique()):
+        combined = _summary_layout(monthly, quarterly, year)
+        is_korea = combined[STATION_COL] == KOREA
+
+        korea_df = combined[is_korea].drop(columns=[STATION_COL]).reset_index(drop=True)
+
+        # 지점 이름 순, 지점마다 월별 행 다음 분기별 행 (기존 groupby 루프 결과와 같은 순서)
+        station_df = combined[~is_korea].sort_values(STATION_COL, kind='stable')
+        station_df = station_df.rename(columns={STATION_COL: '지점번호'})
+        station_df = station_df[[c for c in station_df.columns if c != '지점번호'] + ['지점번호']]
+        tables[int(year)] = (korea_df, station_df.reset_index(drop=True))
+    return tables
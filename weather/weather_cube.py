@@ -0,0 +1,210 @@
+###############################################################################
+# 기상 집계 큐브 (지점 × 월/분기/연 × 변수의 합계·개수·최소·최대)
+###############################################################################
+# yearlyaverage.py, quarterlyaverage.py, yearly_rain_Korea.py, Graph_humidity/wind/daily_range.py는
+# 모두 12-24weather.csv(일자료 전체)를 다시 읽고, 관측시각 문자열을 잘라 연도/분기를 만든 뒤
+# 각자 groupby 평균을 계산했다.
+# 여기서는 일자료를 한 번만 (지역, 연도, 월)로 묶어 변수마다 sum / count / min / max / rows를 구하고,
+# 분기·연도·전국 값은 이 부분합을 다시 합쳐서 만든 큐브를 원본 옆(<원본>.cube.parquet)에 저장한다.
+#   평균             = sum / count  (결측 제외, groupby mean과 같음)
+#   결측을 0으로 본 평균 = sum / rows   (fillna(0) 후 mean과 같음)
+# 원본 파일의 크기/수정시각이 바뀌면 큐브를 다시 만든다.
+# 일자료에 weather_qc.run_qc의 QC 열이 있으면 (test.py의 cleaned_1224weather.csv) 변수마다 qc_ok로
+# 플래그가 있는(보정되지 않은) 값은 빼고 집계한다. (qc=False면 그대로)
+import os
+import json
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from weather_aggregate import add_period_keys
+import _paths  # noqa: F401  (csv_cache, figure_batch, weather_index 경로)
+from csv_cache import load_csv
+
+
+CUBE_SUFFIX = '.cube.parquet'
+REGION_COL = '지역'
+KOREA = '전국'
+STATS = ['sum', 'count', 'min', 'max', 'rows']
+LEVEL_KEYS = {'월': ['연도', '월'], '분기': ['연도', '분기'], '연도': ['연도']}
+
+# 큐브에 넣는 일별 변수 (파일에 있는 것만 사용)
+WEATHER_VARIABLES = [
+    '최고기온 (C)', '최저기온 (C)', '일 평균기온 (C)', '일 평균 풍속 (m/s)', '일강수량 (mm)',
+    '최심 신적설 (cm)', '일 평균 상대습도 (%)', '일교차 (C)',
+]
+
+
+def build_cube(data, qc=True):
+    """
+    Build the cube from daily rows in one groupby pass.
+
+    Parameters:
+        data (DataFrame): Daily weather rows with 관측시각 (KST), a station column
+                          ('지역' or '국내 지점번호') and weather variables.
+        qc (bool): When data has run_qc's QC column, leave out the values whose variable is flagged
+                   (repaired values are kept); they still count in rows.
+
+    Returns:
+        DataFrame: Long table with columns 단위, 지역, 연도, 분기, 월, 변수, sum, count, min, max, rows.
+                   단위 is '월' / '분기' / '연도'; national rows have 지역 '전국'.
+    """
+    data = data.rename(columns={'국내 지점번호': REGION_COL})
+    variables = [v for v in WEATHER_VARIABLES if v in data.columns]
+    data = add_period_keys(data)
+    # 관측값은 소수 첫째 자리 단위 (일교차 등 계산 열의 부동소수점 오차 제거)
+    values = data[variables].apply(pd.to_numeric, errors='coerce').round(1)
+    if qc and 'QC' in data.columns:
+        from weather_qc import qc_ok
+        for v in variables:
+            values[v] = values[v].where(qc_ok(data, [v]))
+    values[[REGION_COL, '연도', '월']] = data[[REGION_COL, '연도', '월']]
+
+    grouped = values.groupby([REGION_COL, '연도', '월'], observed=True)[variables]
+    size = grouped.size()
+    monthly = pd.concat({'sum': grouped.sum(), 'count': grouped.count(), 'min': grouped.min(),
+                         'max': grouped.max(), 'rows': pd.DataFrame({v: size for v in variables})}, axis=1)
+    # 열 (stat, 변수) -> 행 (지역, 연도, 월, 변수) x 열 stat
+    monthly = monthly.stack(level=1)[STATS]
+    monthly.index = monthly.index.set_names('변수', level=-1)
+    monthly = monthly.reset_index()
+    monthly['분기'] = (monthly['월'] - 1) // 3 + 1
+
+    # 전국 = 지점 부분합을 합친 것
+    korea = _rollup(monthly, ['연도', '분기', '월', '변수'])
+    korea[REGION_COL] = KOREA
+    monthly = pd.concat([monthly, korea], ignore_index=True)
+
+    levels = []
+    for level, keys in LEVEL_KEYS.items():
+        part = monthly if level == '월' else _rollup(monthly, [REGION_COL] + keys + ['변수'])
+        levels.append(part.assign(단위=level))
+    cube = pd.concat(levels, ignore_index=True)
+    for col in ['분기', '월']:
+        cube[col] = cube[col].fillna(0).astype(np.int16)  # 상위 단위에서는 0
+    cube['연도'] = cube['연도'].astype(np.int16)
+    cube['count'] = cube['count'].astype(np.int32)
+    cube['rows'] = cube['rows'].astype(np.int32)
+    return cube[['단위', REGION_COL, '연도', '분기', '월', '변수'] + STATS]
+
+
+def _rollup(part, keys):
+    """합계/개수는 더하고 최소/최대는 다시 최소/최대"""
+    return part.groupby(keys, observed=True).agg(
+        sum=('sum', 'sum'), count=('count', 'sum'), min=('min', 'min'), max=('max', 'max'), rows=('rows', 'sum')
+    ).reset_index()
+
+
+def _signature(path, qc=True):
+    st = os.stat(path)
+    return json.dumps({'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'qc': qc})
+
+
+def load_cube(input_file, cube_path=None, rebuild=False, qc=True):
+    """
+    Load the cube for a daily weather CSV, building and saving it when missing or stale.
+
+    Parameters:
+        input_file (str): Daily weather CSV (e.g. ./12-24weather.csv).
+        cube_path (str | None): Cube file (default: <input_file>.cube.parquet).
+        rebuild (bool): Force a rebuild.
+        qc (bool): Filter on the QC column when present (see build_cube).
+
+    Returns:
+        DataFrame: The cube (see build_cube).
+    """
+    cube_path = cube_path or input_file + CUBE_SUFFIX
+    signature = _signature(input_file, qc)
+    if not rebuild and os.path.exists(cube_path):
+        table = pq.read_table(cube_path)
+        if (table.schema.metadata or {}).get(b'weather_cube.signature', b'').decode() == signature:
+            return table.to_pandas()
+
+    cube = build_cube(load_csv(input_file), qc=qc)
+    table = pa.Table.from_pandas(cube, preserve_index=False)
+    meta = dict(table.schema.metadata or {})
+    meta[b'weather_cube.signature'] = signature.encode()
+    pq.write_table(table.replace_schema_metadata(meta), cube_path + '.tmp')
+    os.replace(cube_path + '.tmp', cube_path)
+    return cube
+
+
+###############################################################################
+# 조회
+###############################################################################
+def cube_query(cube, level, variables=None, by_region=False, stat='mean'):
+    """
+    Answer a period query from the cube.
+
+    Parameters:
+        cube (DataFrame): Output of load_cube / build_cube.
+        level (str): '월', '분기' or '연도'.
+        variables (list | None): Variables to return (None = all, in WEATHER_VARIABLES order).
+        by_region (bool): Per-region rows instead of national rows.
+        stat (str): 'mean' (missing values excluded), 'mean0' (missing values counted as 0),
+                    'sum', 'count', 'min' or 'max'.
+
+    Returns:
+        DataFrame: Key columns [연도, (분기 | 월), (지역)] followed by one column per variable.
+    """
+    keys = LEVEL_KEYS[level] + ([REGION_COL] if by_region else [])
+    part = cube[cube['단위'] == level]
+    part = part[part[REGION_COL] != KOREA] if by_region else part[part[REGION_COL] == KOREA]
+    if variables is not None:
+        part = part[part['변수'].isin(variables)]
+
+    if stat == 'mean':
+        value = part['sum'] / part['count'].replace(0, np.nan)
+    elif stat == 'mean0':
+        value = part['sum'] / part['rows'].replace(0, np.nan)
+    else:
+        value = part[stat]
+
+    result = part[keys + ['변수']].assign(value=value.to_numpy())
+    result = result.pivot(index=keys, columns='변수', values='value')
+    order = [v for v in (variables or WEATHER_VARIABLES) if v in result.columns]
+    result = result[order].reset_index()
+    result.columns.name = None
+    return result
+
+
+def period_label(result, level):
+    """키 열을 기존 스크립트의 문자열 라벨로: 연도 '2012', 연도_분기 '2012-1분기', 연월 '2012-01'"""
+    year = result['연도'].astype(str)
+    if level == '연도':
+        return year.rename('연도')
+    if level == '분기':
+        return (year + '-' + result['분기'].astype(str) + '분기').rename('연도_분기')
+    return (year + '-' + result['월'].astype(str).str.zfill(2)).rename('연월')
+
+
+def cube_table(cube, level, variables=None, by_region=False, stat='mean'):
+    """
+    Same as cube_query, indexed the way the existing scripts index their groupby results:
+    연도 ('2012') / 연도_분기 ('2012-1분기') / 연월 ('2012-01'), plus 지역 when by_region is True.
+    """
+    result = cube_query(cube, level, variables, by_region=by_region, stat=stat)
+    index = [period_label(result, level)] + ([REGION_COL] if by_region else [])
+    return result.set_index(index).drop(columns=LEVEL_KEYS[level])
+
+
+def cube_series(cube, level, variable, region=None, stat='mean'):
+    """
+    One variable as a Series indexed by the period label (for the Graph_* scripts).
+
+    Parameters:
+        cube (DataFrame): The cube.
+        level (str): '월', '분기' or '연도'.
+        variable (str): Daily variable name, e.g. '일 평균 상대습도 (%)'.
+        region (str | None): Region name, None = national.
+        stat (str): See cube_query.
+
+    Returns:
+        Series: Values indexed by 연도 / 연도_분기 / 연월 labels.
+    """
+    if region is None:
+        return cube_table(cube, level, [variable], stat=stat)[variable]
+    table = cube_table(cube, level, [variable], by_region=True, stat=stat)
+    return table.xs(region, level=REGION_COL)[variable]
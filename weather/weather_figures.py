@@ -0,0 +1,61 @@
+###############################################################################
+# 기상 그래프 작업 목록 (figure_batch 작업 dict 생성)
+###############################################################################
+# Graph_humidity.py / Graph_wind.py / Graph_daily_range.py는 변수만 다르고 같은 그래프 6종
+# (전국 연간/분기, 지역별 연간/분기)을 그린다. 여기서 큐브 값으로 작업 dict를 만들고,
+# 각 스크립트는 figure_batch.show_or_render로 창에 띄우거나 파일로 저장한다.
+from weather_cube import cube_series
+
+
+# 지역별 그래프를 그리는 지역
+REGIONS = ["강릉", "대구", "대전", "부산", "서울", "수원", "영광군", "원주", "창원", "춘천", "포항", "홍천"]
+
+
+def series_line(series, label, color):
+    """Series(기간 라벨 인덱스) -> 작업의 선 하나"""
+    return {'x': list(series.index), 'y': [float(v) for v in series.values], 'label': label, 'color': color}
+
+
+def cube_variable_jobs(cube, variable, title, ylabel, prefix, regions=REGIONS):
+    """
+    Figure jobs for one daily variable: national yearly/quarterly and per-region yearly/quarterly.
+
+    Parameters:
+        cube (DataFrame): Weather cube (weather_cube.load_cube).
+        variable (str): Daily variable, e.g. '일 평균 상대습도 (%)'.
+        title (str): Name used in titles/labels, e.g. '상대습도'.
+        ylabel (str): Y axis label, e.g. '상대습도 (%)'.
+        prefix (str): Output sub-folder, e.g. 'humidity'.
+        regions (list): Regions with their own figures.
+
+    Returns:
+        list of dict: figure_batch jobs in the order the script used to show them.
+    """
+    jobs = []
+    for region in [None] + list(regions):
+        name = region or '한국'
+        color_year, color_quarter = ('#3498DB', '#2ECC71') if region is None else ('#FF5733', '#2ECC71')
+        annual = cube_series(cube, '연도', variable, region=region).round(1)
+        quarterly = cube_series(cube, '분기', variable, region=region).round(1)
+        label = '' if region is None else f'{region} '
+        jobs.append({
+            'name': f'{prefix}/{name}_연도',
+            'lines': [series_line(annual, f'{label}연간 평균 {title}', color_year)],
+            'title': f'{name} 연간 평균 {title}', 'xlabel': '연도', 'ylabel': ylabel,
+        })
+        jobs.append({
+            'name': f'{prefix}/{name}_분기',
+            'lines': [series_line(quarterly, f'{label}분기별 평균 {title}', color_quarter)],
+            'title': f'{name} 분기별 평균 {title}', 'xlabel': '분기', 'ylabel': ylabel, 'xticks': 'q1',
+        })
+    # 기존 스크립트 순서: 전국 연간, 전국 분기, 지역별 연간 전부, 지역별 분기 전부
+    return jobs[:2] + jobs[2::2] + jobs[3::2]
+
+
+def temperature_lines(data, x_col):
+    """최고/최저/일 평균기온 세 선 (Graph_*Temp* 공통 색)"""
+    return [
+        {'x': list(data[x_col]), 'y': [float(v) for v in data['최고기온 (C)']], 'label': '최고기온 (℃)', 'color': '#FF5733'},  # 오렌지색
+        {'x': list(data[x_col]), 'y': [float(v) for v in data['최저기온 (C)']], 'label': '최저기온 (℃)', 'color': '#3498DB'},  # 하늘색
+        {'x': list(data[x_col]), 'y': [float(v) for v in data['일 평균기온 (C)']], 'label': '일 평균기온 (℃)', 'color': '#2ECC71'},  # 라임 그린
+    ]
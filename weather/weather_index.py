@@ -0,0 +1,116 @@
+###############################################################################
+# 지역 × 시간 정렬 인덱스 (지역 코드 + 오프셋 표로 지역/기간 구간을 바로 찾기)
+###############################################################################
+# 지역마다 data[data['지역'] == region]으로 거르면 반복할 때마다 표 전체를 다시 훑는다.
+# 여기서는 표를 (지역, 시각) 순으로 한 번만 정렬해 두고
+#   - 지역 이름 -> 범주 코드 -> 행 구간 [start, end)      (지역 오프셋 표, O(1))
+#   - 시각이 YYYYMMDD 정수이면 (지역, 연월) -> 행 구간도 표로 보관  (연/월 구간 O(1),
+#     임의의 날짜 범위는 해당 월(최대 31행) 안에서만 이분 탐색)
+# 조회 결과는 정렬된 표의 연속 구간(iloc 슬라이스)이라 행을 복사하거나 다시 훑지 않는다.
+#
+# index = RegionTimeIndex(daily, region_col='국내 지점번호', time_col='관측시각 (KST)')
+# index.slice('서울', 20240101, 20241231)    # 서울 2024년 일자료
+# for region, part in index.items(): ...     # 지역별 구간 (groupby 대신)
+import numpy as np
+import pandas as pd
+
+
+class RegionTimeIndex:
+    """
+    Table sorted by (region, time) with offset tables for region and month ranges.
+
+    Parameters:
+        data (DataFrame): Rows with a region column and a sortable time column.
+        region_col (str): Region column ('지역', '국내 지점번호', ...).
+        time_col (str): Time column. YYYYMMDD integers additionally get a per-month offset table.
+    """
+
+    def __init__(self, data, region_col='지역', time_col='관측시각 (KST)'):
+        self.region_col = region_col
+        self.time_col = time_col
+
+        regions = pd.Categorical(data[region_col])
+        self.regions = list(regions.categories)
+        self._codes = {r: i for i, r in enumerate(self.regions)}
+        codes = regions.codes.astype(np.int64)
+        time = data[time_col].to_numpy()
+
+        # (지역 코드, 시각) 순 안정 정렬 -> 같은 시각끼리는 원래 순서 유지
+        order = np.lexsort((time, codes))
+        self.data = data.iloc[order].reset_index(drop=True)
+        self.time = time[order]
+        sorted_codes = codes[order]
+
+        # 지역 오프셋: 코드 c의 행은 [offsets[c], offsets[c + 1])  (코드 -1 = 지역 없음은 맨 앞)
+        self.offsets = np.searchsorted(sorted_codes, np.arange(len(self.regions) + 1), side='left')
+
+        self.months = None
+        if np.issubdtype(self.time.dtype, np.integer) and len(self.time) and self.time.min() > 10000000:
+            # (지역, 연월) 오프셋: month_offsets[c, m]은 지역 c에서 m번째 달(첫 해 1월 = 0)이 시작하는 행
+            self.first_year = int(self.time.min() // 10000)
+            n_months = (int(self.time.max() // 10000) - self.first_year + 1) * 12
+            month = (self.time // 10000 - self.first_year) * 12 + self.time // 100 % 100 - 1
+            key = np.where(sorted_codes >= 0, sorted_codes * n_months + month, -1)
+            self.months = n_months
+            self.month_offsets = np.searchsorted(
+                key, np.arange(len(self.regions) * n_months + 1), side='left'
+            )
+
+    def code(self, region):
+        """지역 이름 -> 범주 코드 (없으면 KeyError)"""
+        return self._codes[region]
+
+    def _month_row(self, code, date, side):
+        """YYYYMMDD가 속한 달의 구간 안에서만 이분 탐색해 행 번호를 구한다."""
+        if not 1 <= date // 100 % 100 <= 12:  # 달이 없는 값(20121300 등)은 지역 구간 전체에서 탐색
+            a, b = self.offsets[code], self.offsets[code + 1]
+            return a + np.searchsorted(self.time[a:b], date, side=side)
+        month = (date // 10000 - self.first_year) * 12 + date // 100 % 100 - 1
+        if month < 0:
+            return self.offsets[code]
+        if month >= self.months:
+            return self.offsets[code + 1]
+        base = code * self.months + month
+        a, b = self.month_offsets[base], self.month_offsets[base + 1]
+        return a + np.searchsorted(self.time[a:b], date, side=side)
+
+    def bounds(self, region, start=None, end=None):
+        """
+        Row range [a, b) of a region, optionally limited to start <= time <= end.
+
+        Returns:
+            tuple: (a, b) positions in self.data.
+        """
+        c = self.code(region)
+        a, b = self.offsets[c], self.offsets[c + 1]
+        if self.months is not None:
+            if start is not None:
+                a = max(a, self._month_row(c, int(start), 'left'))
+            if end is not None:
+                b = min(b, self._month_row(c, int(end), 'right'))
+        else:
+            if start is not None:
+                a = a + np.searchsorted(self.time[a:b], start, side='left')
+            if end is not None:
+                b = self.offsets[c] + np.searchsorted(self.time[self.offsets[c]:b], end, side='right')
+        return int(a), int(max(a, b))
+
+    def slice(self, region, start=None, end=None):
+        """지역(과 기간)의 행 (정렬된 표의 연속 구간)"""
+        a, b = self.bounds(region, start, end)
+        return self.data.iloc[a:b]
+
+    def year(self, region, year):
+        """지역의 한 해 (YYYYMMDD 시각일 때 월 오프셋 표만으로 찾음)"""
+        return self.slice(region, year * 10000 + 101, year * 10000 + 1231)
+
+    def items(self, regions=None):
+        """(지역, 행) 쌍을 지역 순서대로 (regions를 주면 그 순서, 없는 지역은 건너뜀)"""
+        for region in (self.regions if regions is None else regions):
+            if region in self._codes:
+                yield region, self.slice(region)
+
+    def values(self, column, region, start=None, end=None):
+        """한 열의 numpy 배열 (지역/기간 구간)"""
+        a, b = self.bounds(region, start, end)
+        return self.data[column].to_numpy()[a:b]
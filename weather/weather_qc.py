@@ -0,0 +1,333 @@
+###############################################################################
+# 기상 일자료 품질 검사 (지점 × 일 × 변수 배열에서 규칙 검사 + 가용일 비트맵 + 보정 기록)
+###############################################################################
+# test.py는 빈 행만 지웠고, 모델 쪽 전처리는 열마다 중앙값 채우기/±3σ 자르기만 했다.
+# 여기서는 일자료 전체(2012~2024)를 한 번에 지점 × 일 × 변수 배열로 옮겨 규칙을 벡터 연산으로 검사한다.
+#   MISSING     : 빈 값 또는 결측 부호 (풍속/습도 -9, 모든 변수 -99 / 기온 -9.0은 실제 값일 수 있음)
+#                 강수/적설의 -9는 '현상 없음'(약 62%/99%의 날)이므로 결측이 아니라 0으로 보고 검사한다.
+#   RANGE       : 물리적으로 불가능한 값 (상대습도 > 100, 풍속 < 0, 기온 -50 미만 등)
+#   CONSISTENCY : 최고기온 < 최저기온, 평균기온이 최저~최고 밖, 일교차 != 최고 - 최저
+#   STUCK       : 같은 값이 STUCK_DAYS일 이상 연속 (센서 고착, 강수/적설/일교차는 제외)
+# 결과
+#   - 행마다 'QC' 열(uint32): 변수마다 4비트 (WEATHER_VARIABLES 순서, 변수 i는 비트 4i~4i+3)
+#   - 'QC_REPAIR' 열(uint16): 변수마다 2비트 (1 = 시간 보간, 2 = 인접 지점 평균)
+#   - 지점별 가용일 비트맵 (np.packbits, 기간 첫날부터 하루 1비트: 그날 행이 있으면 1)
+# 보정(인접 지점 평균, 시간 보간)도 검사와 같은 값(결측 부호 -> NaN, 현상 없음 -> 0)으로 계산한다.
+#   (강수 -9를 -9 mm로 평균/보간하지 않도록)
+# 집계 쪽에서는 qc_ok(data, [변수])로 플래그 없는 행만 골라 쓴다. (비트 연산만, 다시 검사하지 않음)
+import numpy as np
+import pandas as pd
+
+from weather_cube import WEATHER_VARIABLES
+
+
+TIME_COL = '관측시각 (KST)'
+
+# 플래그 비트 (변수마다 4비트)
+MISSING = 1
+RANGE = 2
+CONSISTENCY = 4
+STUCK = 8
+FLAG_BITS = 4
+
+# 보정 비트 (변수마다 2비트)
+REPAIR_TEMPORAL = 1
+REPAIR_NEIGHBOR = 2
+REPAIR_BITS = 2
+
+TA_MAX, TA_MIN, TA_AVG, WIND, RAIN, SNOW, RH, DTR = WEATHER_VARIABLES
+
+# 변수별 결측 부호
+MISSING_CODES = {
+    TA_MAX: (-99.0,), TA_MIN: (-99.0,), TA_AVG: (-99.0,),
+    WIND: (-9.0, -99.0), RAIN: (-99.0,), SNOW: (-99.0,), RH: (-9.0, -99.0), DTR: (-99.0,),
+}
+
+# 현상 없음 부호 (검사할 때 0으로 본다)
+NO_EVENT_CODES = {RAIN: -9.0, SNOW: -9.0}
+
+# 변수별 허용 범위 [하한, 상한]
+VALID_RANGE = {
+    TA_MAX: (-50.0, 50.0), TA_MIN: (-50.0, 50.0), TA_AVG: (-50.0, 50.0),
+    WIND: (0.0, 75.0), RAIN: (0.0, 1000.0), SNOW: (0.0, 300.0), RH: (0.0, 100.0), DTR: (0.0, 45.0),
+}
+
+# 고착 검사 대상과 연속 일수
+STUCK_DAYS = 7
+STUCK_VARIABLES = [TA_MAX, TA_MIN, TA_AVG, WIND, RH]
+
+
+def _station_col(data):
+    return '지역' if '지역' in data.columns else '국내 지점번호'
+
+
+def _run_lengths(same):
+    """
+    same[s, j]가 True면 j번째 칸이 j-1번째 칸과 같은 구간 -> 칸마다 자기가 속한 구간의 길이 (2차원, 행별)
+    """
+    same = same.copy()
+    same[:, 0] = False
+    ids = np.cumsum(~same.ravel()) - 1
+    return np.bincount(ids)[ids].reshape(same.shape)
+
+
+def station_day_matrix(data, variables=WEATHER_VARIABLES):
+    """
+    Scatter daily rows into a station × day × variable array.
+
+    Parameters:
+        data (DataFrame): Daily rows (관측시각 YYYYMMDD, 지역 or 국내 지점번호, variables).
+        variables (list): Variables to place.
+
+    Returns:
+        tuple: (values [S, D, V] float64 with NaN where no row, present [S, D] bool,
+                stations list, days DatetimeIndex, row positions (s, d) of every input row)
+    """
+    station_col = _station_col(data)
+    stations = pd.Categorical(data[station_col])
+    s = stations.codes.astype(np.int64)
+    dates = pd.to_datetime(pd.to_numeric(data[TIME_COL], errors='coerce').astype('Int64').astype(str),
+                           format='%Y%m%d', errors='coerce')
+    days = pd.date_range(dates.min(), dates.max(), freq='D')
+    d = ((dates - days[0]).dt.days.to_numpy(dtype=float))
+
+    ok = (s >= 0) & ~np.isnan(d)
+    d = np.where(ok, d, 0).astype(np.int64)
+    values = np.full((len(stations.categories), len(days), len(variables)), np.nan)
+    present = np.zeros(values.shape[:2], dtype=bool)
+    x = data[variables].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+    values[s[ok], d[ok]] = x[ok]  # 같은 지점·날짜가 여러 행이면 마지막 행 값
+    present[s[ok], d[ok]] = True
+    return values, present, list(stations.categories), days, (np.where(ok, s, -1), d)
+
+
+def check_rules(values, variables=WEATHER_VARIABLES, stuck_days=STUCK_DAYS):
+    """
+    Run every rule on the station × day × variable array at once.
+
+    Returns:
+        tuple: (uint8 flags [S, D, V] (MISSING | RANGE | CONSISTENCY | STUCK),
+                values as checked [S, D, V]: missing codes -> NaN, rain/snow no-event codes -> 0).
+    """
+    flags = np.zeros(values.shape, dtype=np.uint8)
+    col = {v: i for i, v in enumerate(variables)}
+
+    # 결측 부호 -> NaN (이후 규칙은 결측이 아닌 값에만 적용)
+    clean = values.copy()
+    for v, i in col.items():
+        coded = np.isin(values[..., i], MISSING_CODES.get(v, ()))
+        flags[..., i] |= np.where(np.isnan(values[..., i]) | coded, MISSING, 0).astype(np.uint8)
+        clean[..., i] = np.where(coded, np.nan, values[..., i])
+        if v in NO_EVENT_CODES:
+            clean[..., i] = np.where(values[..., i] == NO_EVENT_CODES[v], 0.0, clean[..., i])
+
+    for v, i in col.items():
+        lo, hi = VALID_RANGE.get(v, (-np.inf, np.inf))
+        x = clean[..., i]
+        flags[..., i] |= np.where((x < lo) | (x > hi), RANGE, 0).astype(np.uint8)
+
+    if TA_MAX in col and TA_MIN in col:
+        tmax, tmin = clean[..., col[TA_MAX]], clean[..., col[TA_MIN]]
+        bad = tmax < tmin
+        flags[..., col[TA_MAX]] |= np.where(bad, CONSISTENCY, 0).astype(np.uint8)
+        flags[..., col[TA_MIN]] |= np.where(bad, CONSISTENCY, 0).astype(np.uint8)
+        if TA_AVG in col:
+            tavg = clean[..., col[TA_AVG]]
+            flags[..., col[TA_AVG]] |= np.where((tavg > tmax) | (tavg < tmin), CONSISTENCY, 0).astype(np.uint8)
+        if DTR in col:
+            dtr = clean[..., col[DTR]]
+            bad = np.abs(dtr - (tmax - tmin)) > 0.15  # 소수 첫째 자리 반올림 오차 허용
+            flags[..., col[DTR]] |= np.where(bad, CONSISTENCY, 0).astype(np.uint8)
+
+    for v in STUCK_VARIABLES:
+        if v not in col:
+            continue
+        x = clean[..., col[v]]
+        same = np.zeros(x.shape, dtype=bool)
+        same[:, 1:] = x[:, 1:] == x[:, :-1]  # NaN끼리는 같지 않음
+        stuck = (_run_lengths(same) >= stuck_days) & ~np.isnan(x)
+        flags[..., col[v]] |= np.where(stuck, STUCK, 0).astype(np.uint8)
+    return flags, clean
+
+
+def _neighbor_fill(values, bad, neighbors, variables):
+    """인접 지점(최대 k개) 중 같은 날 정상 값의 평균으로 채운다. (채운 칸 mask 반환)"""
+    filled = np.zeros(bad.shape, dtype=bool)
+    valid_nbr = neighbors >= 0
+    safe = np.where(valid_nbr, neighbors, 0)
+    for i in range(len(variables)):
+        good = np.where(bad[..., i], np.nan, values[..., i])  # [S, D]
+        cand = good[safe]  # [S, K, D]
+        cand[~valid_nbr] = np.nan
+        with np.errstate(invalid='ignore'):
+            count = np.sum(~np.isnan(cand), axis=1)
+            mean = np.nansum(cand, axis=1) / np.where(count > 0, count, 1)
+        fill = bad[..., i] & (count > 0)
+        values[..., i] = np.where(fill, np.round(mean, 1), values[..., i])
+        filled[..., i] = fill
+    return filled
+
+
+def _temporal_fill(values, bad, present, max_gap):
+    """같은 지점의 앞뒤 날짜 사이 선형 보간 (양쪽에 정상 값이 있고 빈 구간이 max_gap일 이하일 때만)"""
+    S, D, V = values.shape
+    series = np.where(bad, np.nan, values).transpose(1, 0, 2).reshape(D, S * V)
+    interp = pd.DataFrame(series).interpolate(method='linear', limit_area='inside').to_numpy()
+    gaps = np.isnan(series).T  # [S*V, D]
+    same = np.zeros(gaps.shape, dtype=bool)
+    same[:, 1:] = gaps[:, 1:] & gaps[:, :-1]
+    short = (_run_lengths(same) <= max_gap).T
+    fill = np.isnan(series) & ~np.isnan(interp) & short
+    fill = fill.reshape(D, S, V).transpose(1, 0, 2) & bad & present[..., None]
+    values[fill] = np.round(interp.reshape(D, S, V).transpose(1, 0, 2)[fill], 1)
+    return fill
+
+
+class QCResult:
+    """
+    Output of run_qc.
+
+    result.data              # input rows + 'QC' (uint32) and 'QC_REPAIR' (uint16) columns
+    result.available('서울')  # bool per day of result.days
+    result.summary()          # per-station availability and flag counts
+    """
+
+    def __init__(self, data, stations, days, bitmaps, flags, variables):
+        self.data = data
+        self.stations = stations
+        self.days = days
+        self.bitmaps = bitmaps  # [S, ceil(D / 8)] uint8 (np.packbits)
+        self.flags = flags  # [S, D, V] uint8
+        self.variables = variables
+
+    def available(self, station):
+        """지점의 날짜별 행 존재 여부 (비트맵 풀기)"""
+        s = self.stations.index(station)
+        return np.unpackbits(self.bitmaps[s], count=len(self.days)).astype(bool)
+
+    def summary(self):
+        """지점별 관측일수, 누락일수, 가용률, 플래그 종류별 칸 수"""
+        present = np.unpackbits(self.bitmaps, axis=1, count=len(self.days)).astype(bool)
+        # 관측 시작 전/종료 후 날짜는 누락으로 보지 않는다
+        first = present.argmax(axis=1)
+        last = len(self.days) - 1 - present[:, ::-1].argmax(axis=1)
+        expected = np.where(present.any(axis=1), last - first + 1, 0)
+        table = pd.DataFrame({'지점': self.stations, '관측일수': present.sum(axis=1), '기간일수': expected})
+        table['누락일수'] = table['기간일수'] - table['관측일수']
+        table['가용률'] = (table['관측일수'] / table['기간일수'].replace(0, np.nan)).round(4)
+        for name, bit in [('MISSING', MISSING), ('RANGE', RANGE), ('CONSISTENCY', CONSISTENCY), ('STUCK', STUCK)]:
+            table[name] = ((self.flags & bit) > 0).any(axis=2).sum(axis=1) if self.flags.size else 0
+        return table
+
+
+def run_qc(data, variables=WEATHER_VARIABLES, repair=None, stuck_days=STUCK_DAYS,
+           max_gap=3, k_neighbors=3, max_km=60.0, catalog=None):
+    """
+    Quality-control the whole daily table in one pass.
+
+    Parameters:
+        data (DataFrame): Daily rows (관측시각 (KST), 지역 or 국내 지점번호, weather variables).
+        variables (list): Variables to check (bit positions follow this order, at most 8).
+        repair (str | None): None, 'temporal', 'neighbor' or 'both' (neighbor first, then temporal).
+                             Repaired values replace flagged values; flags are kept.
+        stuck_days (int): Run length treated as a stuck sensor.
+        max_gap (int): Longest gap (days) filled by temporal interpolation.
+        k_neighbors (int): Neighbor stations averaged for neighbor repair.
+        max_km (float): Neighbors farther than this are not used.
+        catalog (StationCatalog | None): Station coordinates for neighbor repair (default load_catalog()).
+
+    Returns:
+        QCResult: Rows with QC / QC_REPAIR columns, availability bitmaps and flag array.
+    """
+    if len(variables) > 8:
+        raise ValueError("QC 열은 변수 8개까지 담을 수 있습니다 (변수당 4비트, uint32)")
+    data = data.dropna(how='all').reset_index(drop=True).copy()
+    values, present, stations, days, (s, d) = station_day_matrix(data, variables)
+    flags, values = check_rules(values, variables, stuck_days)  # 보정은 검사한 값(현상 없음 = 0)으로
+    repaired = np.zeros(values.shape, dtype=np.uint8)
+
+    if repair:
+        bad = flags > 0
+        if repair in ('neighbor', 'both'):
+            neighbors = _neighbors(stations, k_neighbors, max_km, catalog)
+            filled = _neighbor_fill(values, bad, neighbors, variables) & present[..., None]
+            repaired[filled] |= REPAIR_NEIGHBOR
+            bad &= ~filled
+        if repair in ('temporal', 'both'):
+            filled = _temporal_fill(values, bad, present, max_gap)
+            repaired[filled] |= REPAIR_TEMPORAL
+        if repair not in ('neighbor', 'temporal', 'both'):
+            raise ValueError(f"repair는 None, 'temporal', 'neighbor', 'both' 중 하나입니다: {repair!r}")
+
+    # 행마다 변수별 비트를 한 정수 열로 압축
+    ok = s >= 0
+    row_flags = np.zeros((len(data), len(variables)), dtype=np.uint32)
+    row_repair = np.zeros((len(data), len(variables)), dtype=np.uint16)
+    row_flags[ok] = flags[s[ok], d[ok]]
+    row_repair[ok] = repaired[s[ok], d[ok]]
+    shifts = np.arange(len(variables))
+    data['QC'] = np.bitwise_or.reduce(row_flags << (FLAG_BITS * shifts).astype(np.uint32), axis=1)
+    data['QC_REPAIR'] = np.bitwise_or.reduce(row_repair << (REPAIR_BITS * shifts).astype(np.uint16), axis=1)
+
+    if repair:
+        # 보정한 칸만 값을 바꾼다
+        fixed = row_repair[ok] > 0
+        current = data.loc[ok, variables].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+        new = values[s[ok], d[ok]]
+        data.loc[ok, variables] = np.where(fixed, new, current)
+
+    return QCResult(data, stations, days, np.packbits(present, axis=1), flags, list(variables))
+
+
+def _neighbors(stations, k, max_km, catalog=None):
+    """지점 이름 목록 -> 인접 지점 위치 [S, k] (좌표가 없거나 max_km 밖이면 -1)"""
+    from station_catalog import load_catalog
+
+    catalog = catalog or load_catalog()
+    coords = catalog.table.set_index('지점번호')[['위도', '경도']]
+    by_name = {name: coords.loc[stn] for stn, name in catalog.mapping.items() if stn in coords.index}
+    known = [i for i, name in enumerate(stations) if name in by_name]
+    neighbors = np.full((len(stations), k), -1, dtype=np.int64)
+    if len(known) < 2:
+        return neighbors
+
+    from station_catalog import to_xyz, _chord_to_km
+    from scipy.spatial import cKDTree
+
+    lat = np.array([by_name[stations[i]]['위도'] for i in known])
+    lon = np.array([by_name[stations[i]]['경도'] for i in known])
+    tree = cKDTree(to_xyz(lat, lon))
+    kk = min(k + 1, len(known))
+    chord, idx = tree.query(to_xyz(lat, lon), k=kk)
+    idx, km = idx[:, 1:], _chord_to_km(chord[:, 1:])  # 첫 번째는 자기 자신
+    known = np.array(known)
+    neighbors[known, :kk - 1] = np.where(km <= max_km, known[idx], -1)
+    return neighbors
+
+
+###############################################################################
+# 집계 쪽에서 쓰는 필터
+###############################################################################
+def qc_flags(data, variable, variables=WEATHER_VARIABLES):
+    """한 변수의 4비트 플래그 (행마다)"""
+    i = list(variables).index(variable)
+    return (data['QC'].to_numpy(dtype=np.uint32) >> np.uint32(FLAG_BITS * i)) & np.uint32(0xF)
+
+
+def qc_ok(data, columns=None, allow_repaired=True, variables=WEATHER_VARIABLES):
+    """
+    Boolean mask of rows whose given variables carry no QC flag.
+
+    Parameters:
+        data (DataFrame): run_qc output rows.
+        columns (list | None): Variables that must be clean (None = all).
+        allow_repaired (bool): Accept flagged cells that were repaired.
+    """
+    mask = np.ones(len(data), dtype=bool)
+    for v in (columns or variables):
+        i = list(variables).index(v)
+        ok = qc_flags(data, v, variables) == 0
+        if allow_repaired and 'QC_REPAIR' in data.columns:
+            ok |= ((data['QC_REPAIR'].to_numpy(dtype=np.uint16) >> np.uint16(REPAIR_BITS * i)) & np.uint16(3)) > 0
+        mask &= ok
+    return mask
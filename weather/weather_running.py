@@ -0,0 +1,408 @@
+###############################################################################
+# 기상 월/분기/연 집계의 증분 갱신 (합계·개수 + Welford 분산)
+###############################################################################
+# yearlyaverage.py / quarterlyaverage.py는 실행할 때마다 13년치 평균을 처음부터 다시 계산한다.
+# 여기서는 (단위, 지역, 연도, 분기, 월) 칸마다 변수별
+#   rows, count, sum, mean, m2(편차 제곱합, Welford), min, max
+# 를 상태로 들고 있다가, 새 관측이 들어오면 그 관측이 속한 칸만 갱신한다.
+#   관측 1건 -> 월/분기/연도 × (지점, 전국) = 6칸   => 관측 수에만 비례, 과거 데이터 크기와 무관
+# 여러 행을 한 번에 넣을 때는 (지역, 연도, 월)별 부분 집계를 만든 뒤
+# Chan 병합식으로 칸에 합친다. (한 건씩 넣은 결과와 같음)
+#   n = na + nb,  d = mb - ma,  mean = ma + d·nb/n,  m2 = m2a + m2b + d²·na·nb/n
+# 이미 반영한 날짜 이하의 행(과거 자료 추가/보정)은 update_frame이 건너뛰고 그 수를 skipped_rows로 알려 준다.
+# 그런 자료는 replace_months()로 해당 (지역, 월) 칸을 새 자료로 바꾸고, 그 달을 포함하는
+# 분기/연도/전국 칸은 같은 (지역, 연도)와 (전국, 연도)의 월 칸만 다시 병합해서 만든다.
+#   (min/max는 빼기가 안 되므로 빼지 않고 다시 병합, 비용은 지점 수 × 12달로 과거 기간 길이와 무관)
+# refresh_from_store()는 저장소 manifest의 원본별 SHA-256을 상태에 기록해 두고
+#   - 새 원본: 그 원본의 조각만 읽어 지역별 마지막 관측일 이후 행은 update_frame으로 더하고,
+#              마지막 관측일 이하의 행이 있는 달만 저장소에서 다시 읽어 replace_months로 바꾼다
+#   - 바뀐 원본(같은 키, 다른 해시): 예전/새 연도를 다시 읽어 replace_months로 바꾼다
+# reconcile()은 같은 일자료로 처음부터 다시 계산한 값과 비교해 어긋난 칸을 돌려준다.
+# as_cube()는 weather_cube와 같은 형식이라 cube_query / cube_table로 그대로 조회할 수 있다.
+import os
+import json
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from weather_cube import WEATHER_VARIABLES, REGION_COL, KOREA
+from weather_aggregate import TIME_COL, add_period_keys
+
+
+STATE_FIELDS = ['rows', 'count', 'sum', 'mean', 'm2', 'min', 'max']
+SOURCES_KEY = b'weather_running.sources'
+
+
+def _empty(n_vars):
+    return {'rows': np.zeros(n_vars), 'count': np.zeros(n_vars), 'sum': np.zeros(n_vars),
+            'mean': np.zeros(n_vars), 'm2': np.zeros(n_vars),
+            'min': np.full(n_vars, np.inf), 'max': np.full(n_vars, -np.inf)}
+
+
+def _merge(cell, part):
+    """칸(cell)에 부분 집계(part)를 합친다 (Chan 병합, 변수별 벡터 연산)"""
+    na, nb = cell['count'], part['count']
+    n = na + nb
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ratio = np.where(n > 0, nb / n, 0.0)
+    delta = part['mean'] - cell['mean']
+    cell['mean'] = cell['mean'] + delta * ratio
+    cell['m2'] = cell['m2'] + part['m2'] + delta * delta * na * ratio
+    cell['count'] = n
+    cell['rows'] = cell['rows'] + part['rows']
+    cell['sum'] = cell['sum'] + part['sum']
+    cell['min'] = np.fmin(cell['min'], part['min'])
+    cell['max'] = np.fmax(cell['max'], part['max'])
+
+
+class RunningWeatherAggregates:
+    """
+    Incrementally maintained monthly/quarterly/yearly aggregates per region and for the whole country.
+
+    agg = RunningWeatherAggregates()
+    agg.update(20250101, '서울', {'일 평균기온 (C)': -2.1, ...})   # one observation, 6 cells
+    agg.update_frame(new_days)                                      # many rows at once
+    cube_table(agg.as_cube(), '연도', by_region=True)                # regional yearly means
+    """
+
+    def __init__(self, variables=WEATHER_VARIABLES):
+        self.variables = list(variables)
+        self.cells = {}  # (단위, 지역, 연도, 분기, 월) -> 변수별 상태 배열
+        self.last_date = {}  # 지역 -> 마지막으로 반영한 관측일 (YYYYMMDD)
+        self.sources = {}  # 저장소 원본 이름 -> {'sha256', 'years'} (refresh_from_store가 반영한 manifest)
+        self.skipped_rows = 0  # 마지막 update_frame에서 last_date 이하라 건너뛴 행 수
+
+    def _cell_keys(self, region, year, month):
+        quarter = (month - 1) // 3 + 1
+        for r in (region, KOREA):
+            yield ('월', r, year, quarter, month)
+            yield ('분기', r, year, quarter, 0)
+            yield ('연도', r, year, 0, 0)
+
+    def _add(self, region, year, month, part):
+        for key in self._cell_keys(region, year, month):
+            cell = self.cells.get(key)
+            if cell is None:
+                cell = self.cells[key] = _empty(len(self.variables))
+            _merge(cell, part)
+
+    def update(self, date, region, values):
+        """
+        Add one daily observation (constant time: 6 cells × variables).
+
+        Parameters:
+            date (int | str): Observation date YYYYMMDD.
+            region (str): Region (station) name.
+            values (dict): {variable: value}; missing variables count as missing values.
+        """
+        date = int(date)
+        x = np.round(np.array([values.get(v, np.nan) for v in self.variables], dtype=float), 1)
+        valid = ~np.isnan(x)
+        part = {'rows': np.ones(len(x)), 'count': valid.astype(float), 'sum': np.where(valid, x, 0.0),
+                'mean': np.where(valid, x, 0.0), 'm2': np.zeros(len(x)),
+                'min': np.where(valid, x, np.inf), 'max': np.where(valid, x, -np.inf)}
+        self._add(region, date // 10000, date // 100 % 100, part)
+        self.last_date[region] = max(self.last_date.get(region, 0), date)
+
+    def update_frame(self, data, only_new=True):
+        """
+        Add many daily rows: one groupby into (region, year, month) partials, then merge each partial.
+
+        Parameters:
+            data (DataFrame): Daily rows with 관측시각 (KST), 지역 (or 국내 지점번호) and variables.
+            only_new (bool): Skip rows not newer than the last date already applied for their region,
+                             so re-running on overlapping data does not double count.
+
+        Returns:
+            int: Number of rows applied (rows skipped by only_new are counted in self.skipped_rows).
+        """
+        self.skipped_rows = 0
+        data, tm = self._prepare(data)
+        if only_new and self.last_date and not data.empty:
+            last = data[REGION_COL].map(self.last_date).fillna(0).to_numpy()
+            keep = tm.to_numpy() > last
+            self.skipped_rows = int((~keep).sum())
+            data, tm = data[keep], tm[keep]
+        if data.empty:
+            return 0
+
+        keys, parts = self._partials(data)
+        for (region, year, month), part in zip(keys, parts):
+            self._add(region, year, month, part)
+        self._update_last_date(data, tm)
+        return len(data)
+
+    def replace_months(self, data, years=None):
+        """
+        Replace the (region, month) cells covered by data, e.g. after backfilled or corrected days.
+
+        Each touched month is rebuilt from data alone, so data must hold every row of those months.
+        The quarter, year and national cells containing them are re-merged from their month cells.
+
+        Parameters:
+            data (DataFrame): Daily rows (관측시각 (KST), 지역 or 국내 지점번호, variables).
+            years (iterable of int | None): Years data covers completely; region months of these years
+                                            that are absent from data are removed.
+
+        Returns:
+            int: Number of rows in the months that changed.
+        """
+        data, tm = self._prepare(data)
+        new = {}
+        if not data.empty:
+            keys, parts = self._partials(data)
+            rows = data.groupby([REGION_COL, '연도', '월'], observed=True).size()
+            for (region, year, month), part in zip(keys, parts):
+                new[('월', region, year, (month - 1) // 3 + 1, month)] = (part, int(rows[(region, year, month)]))
+
+        changed, applied = [], 0
+        for key, (part, n_rows) in new.items():
+            old = self.cells.get(key)
+            if old is None or not all(np.array_equal(old[f], part[f]) for f in STATE_FIELDS):
+                self.cells[key] = part
+                changed.append(key)
+                applied += n_rows
+        if years is not None:
+            for year in set(int(y) for y in years):
+                for key in self._month_keys(self.last_date, year):
+                    if key in self.cells and key not in new:
+                        del self.cells[key]
+                        changed.append(key)
+
+        self._rebuild_parents(changed)
+        if not data.empty:
+            self._update_last_date(data, tm)
+        return applied
+
+    @staticmethod
+    def _month_keys(regions, year, months=range(1, 13)):
+        """지역들의 한 해 월 칸 키 (지역, 월 순서)"""
+        return [('월', r, year, (m - 1) // 3 + 1, m) for r in sorted(regions) for m in months]
+
+    def _merged(self, keys):
+        """있는 칸들을 순서대로 병합한 새 칸 (하나도 없으면 None)"""
+        cell = None
+        for key in keys:
+            if key in self.cells:
+                if cell is None:
+                    cell = _empty(len(self.variables))
+                _merge(cell, self.cells[key])
+        return cell
+
+    def _set(self, key, cell):
+        if cell is None or cell['rows'].sum() == 0:
+            self.cells.pop(key, None)
+        else:
+            self.cells[key] = cell
+
+    def _rebuild_parents(self, month_keys):
+        """
+        바뀐 지역 월 칸을 포함하는 칸만 다시 병합:
+        지역 분기/연도는 그 (지역, 연도)의 월 칸, 전국 월은 같은 달의 지역 월 칸, 전국 분기/연도는 전국 월 칸으로
+        """
+        region_years = {(r, y) for (_, r, y, q, m) in month_keys}
+        national_months = {(y, m) for (_, r, y, q, m) in month_keys}
+        regions = set(self.last_date) - {KOREA}
+        for region, year in region_years:
+            for quarter in range(1, 5):
+                months = range(3 * quarter - 2, 3 * quarter + 1)
+                self._set(('분기', region, year, quarter, 0), self._merged(self._month_keys([region], year, months)))
+            self._set(('연도', region, year, 0, 0), self._merged(self._month_keys([region], year)))
+        for year, month in national_months:
+            quarter = (month - 1) // 3 + 1
+            self._set(('월', KOREA, year, quarter, month), self._merged(self._month_keys(regions, year, [month])))
+        for year in {y for y, _ in national_months}:
+            for quarter in range(1, 5):
+                months = range(3 * quarter - 2, 3 * quarter + 1)
+                self._set(('분기', KOREA, year, quarter, 0), self._merged(self._month_keys([KOREA], year, months)))
+            self._set(('연도', KOREA, year, 0, 0), self._merged(self._month_keys([KOREA], year)))
+
+    def _prepare(self, data):
+        """지역 열 이름 맞추기 + 연/분기/월 열 (빈 표는 그대로)"""
+        if data.empty or TIME_COL not in data.columns:  # 빈 저장소: 열이 없는 표
+            return data.iloc[0:0], pd.Series(dtype=np.int64)
+        data = add_period_keys(data.rename(columns={'국내 지점번호': REGION_COL}))
+        data = data.dropna(subset=[REGION_COL])
+        return data, pd.to_numeric(data[TIME_COL], errors='coerce').astype(np.int64)
+
+    def _update_last_date(self, data, tm):
+        last = pd.Series(tm.to_numpy(), index=data[REGION_COL].to_numpy()).groupby(level=0).max()
+        for region, date in last.items():
+            self.last_date[region] = max(self.last_date.get(region, 0), int(date))
+
+    def _partials(self, data):
+        """(지역, 연도, 월)별 부분 집계: 키 목록, 변수별 상태 배열 dict 목록"""
+        x = data[[v for v in self.variables if v in data.columns]].reindex(columns=self.variables)
+        x = x.apply(pd.to_numeric, errors='coerce').round(1)
+        x[[REGION_COL, '연도', '월']] = data[[REGION_COL, '연도', '월']]
+        grouped = x.groupby([REGION_COL, '연도', '월'], observed=True)[self.variables]
+
+        stats = {'rows': grouped.size(), 'count': grouped.count(), 'sum': grouped.sum(), 'mean': grouped.mean(),
+                 'm2': grouped.var(ddof=0) * grouped.count(), 'min': grouped.min(), 'max': grouped.max()}
+        stats['rows'] = pd.DataFrame({v: stats['rows'] for v in self.variables})
+        arrays = {k: v.to_numpy(dtype=float) for k, v in stats.items()}
+        arrays['mean'] = np.nan_to_num(arrays['mean'])
+        arrays['m2'] = np.nan_to_num(arrays['m2'])
+        arrays['min'] = np.where(np.isnan(arrays['min']), np.inf, arrays['min'])
+        arrays['max'] = np.where(np.isnan(arrays['max']), -np.inf, arrays['max'])
+
+        keys = [(region, int(year), int(month)) for region, year, month in stats['count'].index]
+        parts = [{k: a[i].copy() for k, a in arrays.items()} for i in range(len(keys))]
+        return keys, parts
+
+    ###########################################################################
+    # 조회 / 저장
+    ###########################################################################
+    def to_frame(self):
+        """상태를 긴 형식 DataFrame으로: 단위, 지역, 연도, 분기, 월, 변수, rows, count, sum, mean, m2, min, max"""
+        if not self.cells:
+            return pd.DataFrame(columns=['단위', REGION_COL, '연도', '분기', '월', '변수'] + STATE_FIELDS)
+        keys = list(self.cells)
+        n_vars = len(self.variables)
+        frame = pd.DataFrame([k for k in keys for _ in range(n_vars)],
+                             columns=['단위', REGION_COL, '연도', '분기', '월'])
+        frame['변수'] = self.variables * len(keys)
+        for field in STATE_FIELDS:
+            frame[field] = np.concatenate([self.cells[k][field] for k in keys])
+        return frame
+
+    def as_cube(self):
+        """weather_cube 형식 (cube_query / cube_table로 조회) + 분산 열 var (표본분산)"""
+        frame = self.to_frame()
+        frame['min'] = frame['min'].replace(np.inf, np.nan)
+        frame['max'] = frame['max'].replace(-np.inf, np.nan)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            frame['var'] = np.where(frame['count'] > 1, frame['m2'] / (frame['count'] - 1), np.nan)
+        frame[['count', 'rows']] = frame[['count', 'rows']].astype(np.int64)
+        return frame
+
+    def save(self, path):
+        """상태를 Parquet으로 저장 (지역별 마지막 관측일은 last_date 열, 반영한 원본 목록은 메타데이터)"""
+        frame = self.to_frame()
+        frame['last_date'] = frame[REGION_COL].map(self.last_date).fillna(0).astype(np.int64)
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        meta = dict(table.schema.metadata or {})
+        meta[SOURCES_KEY] = json.dumps(self.sources, ensure_ascii=False, sort_keys=True).encode('utf-8')
+        pq.write_table(table.replace_schema_metadata(meta), path + '.tmp')
+        os.replace(path + '.tmp', path)
+
+    @classmethod
+    def load(cls, path, variables=WEATHER_VARIABLES):
+        """save()로 저장한 상태 불러오기 (파일이 없으면 빈 상태)"""
+        agg = cls(variables)
+        if not os.path.exists(path):
+            return agg
+        frame = pd.read_parquet(path)
+        agg.sources = json.loads((pq.read_schema(path).metadata or {}).get(SOURCES_KEY, b'{}').decode('utf-8'))
+        n_vars = len(agg.variables)
+        # 칸마다 변수 n_vars행이 연속으로 저장되어 있으므로 필드별로 [칸, 변수] 배열로 한 번에 바꾼다
+        keys = frame[['단위', REGION_COL, '연도', '분기', '월']].iloc[::n_vars]
+        keys = list(zip(*(keys[c].tolist() for c in keys.columns)))
+        fields = {f: frame[f].to_numpy(dtype=float).reshape(len(keys), n_vars) for f in STATE_FIELDS}
+        for i, key in enumerate(keys):
+            agg.cells[key] = {f: a[i].copy() for f, a in fields.items()}
+        last = frame.groupby(REGION_COL)['last_date'].max()
+        agg.last_date = {r: int(d) for r, d in last.items() if r != KOREA and d > 0}
+        return agg
+
+    ###########################################################################
+    # 검증
+    ###########################################################################
+    def reconcile(self, data, rtol=1e-9, atol=1e-9):
+        """
+        Recompute everything from the full daily data and compare with the running state.
+
+        Parameters:
+            data (DataFrame): All daily rows the state is supposed to contain.
+            rtol, atol (float): Tolerances for sum/mean/variance (counts/min/max must match exactly).
+
+        Returns:
+            DataFrame: Mismatching (cell, variable, field) rows with running/full values (empty = consistent).
+        """
+        full = RunningWeatherAggregates(self.variables)
+        full.update_frame(data, only_new=False)
+        keys = ['단위', REGION_COL, '연도', '분기', '월', '변수']
+        a = self.as_cube().set_index(keys)
+        b = full.as_cube().set_index(keys)
+        a, b = a.align(b, join='outer')
+
+        mismatches = []
+        for field in ['rows', 'count', 'min', 'max', 'sum', 'mean', 'var']:
+            x, y = a[field].to_numpy(dtype=float), b[field].to_numpy(dtype=float)
+            exact = field in ('rows', 'count', 'min', 'max')
+            close = np.isclose(x, y, rtol=0 if exact else rtol, atol=0 if exact else atol, equal_nan=True)
+            for idx in np.flatnonzero(~close):
+                mismatches.append((*a.index[idx], field, x[idx], y[idx]))
+        return pd.DataFrame(mismatches, columns=keys + ['항목', 'running', 'full'])
+
+
+###############################################################################
+# 저장소에서 새 관측만 반영
+###############################################################################
+def refresh_from_store(state_path, store_dir):
+    """
+    Bring the running state in line with the year-partitioned weather store.
+
+    New sources in the store manifest are read on their own: their days after each region's last
+    applied date are appended with update_frame (cost proportional to the new days), and only the
+    months holding older days (backfill) are re-read from the store and replaced.
+    Sources whose SHA-256 changed since the last refresh (corrected files) have their years, old and
+    new, re-read and replaced. A store without a manifest falls back to appending the days after
+    each region's last date.
+
+    Returns:
+        tuple: (RunningWeatherAggregates, rows applied)
+    """
+    from weather_store import read_years, read_source, load_manifest
+
+    agg = RunningWeatherAggregates.load(state_path)
+    manifest = load_manifest(store_dir)
+    if manifest:
+        added = [name for name in manifest if name not in agg.sources]
+        changed = [name for name in manifest if name in agg.sources
+                   and agg.sources[name].get('sha256') != manifest[name].get('sha256')]
+        applied = 0
+
+        # 바뀐 원본: 예전/새 연도 전체를 다시 반영 (보정은 드묾)
+        years = sorted({int(y) for name in changed
+                        for y in manifest[name].get('years', []) + agg.sources[name].get('years', [])})
+        for year in years:  # 연도별로 읽어 메모리 사용을 한 해 분량으로 제한
+            applied += agg.replace_months(read_years(store_dir, start=year, end=year), years=[year])
+
+        # 새 원본: 그 원본의 행만 읽는다
+        new = [read_source(store_dir, name) for name in added]
+        new = pd.concat(new, ignore_index=True) if new else pd.DataFrame()
+        new, tm = agg._prepare(new)
+        if not new.empty:
+            last = new[REGION_COL].map(agg.last_date).fillna(0).to_numpy()
+            old = tm.to_numpy() <= last  # 이미 반영한 날짜 이하 = 과거 자료 추가
+            months = set(zip(new.loc[old, REGION_COL], new.loc[old, '연도'].astype(int), new.loc[old, '월'].astype(int)))
+            in_months = np.array([k in months for k in zip(new[REGION_COL], new['연도'].astype(int),
+                                                           new['월'].astype(int))], dtype=bool)
+            for year in sorted({y for _, y, _ in months}):
+                data, _ = agg._prepare(read_years(store_dir, start=year, end=year))
+                mask = [k in months for k in zip(data[REGION_COL], data['연도'].astype(int), data['월'].astype(int))]
+                applied += agg.replace_months(data[np.array(mask, dtype=bool)])
+            applied += agg.update_frame(new[~in_months], only_new=False)
+
+        agg.sources = {name: {'sha256': entry.get('sha256'), 'years': entry.get('years', [])}
+                       for name, entry in manifest.items()}
+    else:
+        start = min(agg.last_date.values()) // 10000 if agg.last_date else None
+        applied = agg.update_frame(read_years(store_dir, start=start))
+    agg.save(state_path)
+    return agg, applied
+
+
+if __name__ == "__main__":
+    from weather_cube import cube_table
+
+    # 매일 실행: 새로 들어오거나 바뀐 원본만 반영하고 지역별 연/분기 요약 갱신
+    agg, applied = refresh_from_store('./weather_running.parquet', './weather_store')
+    print(f"새/보정 관측 {applied}행 반영")
+    cube = agg.as_cube()
+    cube_table(cube, '연도', by_region=True).round(1).to_csv('./yearly_averages_by_region.csv', encoding='cp949')
+    cube_table(cube, '분기', by_region=True).round(1).to_csv('./quarterly_averages_by_region.csv', encoding='cp949')
+    print("지역별 연간/분기별 평균이 갱신되었습니다.")
@@ -0,0 +1,225 @@
+###############################################################################
+# 연도별 파티션 기상 저장소 (추가 전용) + 수집 파일 목록(manifest)
+###############################################################################
+# merge.py는 ./1224weather의 CSV를 모두 읽어 이어 붙인 뒤 병합 CSV 전체를 다시 썼다.
+# (새 연도 하나를 추가해도 전체를 다시 쓰고, 파일끼리 열 구성이 같은지 확인하지 않음)
+# 여기서는 kma_parse의 저장소(store_dir/year=YYYY/*.parquet)에
+#   - 원본 파일마다 SHA-256을 manifest.json에 기록해 새 파일/바뀐 파일만 수집하고
+#     (manifest 키는 '<원본 폴더 이름>/<파일 이름>'이라 다른 폴더의 같은 이름 파일끼리 덮어쓰지 않음)
+#   - 수집할 때 열 구성/형식을 검사하며 (틀리면 ValueError, 저장소는 그대로)
+#   - 읽을 때는 요청한 연도 파티션만 연다. (2024년만 읽으면 2012~2023 파일은 열지 않음)
+# 같은 기간을 CSV와 API 원본 응답으로 각각 수집하면 행이 중복되므로 한 가지 원본만 사용한다.
+import os
+import glob
+import json
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from kma_parse import WEATHER_COLUMNS, UNKNOWN_STATION, iter_weather_frames, append_to_store, read_store, store_years
+from station_catalog import load_catalog
+import _paths  # noqa: F401  (csv_cache, figure_batch, weather_index 경로)
+from csv_cache import load_csv
+
+
+MANIFEST = 'manifest.json'
+TIME_COL = WEATHER_COLUMNS['TM']
+STATION_COL = WEATHER_COLUMNS['STN']
+# 저장소 스키마: 관측시각(YYYYMMDD), 지점명, 값 열 (기존 {연도}weather.csv와 같은 순서)
+VALUE_COLUMNS = [c for k, c in WEATHER_COLUMNS.items() if k not in ('TM', 'STN')] + ['일교차 (C)']
+SCHEMA_COLUMNS = [TIME_COL, STATION_COL] + VALUE_COLUMNS
+
+
+def file_hash(path, block_bytes=1 << 20):
+    """파일 내용의 SHA-256"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_bytes), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def source_key(path):
+    """manifest 키: '<원본 폴더 이름>/<파일 이름>'"""
+    path = os.path.abspath(path)
+    return f'{os.path.basename(os.path.dirname(path))}/{os.path.basename(path)}'
+
+
+def part_name(key):
+    """manifest 키 -> 저장소 조각 파일 이름 앞부분 ('1224weather/2020weather.csv' -> '1224weather__2020weather')"""
+    return os.path.splitext(key)[0].replace('/', '__')
+
+
+def load_manifest(store_dir):
+    """수집한 파일 목록 {원본 키 (source_key): {sha256, rows, years}}"""
+    path = os.path.join(store_dir, MANIFEST)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _save_manifest(store_dir, manifest):
+    os.makedirs(store_dir, exist_ok=True)
+    path = os.path.join(store_dir, MANIFEST)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(path + '.tmp', path)
+
+
+def validate_weather_frame(df, source, categories):
+    """
+    Check a daily weather table against the store schema and convert it to the store types.
+
+    Parameters:
+        df (DataFrame): Table read from a daily weather CSV.
+        source (str): File name used in error messages.
+        categories (list): Allowed station names.
+
+    Returns:
+        DataFrame: SCHEMA_COLUMNS with 관측시각 as int32, 지점명 as Categorical and values as float64.
+
+    Raises:
+        ValueError: Missing columns, non-numeric values, invalid dates or unknown stations.
+    """
+    missing = [c for c in SCHEMA_COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError(f"{source}: 필요한 열이 없습니다 {missing}")
+
+    df = df[SCHEMA_COLUMNS].dropna(how='all')  # 완전히 빈 행은 제외
+    errors = []
+
+    tm = pd.to_numeric(df[TIME_COL], errors='coerce')
+    dates = pd.to_datetime(tm.where(tm % 1 == 0).astype('Int64').astype(str), format='%Y%m%d', errors='coerce')
+    if dates.isna().any():
+        errors.append(f"관측시각이 YYYYMMDD가 아닌 행 {int(dates.isna().sum())}개")
+
+    values = df[VALUE_COLUMNS].apply(pd.to_numeric, errors='coerce')
+    bad = (values.isna() & df[VALUE_COLUMNS].notna()).sum()
+    errors += [f"'{c}' 열에 숫자가 아닌 값 {int(n)}개" for c, n in bad.items() if n]
+
+    unknown = sorted(set(df[STATION_COL].dropna()) - set(categories))
+    if unknown:
+        errors.append(f"지점 목록에 없는 지점명 {unknown}")
+
+    if errors:
+        raise ValueError(f"{source}: 스키마 검사 실패 - " + ', '.join(errors))
+
+    out = values.astype('float64')
+    out.insert(0, STATION_COL, pd.Categorical(df[STATION_COL].fillna(UNKNOWN_STATION), categories=categories))
+    out.insert(0, TIME_COL, tm.astype(np.int32))
+    return out.reset_index(drop=True)
+
+
+def _ingest(store_dir, path, frames_fn, manifest, force):
+    """파일 하나 수집: 해시가 manifest와 같으면 건너뛰고, 아니면 해당 원본의 파티션 조각을 교체"""
+    name = source_key(path)
+    digest = file_hash(path)
+    if not force and manifest.get(name, {}).get('sha256') == digest:
+        return False
+
+    frames = list(frames_fn(path))  # 검사를 먼저 끝낸 뒤에 저장소를 건드린다
+    legacy = os.path.basename(path)  # 예전 manifest는 파일 이름만 키로 썼다 -> 그 조각을 지우고 새 키로 옮김
+    if legacy in manifest:
+        for old in glob.glob(os.path.join(store_dir, 'year=*', f'{os.path.splitext(legacy)[0]}-*.parquet')):
+            os.remove(old)
+        del manifest[legacy]
+    rows = append_to_store(frames, store_dir, part_name(name))
+    years = sorted({int(y) for f in frames for y in np.unique(f[TIME_COL].to_numpy() // 10000)})
+    manifest[name] = {'sha256': digest, 'rows': rows, 'years': years}
+    _save_manifest(store_dir, manifest)
+    print(f"[store] {name}: {rows}행 수집 (연도 {years})")
+    return True
+
+
+def ingest_csv_files(input_folder, store_dir, force=False):
+    """
+    Ingest new or changed daily weather CSVs ({year}weather.csv) into the store.
+
+    Parameters:
+        input_folder (str): Folder containing the CSV files.
+        store_dir (str): Store root folder.
+        force (bool): Re-ingest even when the file hash is unchanged.
+
+    Returns:
+        list of str: Names of the files ingested in this call.
+    """
+    categories = list(dict.fromkeys(load_catalog().mapping.values())) + [UNKNOWN_STATION]
+    manifest = load_manifest(store_dir)
+
+    def frames(path):
+        yield validate_weather_frame(load_csv(path, use_cache=False), os.path.basename(path), categories)
+
+    ingested = []
+    for path in sorted(glob.glob(os.path.join(input_folder, '*.csv'))):
+        if _ingest(store_dir, path, frames, manifest, force):
+            ingested.append(os.path.basename(path))
+    return ingested
+
+
+def ingest_kma_chunk(path, store_dir, station_mapping, force=False):
+    """
+    Ingest one raw kma_sfcdd3 response (see kma_fetch) into the store, unless already ingested.
+
+    Returns:
+        bool: True if the file was (re)ingested.
+    """
+    return _ingest(store_dir, path, lambda p: iter_weather_frames(p, station_mapping),
+                   load_manifest(store_dir), force)
+
+
+def read_years(store_dir, start=None, end=None, columns=None):
+    """
+    Read only the partitions between start and end years (inclusive).
+
+    Parameters:
+        store_dir (str): Store root folder.
+        start, end (int | None): Year range (None = open).
+        columns (list | None): Columns to read.
+
+    Returns:
+        DataFrame: Rows of the selected years.
+    """
+    years = [y for y in store_years(store_dir)
+             if (start is None or y >= start) and (end is None or y <= end)]
+    return read_store(store_dir, years=years, columns=columns)
+
+
+def read_source(store_dir, key, years=None):
+    """
+    Read only the rows one ingested source (manifest key) wrote to the store.
+
+    Parameters:
+        store_dir (str): Store root folder.
+        key (str): Manifest key (see source_key).
+        years (iterable of int | None): Years to look in (None = the years recorded in the manifest).
+
+    Returns:
+        DataFrame: Rows of that source (empty when it wrote none).
+    """
+    years = load_manifest(store_dir).get(key, {}).get('years', []) if years is None else years
+    paths = sorted(p for y in years
+                   for p in glob.glob(os.path.join(store_dir, f'year={int(y)}', f'{part_name(key)}-*.parquet')))
+    if not paths:
+        return pd.DataFrame(columns=SCHEMA_COLUMNS)
+    return pd.concat([pd.read_parquet(p) for p in paths], ignore_index=True)
+
+
+def export_csv(store_dir, output_file, years=None):
+    """
+    Write the store (or some years) to one CSV, one partition at a time.
+
+    Parameters:
+        store_dir (str): Store root folder.
+        output_file (str): Merged CSV path.
+        years (iterable of int | None): Years to export (None = all).
+    """
+    years = store_years(store_dir) if years is None else sorted(years)
+    tmp = output_file + '.tmp'
+    if not years:  # 빈 저장소: 머리글만 있는 CSV
+        pd.DataFrame(columns=SCHEMA_COLUMNS).to_csv(tmp, index=False, encoding='utf-8-sig')
+    for i, year in enumerate(years):
+        read_store(store_dir, years=[year]).to_csv(tmp, mode='w' if i == 0 else 'a', header=i == 0,
+                                                   index=False, encoding='utf-8-sig' if i == 0 else 'utf-8')
+    os.replace(tmp, output_file)
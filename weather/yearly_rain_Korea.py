@@ -1,24 +1,22 @@
-import pandas as pd
+from weather_cube import load_cube, cube_query
 
-# Load the weather data
+# Load the pre-aggregated weather cube (built once from the daily data, rebuilt when the file changes)
 file_path_weather = './12-24weather.csv'
-weather_data = pd.read_csv(file_path_weather, encoding='EUC-KR')
+cube = load_cube(file_path_weather)
 
-# Convert '관측시각 (KST)' to datetime for easier processing
-weather_data['관측시각 (KST)'] = pd.to_datetime(weather_data['관측시각 (KST)'], format='%Y%m%d', errors='coerce')
 
-# Add columns for year and quarter
-weather_data['Year'] = weather_data['관측시각 (KST)'].dt.year
-weather_data['Quarter'] = weather_data['관측시각 (KST)'].dt.quarter
+def rainfall(level, by_region, name):
+    """Mean daily rainfall per period with missing values counted as 0 (stat='mean0')."""
+    result = cube_query(cube, level, ['일강수량 (mm)'], by_region=by_region, stat='mean0')
+    result = result.rename(columns={'연도': 'Year', '분기': 'Quarter', '일강수량 (mm)': name})
+    return result[[c for c in ['Year', 'Quarter', '지역'] if c in result.columns] + [name]]
 
-# Handle missing or problematic data in '일강수량 (mm)'
-weather_data['일강수량 (mm)'] = pd.to_numeric(weather_data['일강수량 (mm)'], errors='coerce').fillna(0)
 
 # Calculate the required metrics
-annual_rainfall = weather_data.groupby('Year')['일강수량 (mm)'].mean().reset_index(name='연간 평균 강수량 (mm)')
-quarterly_rainfall = weather_data.groupby(['Year', 'Quarter'])['일강수량 (mm)'].mean().reset_index(name='분기별 평균 강수량 (mm)')
-region_annual_rainfall = weather_data.groupby(['Year', '지역'])['일강수량 (mm)'].mean().reset_index(name='지역별 연간 평균 강수량 (mm)')
-region_quarterly_rainfall = weather_data.groupby(['Year', 'Quarter', '지역'])['일강수량 (mm)'].mean().reset_index(name='지역별 분기별 평균 강수량 (mm)')
+annual_rainfall = rainfall('연도', False, '연간 평균 강수량 (mm)')
+quarterly_rainfall = rainfall('분기', False, '분기별 평균 강수량 (mm)')
+region_annual_rainfall = rainfall('연도', True, '지역별 연간 평균 강수량 (mm)')
+region_quarterly_rainfall = rainfall('분기', True, '지역별 분기별 평균 강수량 (mm)')
 
 # Round values to 2 decimal places
 annual_rainfall['연간 평균 강수량 (mm)'] = annual_rainfall['연간 평균 강수량 (mm)'].round(2)
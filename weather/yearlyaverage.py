@@ -1,4 +1,4 @@
-import pandas as pd
+from weather_cube import load_cube, cube_table
 
 def process_weather_data(input_file):
     """
@@ -11,25 +11,14 @@ def process_weather_data(input_file):
         yearly_averages (DataFrame): Yearly averages for Korea-wide.
         region_averages (DataFrame): Yearly averages by region.
     """
-    # Load the weather data
-    weather_data = pd.read_csv(input_file, encoding='euc-kr')
-
-    # Extract year from 관측시각 (KST)
-    weather_data['연도'] = weather_data['관측시각 (KST)'].astype(str).str[:4]
-
-    # Rename column '국내 지점번호' to '지역'
-    weather_data.rename(columns={'국내 지점번호': '지역'}, inplace=True)
-
-    # Round numeric columns to one decimal place
-    numeric_cols = weather_data.select_dtypes(include='number').columns
-    numeric_cols = numeric_cols.drop('관측시각 (KST)', errors='ignore')  # Exclude 관측시각 (KST)
-    weather_data[numeric_cols] = weather_data[numeric_cols].round(1)
+    # Load the pre-aggregated cube (built once from the daily data, rebuilt when the file changes)
+    cube = load_cube(input_file)
 
     # Calculate yearly averages for Korea-wide
-    yearly_averages = weather_data.groupby('연도')[numeric_cols].mean().round(1)
+    yearly_averages = cube_table(cube, '연도').round(1)
 
     # Calculate yearly averages by region
-    region_averages = weather_data.groupby(['연도', '지역'])[numeric_cols].mean().round(1)
+    region_averages = cube_table(cube, '연도', by_region=True).round(1)
 
     return yearly_averages, region_averages
 